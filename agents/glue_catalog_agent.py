@@ -7,25 +7,19 @@ This module defines an agent for interacting with the AWS Glue catalog.
 """
 
 from strands import Agent
+from agents.intent_router import CatalogRoutes, FastPathAgent
 from tools.glue_tools import (
     list_glue_databases,
     list_glue_tables,
     get_table_details,
     search_tables_by_name,
-    search_tables_by_column
+    search_tables_by_column,
+    semantic_search_glue_tables,
+    ranked_search_glue_tables
 )
 
-# Create the AWS Glue catalog agent
-glue_agent = Agent(
-    model="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
-    tools=[
-        list_glue_databases,
-        list_glue_tables,
-        get_table_details,
-        search_tables_by_name,
-        search_tables_by_column
-    ],
-    system_prompt="""You are an AWS Glue catalog assistant. 
+# System prompt of the AWS Glue catalog agent
+SYSTEM_PROMPT = """You are an AWS Glue catalog assistant. 
     Your job is to help users find data products in the AWS Glue catalog.
     You can search by database name, table name, or column names.
     
@@ -53,6 +47,7 @@ glue_agent = Agent(
     For table searches:
     - Use list_glue_tables to get tables in a specific database
     - Use search_tables_by_name to find tables by name pattern
+    - Use ranked_search_glue_tables to find the best matches for keywords when a name search would return a long list
     - Set result_type to "tables"
     
     For table details:
@@ -63,6 +58,50 @@ glue_agent = Agent(
     - Use search_tables_by_column to find tables with specific columns
     - Set result_type to "search_results"
     
+    For questions that describe the data rather than name it (e.g. "where is customer churn data"):
+    - Use semantic_search_glue_tables to rank tables by how well their names, descriptions and columns match
+    - Set result_type to "search_results"
+    
     Always ensure your JSON response is properly formatted and valid.
     """
-)
+
+def create_glue_agent():
+    """
+    Create an AWS Glue catalog agent with its own, empty conversation history
+    
+    A strands agent rejects a call while another is running and keeps every
+    exchange in its history, so code serving concurrent or unrelated requests
+    creates one agent per request.
+    
+    Returns:
+        FastPathAgent: The agent, answering structured lookups without the model
+    """
+    agent = Agent(
+        model="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
+        tools=[
+            list_glue_databases,
+            list_glue_tables,
+            get_table_details,
+            search_tables_by_name,
+            search_tables_by_column,
+            semantic_search_glue_tables,
+            ranked_search_glue_tables
+        ],
+        system_prompt=SYSTEM_PROMPT
+    )
+    
+    # Answer structured lookups directly and send everything else to the model
+    return FastPathAgent(
+        agent,
+        glue=CatalogRoutes(
+            "AWS Glue",
+            list_glue_databases,
+            list_glue_tables,
+            get_table_details,
+            search_tables_by_name,
+            search_tables_by_column
+        )
+    )
+
+# Shared agent for interactive use, one query at a time
+glue_agent = create_glue_agent()
@@ -0,0 +1,392 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Intent Router
+
+This module provides a deterministic fast path in front of the catalog agents.
+Structured requests such as "list all databases", "show me all tables in sales"
+or "get details for orders in unity.retail" are recognised with regular
+expressions and answered by calling the catalog tools directly, in the same
+JSON envelope the agents' system prompts define. Anything the router does not
+recognise is passed through to the LLM agent unchanged.
+
+Set CATALOG_FAST_PATH=false to send every query to the LLM.
+"""
+
+import inspect
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Callable
+
+from strands.agent.agent_result import AgentResult
+from strands.telemetry.metrics import EventLoopMetrics
+from tools.result_cache import split_stale
+
+FAST_PATH_ENABLED = os.environ.get("CATALOG_FAST_PATH", "true").lower() not in ("0", "false", "no")
+
+_CATALOG = r"(?:unity|databricks|aws\s+glue|glue|aws)"
+# Trailing "in the Unity catalog", "across both catalogs", "from unity and glue catalogs", ...
+_CATALOG_SUFFIX = re.compile(
+    rf"\s+(?:in|from|across|on|for)\s+(?:the\s+)?(?:both\s+)?(?:all\s+)?"
+    rf"(?P<catalogs>{_CATALOG}(?:\s*(?:and|&|,)\s*(?:the\s+)?{_CATALOG})*\s+)?catalogs?$",
+    re.IGNORECASE
+)
+# Leading qualifier such as "unity tables" or "glue databases"
+_CATALOG_PREFIX = re.compile(rf"\b(?P<catalog>{_CATALOG})\s+(?=(?:databases|schemas|tables)\b)", re.IGNORECASE)
+
+_IDENT = r"[\w\-]+(?:\.[\w\-]+)*"
+_PATTERN = r"(?:'(?P<quoted>[^']+)'|\"(?P<double_quoted>[^\"]+)\"|(?P<bare>[\w.\-*?]+))"
+_VERB = r"(?:please\s+)?(?:list|show|get|display|find|search(?:\s+for)?|what\s+are|which)(?:\s+me)?(?:\s+all)?(?:\s+of)?(?:\s+the)?"
+_DETAILS = (
+    r"(?:please\s+)?(?:(?:get|show|display|give)(?:\s+me)?(?:\s+the)?\s+"
+    r"(?:details|schema|description|info|information|metadata)\s+(?:for|of|about|on)|describe)"
+    r"\s+(?:the\s+)?(?:table\s+)?"
+)
+_NAME_SUFFIX = r"\s+in\s+(?:the|their)\s+names?"
+# Queries phrased as questions, whose trailing "?" is punctuation rather than part of a glob
+_QUESTION = re.compile(r"(?:what|which|where|who|how|are|is|do|does|can|could|would|will)\b", re.IGNORECASE)
+
+# Checked in order; the first full match wins
+_INTENTS = [
+    ("list_databases", re.compile(rf"{_VERB}(?:\s+available)?\s+(?:databases|schemas)", re.IGNORECASE)),
+    ("list_tables", re.compile(
+        rf"{_VERB}\s+tables\s+(?:in|from|of)\s+(?:the\s+)?(?:(?:database|schema)\s+)?"
+        rf"(?P<database>{_IDENT})(?:\s+(?:database|schema))?",
+        re.IGNORECASE
+    )),
+    ("get_table_details", re.compile(
+        rf"{_DETAILS}(?P<table>[\w\-]+)(?:\s+table)?\s+(?:in|from)\s+(?:the\s+)?(?:(?:database|schema)\s+)?"
+        rf"(?P<database>{_IDENT})(?:\s+(?:database|schema))?",
+        re.IGNORECASE
+    )),
+    ("get_table_details", re.compile(rf"{_DETAILS}(?P<qualified>[\w\-]+(?:\.[\w\-]+)+)(?:\s+table)?", re.IGNORECASE)),
+    ("search_tables_by_column", re.compile(
+        rf"{_VERB}\s+tables\s+(?:with|having|that\s+have|have|containing|contain)\s+(?:an?\s+|any\s+)?"
+        rf"columns?\s+(?:(?:containing|matching|like|named|called)\s+)?{_PATTERN}",
+        re.IGNORECASE
+    )),
+    ("search_tables_by_name", re.compile(
+        rf"{_VERB}\s+tables\s+(?:(?P<with>with)|whose\s+names?\s+(?:contains?|match(?:es)?|includes?)|"
+        rf"named(?:\s+like)?|matching|called|like)\s+{_PATTERN}(?(with){_NAME_SUFFIX}|(?:{_NAME_SUFFIX})?)",
+        re.IGNORECASE
+    )),
+]
+
+
+class Intent:
+    """A structured catalog request recognised by the router"""
+
+    def __init__(self, name: str, params: dict, catalogs: set):
+        """
+        Create an intent
+
+        Args:
+            name: One of list_databases, list_tables, get_table_details, search_tables_by_name, search_tables_by_column
+            params: Keyword arguments for the matching catalog tool
+            catalogs: Catalogs the user named ('unity', 'glue'); empty if none was named
+        """
+        self.name = name
+        self.params = params
+        self.catalogs = catalogs
+
+
+def _catalogs_in(text: str) -> set:
+    """Catalogs named in a fragment of the query"""
+    catalogs = set()
+    if re.search(r"unity|databricks", text, re.IGNORECASE):
+        catalogs.add("unity")
+    if re.search(r"glue|aws", text, re.IGNORECASE):
+        catalogs.add("glue")
+    return catalogs
+
+
+def parse_intent(query: str) -> Intent | None:
+    """
+    Recognise a structured catalog request
+
+    Args:
+        query: Natural language query
+
+    Returns:
+        Intent | None: The recognised intent, or None if the query should go to the LLM
+    """
+    text = " ".join(query.split()).rstrip(".! ")
+    if _QUESTION.match(text):
+        text = text.rstrip("?.! ")
+    intent = _parse(text)
+    if intent is None and text.endswith("?"):
+        # A trailing "?" that does not complete a glob pattern ends the sentence
+        intent = _parse(text.rstrip("?.! "))
+    return intent
+
+
+def _parse(text: str) -> Intent | None:
+    """Match normalized query text against the intents"""
+    catalogs = set()
+
+    suffix = _CATALOG_SUFFIX.search(text)
+    if suffix:
+        catalogs |= _catalogs_in(suffix.group("catalogs") or "")
+        text = text[:suffix.start()]
+    prefix = _CATALOG_PREFIX.search(text)
+    if prefix:
+        catalogs |= _catalogs_in(prefix.group("catalog"))
+        text = text[:prefix.start()] + text[prefix.end():]
+
+    for name, regex in _INTENTS:
+        match = regex.fullmatch(text)
+        if not match:
+            continue
+        groups = match.groupdict()
+        params = {}
+        if groups.get("qualified"):
+            params["database_name"], params["table_name"] = groups["qualified"].rsplit(".", 1)
+        elif groups.get("table"):
+            params["database_name"], params["table_name"] = groups["database"], groups["table"]
+        elif groups.get("database"):
+            params["database_name"] = groups["database"]
+        pattern = groups.get("quoted") or groups.get("double_quoted") or groups.get("bare")
+        if pattern:
+            key = "column_pattern" if name == "search_tables_by_column" else "name_pattern"
+            params[key] = pattern
+            if "*" in pattern or "?" in pattern:
+                params["match"] = "glob"
+        return Intent(name, params, catalogs)
+    return None
+
+
+class CatalogToolError(Exception):
+    """Raised when a catalog tool reports an error instead of a result"""
+
+
+def _parameter_names(tool: Callable) -> set:
+    """Named parameters a tool accepts; tools taking only **kwargs (e.g. remote MCP tools) report none"""
+    try:
+        parameters = inspect.signature(tool).parameters.values()
+    except (TypeError, ValueError):
+        return set()
+    return {
+        parameter.name for parameter in parameters
+        if parameter.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    }
+
+
+class CatalogRoutes:
+    """The tool functions that answer each intent for one catalog"""
+
+    def __init__(
+        self,
+        label: str,
+        list_databases: Callable,
+        list_tables: Callable,
+        get_table_details: Callable,
+        search_tables_by_name: Callable,
+        search_tables_by_column: Callable
+    ):
+        """
+        Create the routes for a catalog
+
+        Args:
+            label: Catalog name used in summaries (e.g. 'Unity')
+            list_databases: Tool listing databases
+            list_tables: Tool listing the tables of a database (database_name)
+            get_table_details: Tool describing a table (database_name, table_name)
+            search_tables_by_name: Tool searching table names (name_pattern)
+            search_tables_by_column: Tool searching column names (column_pattern)
+        """
+        self.label = label
+        self.tools = {
+            "list_databases": list_databases,
+            "list_tables": list_tables,
+            "get_table_details": get_table_details,
+            "search_tables_by_name": search_tables_by_name,
+            "search_tables_by_column": search_tables_by_column
+        }
+        self.parameters = {name: _parameter_names(tool) for name, tool in self.tools.items()}
+
+    def supports(self, intent: Intent) -> bool:
+        """
+        Whether the tool for an intent takes its optional arguments
+
+        Patterns are only sent with match='glob' to tools that accept 'match';
+        other tools would treat the glob as literal text.
+        """
+        return "match" not in intent.params or "match" in self.parameters[intent.name]
+
+    def answer(self, intent: Intent) -> tuple:
+        """
+        Call the tool for an intent
+
+        Args:
+            intent: Recognised intent
+
+        Returns:
+            tuple: (result, stale) where stale is the staleness marker of a cached result served
+            because the catalog could not answer, or None for a fresh result
+
+        Raises:
+            CatalogToolError: If the tool returns an error instead of a result
+        """
+        result = self.tools[intent.name](**intent.params)
+        if isinstance(result, str):
+            # Remote tools return their result as JSON text
+            try:
+                result = json.loads(result)
+            except json.JSONDecodeError:
+                raise CatalogToolError(result)
+        if isinstance(result, dict) and "error" in result:
+            raise CatalogToolError(result.get("error_message") or result["error"])
+        return split_stale(result)
+
+
+_RESULT_TYPES = {
+    "list_databases": "databases",
+    "list_tables": "tables",
+    "get_table_details": "table_details",
+    "search_tables_by_name": "tables",
+    "search_tables_by_column": "search_results"
+}
+
+
+def _summarize(intent: Intent, result: Any, label: str) -> str:
+    """One-sentence summary of a tool result"""
+    params = intent.params
+    if intent.name == "list_databases":
+        return f"Found {len(result)} databases in the {label} catalog"
+    if intent.name == "list_tables":
+        return f"Found {len(result)} tables in {params['database_name']} in the {label} catalog"
+    if intent.name == "get_table_details":
+        return (
+            f"Retrieved details for table {params['table_name']} in {params['database_name']} "
+            f"({len(result.get('columns', []))} columns) from the {label} catalog"
+        )
+    if intent.name == "search_tables_by_name":
+        return f"Found {len(result)} tables matching '{params['name_pattern']}' in the {label} catalog"
+    return f"Found {len(result)} tables with columns matching '{params['column_pattern']}' in the {label} catalog"
+
+
+class FastPathAgent:
+    """
+    Agent wrapper that answers recognised catalog lookups without calling the model
+
+    Calls with a recognised query return a strands AgentResult whose message
+    text is the JSON envelope; every other call, and every attribute access,
+    is delegated to the wrapped agent.
+    """
+
+    def __init__(self, agent, unity: CatalogRoutes | None = None, glue: CatalogRoutes | None = None,
+                 enabled: bool | None = None):
+        """
+        Wrap an agent
+
+        Args:
+            agent: The LLM agent to delegate to
+            unity: Routes for the Unity catalog, if the agent covers it
+            glue: Routes for the AWS Glue catalog, if the agent covers it
+            enabled: Answer recognised queries directly (defaults to CATALOG_FAST_PATH)
+        """
+        self.agent = agent
+        self.unity = unity
+        self.glue = glue
+        self.enabled = FAST_PATH_ENABLED if enabled is None else enabled
+
+    def __getattr__(self, name):
+        return getattr(self.agent, name)
+
+    def __call__(self, prompt=None, **kwargs):
+        if self.enabled and isinstance(prompt, str) and not kwargs:
+            result = self.route(prompt)
+            if result is not None:
+                return result
+        return self.agent(prompt, **kwargs)
+
+    def route(self, query: str) -> AgentResult | None:
+        """
+        Answer a query on the fast path if possible
+
+        Args:
+            query: Natural language query
+
+        Returns:
+            AgentResult | None: The answer, or None if the query should go to the LLM
+        """
+        intent = parse_intent(query)
+        if intent is None:
+            return None
+        started = time.perf_counter()
+        if self.unity is not None and self.glue is not None:
+            envelope = self._unified_envelope(query, intent)
+        else:
+            envelope = self._catalog_envelope(query, intent, self.unity or self.glue)
+        if envelope is None:
+            return None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logging.info(f"Fast path answered {intent.name} in {elapsed_ms:.1f}ms")
+        return AgentResult(
+            stop_reason="end_turn",
+            message={"role": "assistant", "content": [{"text": json.dumps(envelope, default=str)}]},
+            metrics=EventLoopMetrics(),
+            state={"fast_path": {"intent": intent.name, "elapsed_ms": elapsed_ms}}
+        )
+
+    def _catalog_envelope(self, query: str, intent: Intent, routes: CatalogRoutes) -> dict | None:
+        """Envelope of the single-catalog agents; tool errors are left to the LLM"""
+        if not routes.supports(intent):
+            logging.info(f"The {routes.label} {intent.name} tool does not take {intent.params}, passing query to the model")
+            return None
+        try:
+            result, stale = routes.answer(intent)
+        except Exception as e:
+            logging.info(f"Fast path {intent.name} failed, passing query to the model: {e}")
+            return None
+        envelope = {
+            "query": query,
+            "result_type": _RESULT_TYPES[intent.name],
+            "results": result,
+            "summary": _summarize(intent, result, routes.label)
+        }
+        if stale:
+            envelope["stale"] = stale
+            envelope["summary"] += f" (cached result from {stale['stale_age_seconds']:g} seconds ago)"
+        return envelope
+
+    def _unified_envelope(self, query: str, intent: Intent) -> dict | None:
+        """Envelope of the unified agent, with an error marker for a catalog that failed"""
+        catalogs = intent.catalogs
+        if not catalogs:
+            if "database_name" in intent.params:
+                # Only Unity database names are qualified as 'catalog_name.schema_name'
+                catalogs = {"unity"} if "." in intent.params["database_name"] else {"glue"}
+            else:
+                catalogs = {"unity", "glue"}
+        routes_by_key = {"unity": self.unity, "glue": self.glue}
+        if not all(routes_by_key[key].supports(intent) for key in catalogs):
+            logging.info(f"A {intent.name} tool does not take {intent.params}, passing query to the model")
+            return None
+
+        envelope = {"query": query, "unity_results": None, "glue_results": None, "summary": ""}
+        summaries = []
+        failures = 0
+        for key, routes in (("unity", self.unity), ("glue", self.glue)):
+            if key not in catalogs:
+                continue
+            try:
+                result, stale = routes.answer(intent)
+            except Exception as e:
+                failures += 1
+                envelope[f"{key}_results"] = {"error": str(e)}
+                summaries.append(f"The {routes.label} catalog returned an error")
+                continue
+            envelope[f"{key}_results"] = result
+            summary = _summarize(intent, result, routes.label)
+            if stale:
+                envelope[f"{key}_stale"] = stale
+                summary += f" (cached result from {stale['stale_age_seconds']:g} seconds ago)"
+            summaries.append(summary)
+        if failures == len(catalogs):
+            return None
+        envelope["summary"] = "; ".join(summaries)
+        return envelope
@@ -7,12 +7,14 @@ This module defines an agent for interacting with both the Unity catalog and AWS
 using MCP servers hosted on AgentCore Runtime.
 """
 
-import boto3
 from strands import Agent
+from agents.intent_router import CatalogRoutes, FastPathAgent
 import json
 import logging
 import os
 from dotenv import load_dotenv
+from tools.agentcore_client import get_agentcore_runtime
+from tools.unified_tools import search_catalogs_concurrently
 
 # Load environment variables
 load_dotenv()
@@ -26,67 +28,80 @@ logging.basicConfig(
 class AgentCoreMCPTool:
     """Tool wrapper for AgentCore MCP servers"""
     
-    def __init__(self, name: str, description: str, runtime_id: str, tool_name: str):
+    def __init__(self, name: str, description: str, runtime_arn: str, tool_name: str, returns_object: bool = False):
         self.name = name
         self.description = description
-        self.runtime_id = runtime_id
+        self.runtime_arn = runtime_arn
         self.tool_name = tool_name
-        self.client = boto3.client('bedrock-agentcore-control')
+        # Without structured output a single object arrives as a one-element list; see tool_result_value
+        self.returns_object = returns_object
+        # Every wrapper for a runtime shares one pooled client and batching queue
+        self.runtime = get_agentcore_runtime(runtime_arn)
     
     def __call__(self, **kwargs):
         """Call the MCP tool via AgentCore Runtime"""
         try:
-            # Use AgentCore control plane to invoke the runtime
-            response = self.client.invoke_agent_runtime(
-                agentRuntimeId=self.runtime_id,
-                inputText=json.dumps({
-                    "tool": self.tool_name,
-                    "parameters": kwargs
-                })
-            )
-            
-            # Parse the response
-            result = response.get('output', '')
-            return result if result else "No result"
-                    
+            result = self.runtime.invoke(self.tool_name, kwargs)
+            if self.returns_object and isinstance(result, list) and len(result) == 1:
+                result = result[0]
+            return result if isinstance(result, str) else json.dumps(result)
+        
         except Exception as e:
             logging.error(f"Error calling AgentCore MCP tool {self.tool_name}: {e}")
             return f"Error: {str(e)}"
 
-# AgentCore Runtime IDs from environment
-UNITY_RUNTIME_ID = os.getenv("UNITY_MCP_RUNTIME_ID")
-GLUE_RUNTIME_ID = os.getenv("GLUE_MCP_RUNTIME_ID")
+class CrossCatalogMCPTool:
+    """Tool wrapper that calls a Unity and a Glue MCP tool concurrently"""
+    
+    def __init__(self, name: str, description: str, unity_tool: AgentCoreMCPTool, glue_tool: AgentCoreMCPTool):
+        self.name = name
+        self.description = description
+        self.unity_tool = unity_tool
+        self.glue_tool = glue_tool
+    
+    def __call__(self, **kwargs):
+        """Call both MCP tools and combine their results into unity_results/glue_results"""
+        results = search_catalogs_concurrently(
+            lambda: self.unity_tool(**kwargs),
+            lambda: self.glue_tool(**kwargs)
+        )
+        return json.dumps(results)
+
+# AgentCore Runtime ARNs from environment (written by setup/deploy_aws_agentcore.py)
+UNITY_RUNTIME_ARN = os.getenv("UNITY_MCP_ARN") or os.getenv("UNITY_MCP_RUNTIME_ID")
+GLUE_RUNTIME_ARN = os.getenv("GLUE_MCP_ARN") or os.getenv("GLUE_MCP_RUNTIME_ID")
 
 # Create MCP tools for Unity Catalog
 unity_tools = [
     AgentCoreMCPTool(
         "list_unity_databases",
         "List all databases in the Unity catalog",
-        UNITY_RUNTIME_ID,
+        UNITY_RUNTIME_ARN,
         "list_unity_databases_tool"
     ),
     AgentCoreMCPTool(
         "list_unity_tables",
         "List all tables in a specific Unity database",
-        UNITY_RUNTIME_ID,
+        UNITY_RUNTIME_ARN,
         "list_unity_tables_tool"
     ),
     AgentCoreMCPTool(
         "get_unity_table_details",
         "Get detailed information about a specific table in the Unity catalog",
-        UNITY_RUNTIME_ID,
-        "get_unity_table_details_tool"
+        UNITY_RUNTIME_ARN,
+        "get_unity_table_details_tool",
+        returns_object=True
     ),
     AgentCoreMCPTool(
         "search_unity_tables_by_name",
         "Search for tables by name pattern in the Unity catalog",
-        UNITY_RUNTIME_ID,
+        UNITY_RUNTIME_ARN,
         "search_unity_tables_by_name_tool"
     ),
     AgentCoreMCPTool(
         "search_unity_tables_by_column",
         "Search for tables containing columns matching the pattern in the Unity catalog",
-        UNITY_RUNTIME_ID,
+        UNITY_RUNTIME_ARN,
         "search_unity_tables_by_column_tool"
     )
 ]
@@ -96,39 +111,100 @@ glue_tools = [
     AgentCoreMCPTool(
         "list_glue_databases",
         "List all databases in the AWS Glue catalog",
-        GLUE_RUNTIME_ID,
+        GLUE_RUNTIME_ARN,
         "list_glue_databases_tool"
     ),
     AgentCoreMCPTool(
         "list_glue_tables",
         "List all tables in a specific AWS Glue database",
-        GLUE_RUNTIME_ID,
+        GLUE_RUNTIME_ARN,
         "list_glue_tables_tool"
     ),
     AgentCoreMCPTool(
         "get_glue_table_details",
         "Get detailed information about a specific table in the AWS Glue catalog",
-        GLUE_RUNTIME_ID,
-        "get_glue_table_details_tool"
+        GLUE_RUNTIME_ARN,
+        "get_glue_table_details_tool",
+        returns_object=True
     ),
     AgentCoreMCPTool(
         "search_glue_tables_by_name",
         "Search for tables by name pattern in the AWS Glue catalog",
-        GLUE_RUNTIME_ID,
+        GLUE_RUNTIME_ARN,
         "search_glue_tables_by_name_tool"
     ),
     AgentCoreMCPTool(
         "search_glue_tables_by_column",
         "Search for tables containing columns matching the pattern in the AWS Glue catalog",
-        GLUE_RUNTIME_ID,
+        GLUE_RUNTIME_ARN,
         "search_glue_tables_by_column_tool"
     )
 ]
 
+# Create ranked metadata search tools for each catalog
+semantic_tools = [
+    AgentCoreMCPTool(
+        "semantic_search_unity_tables",
+        "Rank Unity tables by how well their names, descriptions and columns match a natural-language question",
+        UNITY_RUNTIME_ARN,
+        "semantic_search_unity_tables_tool"
+    ),
+    AgentCoreMCPTool(
+        "semantic_search_glue_tables",
+        "Rank AWS Glue tables by how well their names, descriptions and columns match a natural-language question",
+        GLUE_RUNTIME_ARN,
+        "semantic_search_glue_tables_tool"
+    )
+]
+
+# Create BM25-ranked keyword search tools for each catalog
+ranked_tools = [
+    AgentCoreMCPTool(
+        "ranked_search_unity_tables",
+        "Search for tables by keywords in the Unity catalog, returning the best matches ranked by BM25 score",
+        UNITY_RUNTIME_ARN,
+        "ranked_search_unity_tables_tool"
+    ),
+    AgentCoreMCPTool(
+        "ranked_search_glue_tables",
+        "Search for tables by keywords in the AWS Glue catalog, returning the best matches ranked by BM25 score",
+        GLUE_RUNTIME_ARN,
+        "ranked_search_glue_tables_tool"
+    )
+]
+
+# Create cross-catalog tools that search both runtimes concurrently
+cross_catalog_tools = [
+    CrossCatalogMCPTool(
+        "search_all_catalogs_by_name",
+        "Search for tables by name pattern in both the Unity and AWS Glue catalogs",
+        unity_tools[3],
+        glue_tools[3]
+    ),
+    CrossCatalogMCPTool(
+        "search_all_catalogs_by_column",
+        "Search for tables containing columns matching the pattern in both the Unity and AWS Glue catalogs",
+        unity_tools[4],
+        glue_tools[4]
+    ),
+    CrossCatalogMCPTool(
+        "semantic_search_all_catalogs",
+        "Rank tables in both the Unity and AWS Glue catalogs by how well they match a natural-language question",
+        semantic_tools[0],
+        semantic_tools[1]
+    ),
+    CrossCatalogMCPTool(
+        "ranked_search_all_catalogs",
+        "Search for tables by keywords in both the Unity and AWS Glue catalogs, returning the best matches ranked by BM25 score",
+        ranked_tools[0],
+        ranked_tools[1]
+    )
+]
+
 # Create the unified catalog agent
 unified_agent = Agent(
     model="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
-    tools=unity_tools + glue_tools,
+    tools=unity_tools + glue_tools + semantic_tools + ranked_tools + cross_catalog_tools,
     system_prompt="""You are a unified catalog assistant that can help users find data products 
     in both the Unity catalog and the AWS Glue catalog.
     
@@ -140,6 +216,8 @@ unified_agent = Agent(
     - get_unity_table_details: Get detailed information about a specific table in the Unity catalog
     - search_unity_tables_by_name: Search for tables by name pattern in the Unity catalog
     - search_unity_tables_by_column: Search for tables containing columns matching the pattern in the Unity catalog
+    - semantic_search_unity_tables: Rank Unity tables by how well their metadata matches a natural-language question (query, top_k)
+    - ranked_search_unity_tables: Search for tables by keywords in the Unity catalog, returning the top_k best matches ranked by BM25 score (query, top_k)
     
     AWS Glue Catalog Tools:
     - list_glue_databases: List all databases in the AWS Glue catalog
@@ -147,6 +225,14 @@ unified_agent = Agent(
     - get_glue_table_details: Get detailed information about a specific table in the AWS Glue catalog
     - search_glue_tables_by_name: Search for tables by name pattern in the AWS Glue catalog
     - search_glue_tables_by_column: Search for tables containing columns matching the pattern in the AWS Glue catalog
+    - semantic_search_glue_tables: Rank AWS Glue tables by how well their metadata matches a natural-language question (query, top_k)
+    - ranked_search_glue_tables: Search for tables by keywords in the AWS Glue catalog, returning the top_k best matches ranked by BM25 score (query, top_k)
+    
+    Cross-catalog Tools (query both catalogs concurrently in a single call):
+    - search_all_catalogs_by_name: Search for tables by name pattern in both catalogs, returning unity_results and glue_results
+    - search_all_catalogs_by_column: Search for tables containing columns matching the pattern in both catalogs, returning unity_results and glue_results
+    - semantic_search_all_catalogs: Rank tables in both catalogs by how well they match a natural-language question, returning unity_results and glue_results
+    - ranked_search_all_catalogs: Search for tables by keywords in both catalogs, returning the top_k best matches of each ranked by BM25 score
     
     IMPORTANT DIFFERENCES:
     - Unity catalog uses a three-level namespace (catalog_name.schema_name.table_name)
@@ -157,6 +243,16 @@ unified_agent = Agent(
     2. If the user explicitly mentions "Glue" or "AWS", use AWS Glue catalog tools
     3. If the user doesn't specify, search both catalogs and combine the results
     
+    When searching both catalogs by table name or column name, use the cross-catalog tools instead of
+    calling the Unity and AWS Glue search tools separately. If one catalog returns an error marker,
+    report the results from the other catalog and mention the error in the summary.
+    
+    When the user describes the data they need instead of naming a table or column (e.g. "where is
+    customer churn data"), use the semantic search tools first; their results are ranked by score and
+    list the matching columns. Follow up with the details tools for the top results if needed.
+    When a keyword or name search would return a long list, use the ranked_search tools to get only
+    the best-scoring tables.
+    
     ALWAYS format your responses as valid JSON objects with the following structure:
     {
         "query": "The user's original query",
@@ -175,3 +271,10 @@ unified_agent = Agent(
     Always ensure your JSON response is properly formatted and valid.
     """
 )
+
+# Answer structured lookups directly through the MCP tools and send everything else to the model
+unified_agent = FastPathAgent(
+    unified_agent,
+    unity=CatalogRoutes("Unity", *unity_tools),
+    glue=CatalogRoutes("AWS Glue", *glue_tools)
+)
@@ -5,8 +5,11 @@ This module provides a fallback version that uses direct agent calls when MCP se
 """
 
 import os
+import json
 import logging
+import time
 from strands import Agent
+from tools.concurrency import DeadlineExceeded, run_concurrently
 
 # Configure logging
 logging.basicConfig(
@@ -14,6 +17,9 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+# Overall deadline (seconds) for the concurrent Unity and Glue agent runs
+FALLBACK_DEADLINE_SECONDS = float(os.getenv("UNIFIED_FALLBACK_DEADLINE", "120"))
+
 def create_unified_agent_fallback():
     """Create unified agent with fallback to direct agent calls"""
     
@@ -25,47 +31,83 @@ def create_unified_agent_fallback():
         logging.warning(f"MCP version failed, using fallback: {e}")
         
         # Fallback to direct agent calls
-        from agents.glue_catalog_agent import glue_agent
-        from agents.unity_catalog_agent import unity_agent
+        from agents.glue_catalog_agent import create_glue_agent
+        from agents.unity_catalog_agent import create_unity_agent
+        
+        from tools.unity_client import DEFAULT_BASE_URL, configure_unity_client
         
-        # Update Unity agent URL from environment
-        unity_url = os.getenv("UNITY_CATALOG_URL", "http://localhost:8080/api/2.1/unity-catalog")
-        if hasattr(unity_agent, 'tools') and len(unity_agent.tools) > 0:
-            unity_agent.tools[0].unity_catalog_url = unity_url
+        # Update Unity catalog URL from environment
+        unity_url = os.getenv("UNITY_CATALOG_URL", DEFAULT_BASE_URL)
+        configure_unity_client(base_url=unity_url)
         
-        # Create a simple unified agent that delegates to both
+        def run_agent(create_agent, query):
+            """Run a new catalog agent and parse its JSON response, falling back to the raw text"""
+            # A fresh agent per run: a timed-out run keeps its agent busy after we stop waiting for it,
+            # and answers must not depend on the history of earlier queries
+            response_text = str(create_agent()(query))
+            try:
+                return json.loads(response_text)
+            except json.JSONDecodeError:
+                return response_text
+        
+        # Create a simple unified agent that delegates to both concurrently
         class UnifiedAgent:
+            def __init__(self, deadline_seconds=None):
+                self.deadline_seconds = deadline_seconds or FALLBACK_DEADLINE_SECONDS
+            
             def run(self, query):
                 results = {
                     "query": query,
                     "unity_results": None,
                     "glue_results": None,
-                    "summary": ""
+                    "summary": "",
+                    "timing": {}
                 }
                 
-                # Try Unity Catalog
-                try:
-                    unity_result = unity_agent.run(query)
-                    results["unity_results"] = unity_result.data
-                except Exception as e:
-                    logging.error(f"Unity catalog error: {e}")
-                    results["unity_results"] = {"error": str(e)}
+                # Run both catalog agents at once; wall time is the slower of the two, capped by the deadline
+                started = time.monotonic()
+                outcomes = run_concurrently(
+                    {
+                        "unity": lambda: run_agent(create_unity_agent, query),
+                        "glue": lambda: run_agent(create_glue_agent, query)
+                    },
+                    self.deadline_seconds
+                )
+                
+                answered = []
+                for catalog, outcome in outcomes.items():
+                    label = "Unity" if catalog == "unity" else "Glue"
+                    if outcome.ok:
+                        status = "ok"
+                        results[f"{catalog}_results"] = outcome.result
+                        answered.append(label)
+                    elif isinstance(outcome.error, DeadlineExceeded):
+                        # The agent thread can't be interrupted; its late result is discarded
+                        status = "timed_out"
+                        logging.error(f"{label} catalog timed out after {self.deadline_seconds} seconds")
+                        results[f"{catalog}_results"] = {
+                            "error": "timeout",
+                            "error_message": f"{label} catalog did not respond within {self.deadline_seconds} seconds"
+                        }
+                    else:
+                        status = "error"
+                        logging.error(f"{label} catalog error: {outcome.error}")
+                        results[f"{catalog}_results"] = {"error": str(outcome.error)}
+                    results["timing"][catalog] = {
+                        "status": status,
+                        "elapsed_seconds": round(outcome.elapsed, 3)
+                    }
                 
-                # Try Glue Catalog
-                try:
-                    glue_result = glue_agent.run(query)
-                    results["glue_results"] = glue_result.data
-                except Exception as e:
-                    logging.error(f"Glue catalog error: {e}")
-                    results["glue_results"] = {"error": str(e)}
+                results["timing"]["total_seconds"] = round(time.monotonic() - started, 3)
+                results["timing"]["bottleneck"] = max(
+                    ("unity", "glue"), key=lambda catalog: results["timing"][catalog]["elapsed_seconds"]
+                )
                 
                 # Create summary
-                if results["unity_results"] and results["glue_results"]:
+                if len(answered) == 2:
                     results["summary"] = "Retrieved data from both Unity and Glue catalogs"
-                elif results["unity_results"]:
-                    results["summary"] = "Retrieved data from Unity catalog only"
-                elif results["glue_results"]:
-                    results["summary"] = "Retrieved data from Glue catalog only"
+                elif answered:
+                    results["summary"] = f"Retrieved data from {answered[0]} catalog only"
                 else:
                     results["summary"] = "Unable to retrieve data from either catalog"
                 
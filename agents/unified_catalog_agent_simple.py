@@ -10,19 +10,30 @@ using direct tool imports instead of MCP servers.
 import json
 import logging
 from strands import Agent
+from agents.intent_router import CatalogRoutes, FastPathAgent
 from tools.unity_tools import (
     list_unity_databases,
     list_unity_tables,
     get_table_details as get_unity_table_details,
     search_tables_by_name as search_unity_tables_by_name,
-    search_tables_by_column as search_unity_tables_by_column
+    search_tables_by_column as search_unity_tables_by_column,
+    semantic_search_unity_tables,
+    ranked_search_unity_tables
 )
 from tools.glue_tools import (
     list_glue_databases,
     list_glue_tables,
     get_table_details as get_glue_table_details,
     search_tables_by_name as search_glue_tables_by_name,
-    search_tables_by_column as search_glue_tables_by_column
+    search_tables_by_column as search_glue_tables_by_column,
+    semantic_search_glue_tables,
+    ranked_search_glue_tables
+)
+from tools.unified_tools import (
+    search_all_catalogs_by_name,
+    search_all_catalogs_by_column,
+    semantic_search_all_catalogs,
+    ranked_search_all_catalogs
 )
 
 # Configure logging
@@ -41,12 +52,21 @@ unified_agent = Agent(
         get_unity_table_details,
         search_unity_tables_by_name,
         search_unity_tables_by_column,
+        semantic_search_unity_tables,
+        ranked_search_unity_tables,
         # AWS Glue Catalog Tools
         list_glue_databases,
         list_glue_tables,
         get_glue_table_details,
         search_glue_tables_by_name,
-        search_glue_tables_by_column
+        search_glue_tables_by_column,
+        semantic_search_glue_tables,
+        ranked_search_glue_tables,
+        # Cross-catalog Tools
+        search_all_catalogs_by_name,
+        search_all_catalogs_by_column,
+        semantic_search_all_catalogs,
+        ranked_search_all_catalogs
     ],
     system_prompt="""You are a unified catalog assistant that can help users find data products 
     in both the Unity catalog and the AWS Glue catalog.
@@ -59,6 +79,8 @@ unified_agent = Agent(
     - get_table_details: Get detailed information about a specific table in the Unity catalog
     - search_tables_by_name: Search for tables by name pattern in the Unity catalog
     - search_tables_by_column: Search for tables containing columns matching the pattern in the Unity catalog
+    - semantic_search_unity_tables: Rank Unity tables by how well their metadata matches a natural-language question (query, top_k)
+    - ranked_search_unity_tables: Search for tables by keywords in the Unity catalog, returning the top_k best matches ranked by BM25 score (query, top_k)
     
     AWS Glue Catalog Tools:
     - list_glue_databases: List all databases in the AWS Glue catalog
@@ -66,6 +88,14 @@ unified_agent = Agent(
     - get_glue_table_details: Get detailed information about a specific table in the AWS Glue catalog
     - search_glue_tables_by_name: Search for tables by name pattern in the AWS Glue catalog
     - search_glue_tables_by_column: Search for tables containing columns matching the pattern in the AWS Glue catalog
+    - semantic_search_glue_tables: Rank AWS Glue tables by how well their metadata matches a natural-language question (query, top_k)
+    - ranked_search_glue_tables: Search for tables by keywords in the AWS Glue catalog, returning the top_k best matches ranked by BM25 score (query, top_k)
+    
+    Cross-catalog Tools (query both catalogs concurrently in a single call):
+    - search_all_catalogs_by_name: Search for tables by name pattern in both catalogs, returning unity_results and glue_results
+    - search_all_catalogs_by_column: Search for tables containing columns matching the pattern in both catalogs, returning unity_results and glue_results
+    - semantic_search_all_catalogs: Rank tables in both catalogs by how well they match a natural-language question, returning unity_results and glue_results
+    - ranked_search_all_catalogs: Search for tables by keywords in both catalogs, returning the top_k best matches of each ranked by BM25 score
     
     IMPORTANT DIFFERENCES:
     - Unity catalog uses a three-level namespace (catalog_name.schema_name.table_name)
@@ -76,6 +106,16 @@ unified_agent = Agent(
     2. If the user explicitly mentions "Glue" or "AWS", use AWS Glue catalog tools
     3. If the user doesn't specify, search both catalogs and combine the results
     
+    When searching both catalogs by table name or column name, use the cross-catalog tools instead of
+    calling the Unity and AWS Glue search tools separately. If one catalog returns an error marker,
+    report the results from the other catalog and mention the error in the summary.
+    
+    When the user describes the data they need instead of naming a table or column (e.g. "where is
+    customer churn data"), use the semantic search tools first; their results are ranked by score and
+    list the matching columns. Follow up with the details tools for the top results if needed.
+    When a keyword or name search would return a long list, use the ranked_search tools to get only
+    the best-scoring tables.
+    
     ALWAYS format your responses as valid JSON objects with the following structure:
     {
         "query": "The user's original query",
@@ -94,3 +134,24 @@ unified_agent = Agent(
     Always ensure your JSON response is properly formatted and valid.
     """
 )
+
+# Answer structured lookups directly and send everything else to the model
+unified_agent = FastPathAgent(
+    unified_agent,
+    unity=CatalogRoutes(
+        "Unity",
+        list_unity_databases,
+        list_unity_tables,
+        get_unity_table_details,
+        search_unity_tables_by_name,
+        search_unity_tables_by_column
+    ),
+    glue=CatalogRoutes(
+        "AWS Glue",
+        list_glue_databases,
+        list_glue_tables,
+        get_glue_table_details,
+        search_glue_tables_by_name,
+        search_glue_tables_by_column
+    )
+)
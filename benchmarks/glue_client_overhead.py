@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Microbenchmark for the shared Glue client.
+
+Measures per-call overhead of creating a boto3 Glue client on every tool call
+(the previous behaviour) against reusing the shared client from
+tools/glue_client.py. botocore's Stubber answers every call locally, so the
+numbers reflect client-side overhead only.
+
+Usage:
+    python -m benchmarks.glue_client_overhead --calls 200
+"""
+
+import argparse
+import os
+import time
+
+import boto3
+from botocore.stub import Stubber
+
+from tools.glue_client import create_glue_client
+
+DATABASES_RESPONSE = {"DatabaseList": [{"Name": f"database_{i}"} for i in range(10)]}
+
+
+def per_call_client(calls: int) -> float:
+    """Create a fresh client for every call, as the tools used to"""
+    start = time.perf_counter()
+    for _ in range(calls):
+        client = boto3.client("glue")
+        with Stubber(client) as stubber:
+            stubber.add_response("get_databases", DATABASES_RESPONSE, {})
+            client.get_databases()
+    return (time.perf_counter() - start) / calls
+
+
+def shared_client(calls: int) -> float:
+    """Reuse one configured client for every call"""
+    start = time.perf_counter()
+    client = create_glue_client()
+    with Stubber(client) as stubber:
+        for _ in range(calls):
+            stubber.add_response("get_databases", DATABASES_RESPONSE, {})
+        for _ in range(calls):
+            client.get_databases()
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-call vs shared Glue client overhead")
+    parser.add_argument("--calls", type=int, default=200, help="Calls per run")
+    args = parser.parse_args()
+
+    # Stubbed calls never reach AWS, but client creation still needs a region and credentials
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+    print("Glue client overhead benchmark")
+    print("==============================")
+    before = per_call_client(args.calls)
+    after = shared_client(args.calls)
+    print(f"boto3.client('glue') per call  {before * 1000:8.3f} ms/call")
+    print(f"shared get_glue_client()       {after * 1000:8.3f} ms/call")
+    print(f"\nSpeedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Load test for the FastMCP catalog servers.
+
+Drives mcp/unity_catalog_mcp_server.py in-process with an increasing number of
+concurrent clients, each calling get_unity_table_details_tool back to back
+against the local stand-in Unity server (with per-request latency to model a
+remote catalog). The same tool registered as a plain synchronous handler, as
+the servers used to do, is measured for comparison: it runs on the event loop,
+so its throughput stays flat however many clients there are.
+
+Usage:
+    python -m benchmarks.mcp_server_load --latency 0.02 --calls 64 --clients 1 2 4 8 16 32
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+
+from benchmarks.unity_stub_server import UnityStubServer, build_metastore
+from tools import unity_tools
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_server_module():
+    """
+    Import the Unity FastMCP server module from its file
+
+    The repo's own mcp/ package shadows the MCP SDK while the repo root is on
+    sys.path, so the SDK is imported with the repo root removed first.
+    """
+    repo_paths = [path for path in sys.path if os.path.abspath(path or ".") == REPO_ROOT]
+    sys.modules.pop("mcp", None)
+    sys.path[:] = [path for path in sys.path if path not in repo_paths]
+    try:
+        from mcp.server.fastmcp import FastMCP  # noqa: F401
+    finally:
+        sys.path[:0] = repo_paths
+
+    path = os.path.join(REPO_ROOT, "mcp", "unity_catalog_mcp_server.py")
+    spec = importlib.util.spec_from_file_location("unity_catalog_mcp_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def blocking_server():
+    """A server with the details tool registered synchronously, as before"""
+    from mcp.server.fastmcp import FastMCP
+
+    server = FastMCP()
+
+    @server.tool()
+    def get_unity_table_details_tool(database_name: str, table_name: str) -> dict:
+        return unity_tools.get_table_details(database_name, table_name)
+
+    return server
+
+
+async def drive(server, clients: int, calls: int) -> float:
+    """Run `calls` tool calls per client across `clients` concurrent clients and return calls per second"""
+    arguments = {"database_name": "catalog_0.schema_0", "table_name": "table_0"}
+
+    async def client():
+        for _ in range(calls):
+            await server.call_tool("get_unity_table_details_tool", arguments)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    return clients * calls / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the FastMCP Unity catalog server")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds the stand-in Unity server takes per request")
+    parser.add_argument("--calls", type=int, default=32, help="Tool calls per client")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32], help="Concurrent client counts")
+    args = parser.parse_args()
+
+    with UnityStubServer(build_metastore(), latency=args.latency) as stub:
+        os.environ["UNITY_CATALOG_URL"] = stub.base_url
+        # Every call goes to the catalog, as it does on a cold or disabled index
+        unity_tools.unity_index.enabled = False
+
+        async_server = load_server_module()
+        baseline = blocking_server()
+
+        print("FastMCP server load test")
+        print("========================")
+        print(f"MCP_MAX_CONCURRENCY={async_server.tool_executor.max_concurrency}, catalog latency {args.latency * 1000:g}ms\n")
+        print(f"{'clients':>7}  {'sync tools':>14}  {'async tools':>14}")
+        for clients in args.clients:
+            before = asyncio.run(drive(baseline, clients, args.calls))
+            after = asyncio.run(drive(async_server.mcp, clients, args.calls))
+            print(f"{clients:>7}  {before:10.1f}/s  {after:10.1f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Benchmark for the MCP servers' Python worker pool.
+
+Compares the previous process-per-call bridge (spawn invoke_<catalog>_agent.py,
+write one request, read one response) with a long-lived --worker process
+speaking newline-delimited JSON, as src/workerPool.ts does. Both use the
+invoke script's ping tool, so the numbers measure the bridge overhead
+(interpreter startup, imports, agent construction) rather than catalog or
+model latency.
+
+Usage:
+    python -m benchmarks.mcp_worker_pool --catalog glue --spawn-calls 10 --worker-calls 2000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def script_path(catalog: str) -> str:
+    """Path of the invoke script used by a catalog's MCP server"""
+    return os.path.join(REPO_ROOT, "mcp", f"{catalog}-catalog-server", f"invoke_{catalog}_agent.py")
+
+
+def worker_env() -> dict:
+    """Environment in which the invoke scripts can import the repo's packages"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    env.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    return env
+
+
+def spawn_per_call(catalog: str, calls: int) -> float:
+    """Start a new Python process for every call, as the MCP servers used to"""
+    request = json.dumps({"tool_name": "ping", "params": {}})
+    start = time.perf_counter()
+    for _ in range(calls):
+        output = subprocess.run(
+            [sys.executable, script_path(catalog)], input=request, capture_output=True,
+            text=True, check=True, env=worker_env()
+        ).stdout
+        assert json.loads(output.strip().splitlines()[-1]) == {"status": "ok"}
+    return calls / (time.perf_counter() - start)
+
+
+def persistent_worker(catalog: str, calls: int, in_flight: int) -> float:
+    """Send calls to one long-lived worker, keeping up to in_flight requests outstanding"""
+    worker = subprocess.Popen(
+        [sys.executable, script_path(catalog), "--worker"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL, text=True, bufsize=1, env=worker_env()
+    )
+    try:
+        # Warm up: the first answer arrives once the agent has been loaded
+        worker.stdin.write(json.dumps({"id": 0, "tool_name": "ping"}) + "\n")
+        worker.stdin.flush()
+        worker.stdout.readline()
+
+        start = time.perf_counter()
+        sent = received = 0
+        while received < calls:
+            while sent < calls and sent - received < in_flight:
+                sent += 1
+                worker.stdin.write(json.dumps({"id": sent, "tool_name": "ping", "params": {}}) + "\n")
+            worker.stdin.flush()
+            assert json.loads(worker.stdout.readline())["result"] == {"status": "ok"}
+            received += 1
+        return calls / (time.perf_counter() - start)
+    finally:
+        worker.stdin.close()
+        worker.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark process-per-call vs persistent Python workers")
+    parser.add_argument("--catalog", choices=["glue", "unity"], default="glue", help="MCP server to benchmark")
+    parser.add_argument("--spawn-calls", type=int, default=10, help="Calls for the process-per-call run")
+    parser.add_argument("--worker-calls", type=int, default=2000, help="Calls for the persistent worker run")
+    parser.add_argument("--in-flight", type=int, default=8, help="Outstanding requests on the worker")
+    args = parser.parse_args()
+
+    print("MCP bridge benchmark")
+    print("====================")
+    before = spawn_per_call(args.catalog, args.spawn_calls)
+    after = persistent_worker(args.catalog, args.worker_calls, args.in_flight)
+    print(f"process per call      {before:10.1f} calls/s")
+    print(f"persistent worker     {after:10.1f} calls/s")
+    print(f"\nSpeedup: {after / before:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Benchmark for BM25-ranked catalog search.
+
+Indexes synthetic catalogs of growing size (see benchmarks/search_index.py)
+with tools/ranked_search.py and reports the index build time and the mean
+query latency at each size, next to the number of tables the unranked
+column search returns for the same word.
+
+Usage:
+    python -m benchmarks.ranked_search --sizes 10000 50000 --columns 20
+"""
+
+import argparse
+import time
+
+from benchmarks.search_index import build_tables
+from tools.catalog_index import CatalogSnapshot
+from tools.ranked_search import BM25Index
+
+QUERIES = ["customer loyalty", "revenue", "vendor tax amount", "shipment status date", "nomatch"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BM25-ranked catalog search")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000], help="Numbers of tables")
+    parser.add_argument("--columns", type=int, default=20, help="Columns per table")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    args = parser.parse_args()
+
+    print("BM25 ranked search benchmark")
+    print("============================")
+    print(f"{'tables':>8} {'tokenize s':>11} {'build s':>8} {'query ms':>9} {'unranked matches':>17}")
+    for size in args.sizes:
+        tables = build_tables(size, args.columns)
+        index = BM25Index("benchmark")
+
+        start = time.perf_counter()
+        index.sync(tables)
+        tokenize_seconds = time.perf_counter() - start
+
+        # The first search builds the postings with the precomputed BM25 impacts
+        start = time.perf_counter()
+        index.search(["customer"], args.top_k)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for query in QUERIES:
+                index.search([query], args.top_k)
+        query_ms = (time.perf_counter() - start) / (args.repeat * len(QUERIES)) * 1000
+
+        snapshot = CatalogSnapshot(sorted({table["database"] for table in tables}), tables)
+        unranked = len(snapshot.search_by_column("revenue"))
+        print(f"{size:>8} {tokenize_seconds:>11.2f} {build_seconds:>8.2f} {query_ms:>9.2f} {unranked:>17}")
+
+
+if __name__ == "__main__":
+    main()
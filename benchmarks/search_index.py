@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Benchmark for the catalog search index.
+
+Builds a synthetic catalog snapshot (1M columns by default) and compares
+search_by_column / search_by_name through the n-gram index in
+tools/search_index.py against the linear substring scan the tools used
+before. Every query is checked to return the same results as the scan.
+
+Usage:
+    python -m benchmarks.search_index --tables 50000 --columns 20
+"""
+
+import argparse
+import random
+import time
+
+from tools.catalog_index import CatalogSnapshot
+
+WORDS = [
+    "account", "address", "amount", "balance", "batch", "campaign", "category", "channel", "city", "claim",
+    "code", "country", "created", "currency", "customer", "date", "device", "discount", "email", "event",
+    "external", "first", "flag", "invoice", "item", "last", "level", "line", "loyalty", "margin",
+    "merchant", "name", "order", "owner", "partner", "payment", "phone", "price", "product", "promo",
+    "quantity", "reason", "region", "return", "revenue", "score", "segment", "session", "shipment", "sku",
+    "source", "status", "store", "supplier", "tax", "tier", "total", "type", "updated", "vendor"
+]
+SUFFIXES = ["id", "key", "code", "ts", "date", "name", "amount", "flag", "count", "pct"]
+
+
+def build_tables(tables: int, columns: int, seed: int = 7) -> list:
+    """Build tables in the get_table_details format with realistic, repetitive column names"""
+    rng = random.Random(seed)
+    result = []
+    for t in range(tables):
+        table_columns = []
+        for c in range(columns):
+            name = f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{rng.choice(SUFFIXES)}"
+            comment = f"{rng.choice(WORDS)} {rng.choice(WORDS)} of the {rng.choice(WORDS)}" if c % 4 == 0 else ""
+            table_columns.append({"name": name, "type": "string", "comment": comment})
+        result.append({
+            "name": f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{t}",
+            "database": f"catalog.schema_{t % 100}",
+            "description": "",
+            "columns": table_columns
+        })
+    return result
+
+
+def scan_columns(tables: list, pattern: str) -> list:
+    """The previous linear search_by_column implementation"""
+    pattern = pattern.lower()
+    results = []
+    for table in tables:
+        matching_columns = [col["name"] for col in table["columns"] if pattern in col["name"].lower()]
+        if matching_columns:
+            results.append({"database": table["database"], "table": table["name"], "matching_columns": matching_columns})
+    return results
+
+
+def scan_names(tables: list, pattern: str) -> list:
+    """The previous linear search_by_name implementation"""
+    pattern = pattern.lower()
+    return [{"database": table["database"], "table": table["name"]} for table in tables if pattern in table["name"].lower()]
+
+
+def timed(fn, repeat: int) -> tuple:
+    """Run fn repeat times and return (result, mean seconds per call)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indexed vs linear catalog search")
+    parser.add_argument("--tables", type=int, default=50000, help="Number of tables")
+    parser.add_argument("--columns", type=int, default=20, help="Columns per table")
+    parser.add_argument("--repeat", type=int, default=5, help="Indexed runs per query")
+    args = parser.parse_args()
+
+    tables = build_tables(args.tables, args.columns)
+    start = time.perf_counter()
+    snapshot = CatalogSnapshot(sorted({table["database"] for table in tables}), tables)
+    build_seconds = time.perf_counter() - start
+
+    print("Catalog search index benchmark")
+    print("==============================")
+    print(f"{args.tables} tables, {args.tables * args.columns} columns")
+    print(f"Index build: {build_seconds:.2f}s "
+          f"({len(snapshot.search_index.columns.terms)} distinct column names)\n")
+    print(f"{'query':<34} {'matches':>8} {'scan ms':>10} {'index ms':>10} {'speedup':>8}")
+
+    column_queries = ["customer_id", "loyalty_tier", "xyz_not_there", "promo", "_pct", "id"]
+    for pattern in column_queries:
+        expected, scan = timed(lambda: scan_columns(tables, pattern), 1)
+        actual, indexed = timed(lambda: snapshot.search_by_column(pattern), args.repeat)
+        assert actual == expected, f"column search for {pattern!r} differs from the linear scan"
+        print(f"{'column ' + repr(pattern):<34} {len(actual):>8} {scan * 1000:>10.1f} {indexed * 1000:>10.1f} "
+              f"{scan / indexed:>7.1f}x")
+
+    for pattern in ["revenue_vendor", "_4242", "nomatch"]:
+        expected, scan = timed(lambda: scan_names(tables, pattern), 1)
+        actual, indexed = timed(lambda: snapshot.search_by_name(pattern), args.repeat)
+        assert actual == expected, f"name search for {pattern!r} differs from the linear scan"
+        print(f"{'name ' + repr(pattern):<34} {len(actual):>8} {scan * 1000:>10.1f} {indexed * 1000:>10.1f} "
+              f"{scan / indexed:>7.1f}x")
+
+    print()
+    for pattern, match in [("customer_", "prefix"), ("*_tier_pct", "glob"), (r"^loyalty_\w+_id$", "regex")]:
+        results, indexed = timed(lambda: snapshot.search_by_column(pattern, match=match), args.repeat)
+        print(f"{'column ' + match + ' ' + repr(pattern):<34} {len(results):>8} {'':>10} {indexed * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Benchmark for single-flight coalescing in the Unity catalog tools.
+
+Starts waves of concurrent callers that all ask for the same thing at once
+(table details, or the full crawl behind list_unity_databases) against the
+local stand-in Unity server, with the catalog index disabled so every call
+goes upstream. Reports upstream requests and wall time with coalescing off
+and on, and the coalescing counters.
+
+Usage:
+    python -m benchmarks.single_flight --callers 32 --waves 20 --latency 0.02
+"""
+
+import argparse
+import os
+import threading
+import time
+
+from benchmarks.unity_stub_server import UnityStubServer, build_metastore
+from tools import unity_tools
+
+
+def run_waves(tool, kwargs: dict, callers: int, waves: int) -> float:
+    """Run `waves` rounds of `callers` simultaneous identical calls and return the elapsed seconds"""
+    start = time.perf_counter()
+    for _ in range(waves):
+        barrier = threading.Barrier(callers)
+
+        def call():
+            barrier.wait()
+            tool(**kwargs)
+
+        threads = [threading.Thread(target=call) for _ in range(callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-flight coalescing of identical tool calls")
+    parser.add_argument("--callers", type=int, default=32, help="Simultaneous identical calls per wave")
+    parser.add_argument("--waves", type=int, default=20, help="Number of waves")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds the stand-in Unity server takes per request")
+    args = parser.parse_args()
+
+    scenarios = [
+        ("get_table_details", unity_tools.get_table_details,
+         {"database_name": "catalog_0.schema_0", "table_name": "table_0"}),
+        ("list_unity_databases", unity_tools.list_unity_databases, {})
+    ]
+
+    with UnityStubServer(build_metastore(), latency=args.latency) as stub:
+        os.environ["UNITY_CATALOG_URL"] = stub.base_url
+        # Every call goes to the catalog, as it does on a cold or disabled index
+        unity_tools.unity_index.enabled = False
+
+        print("Single-flight benchmark")
+        print("=======================")
+        print(f"{args.waves} waves of {args.callers} identical calls, catalog latency {args.latency * 1000:g}ms\n")
+        for label, tool, kwargs in scenarios:
+            for enabled in (False, True):
+                unity_tools.unity_flights.enabled = enabled
+                unity_tools.unity_flights.reset_stats()
+                stub.reset_counts()
+                elapsed = run_waves(tool, kwargs, args.callers, args.waves)
+                requests_made = sum(stub.request_counts.values())
+                mode = "coalesced" if enabled else "independent"
+                print(f"{label:<22} {mode:<12} {requests_made:>6} upstream requests  {elapsed:6.2f}s")
+            print(f"{'':<22} stats        {unity_tools.unity_flights.stats()[label]}\n")
+
+
+if __name__ == "__main__":
+    main()
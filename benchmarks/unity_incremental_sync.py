@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Benchmark for incremental Unity catalog syncs.
+
+Builds a synthetic metastore (50,000 tables by default) behind the local
+stand-in Unity server and reports the requests and time of each refresh:
+the full crawl behind load_unity_snapshot, the first UnityCatalogSync sync,
+a sync with nothing changed, and a sync after some churn (tables updated,
+created and dropped, a schema created and one dropped). Runs once with
+columns in the table listings, like the Unity OSS server, and once without,
+where every re-read table costs a details request.
+
+Usage:
+    python -m benchmarks.unity_incremental_sync --catalogs 5 --schemas 20 --tables 500
+"""
+
+import argparse
+import time
+
+from benchmarks.unity_stub_server import UnityStubServer, build_metastore
+from tools import unity_tools
+from tools.unity_client import UnityClient
+
+
+def apply_churn(metastore: dict, updated: int, created: int, dropped: int) -> str:
+    """Change the metastore in place and describe the change"""
+    catalog_name = next(iter(metastore))
+    schemas = metastore[catalog_name]
+    schema_names = list(schemas)
+    now = int(time.time() * 1000)
+
+    tables = schemas[schema_names[0]]
+    for table in tables[:updated]:
+        table["updated_at"] = now
+        table["columns"] = table["columns"] + [
+            {"name": "added_col", "type_text": "string", "type_name": "STRING", "position": len(table["columns"])}
+        ]
+    template = tables[-1]
+    for i in range(created):
+        name = f"new_table_{i}"
+        tables.append(dict(template, name=name, full_name=f"{catalog_name}.{schema_names[0]}.{name}", updated_at=now))
+    del schemas[schema_names[1]][:dropped]
+
+    # One schema is dropped and one created with as many tables
+    moved = schemas.pop(schema_names[-1])
+    schemas["new_schema"] = [
+        dict(table, schema_name="new_schema", full_name=f"{catalog_name}.new_schema.{table['name']}", updated_at=now)
+        for table in moved
+    ]
+    return (f"{updated} tables updated, {created} created, {dropped} dropped, "
+            f"1 schema of {len(moved)} tables dropped and 1 created")
+
+
+def measure(label: str, stub: UnityStubServer, refresh) -> None:
+    stub.reset_counts()
+    started = time.perf_counter()
+    snapshot = refresh()
+    elapsed = time.perf_counter() - started
+    counts = stub.request_counts
+    print(f"{label:<24} {sum(counts.values()):>7} requests "
+          f"(catalogs {counts['catalogs']}, schemas {counts['schemas']}, listings {counts['tables']}, "
+          f"details {counts['table']})  {len(snapshot.tables):>6} tables  {elapsed:6.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental Unity catalog syncs")
+    parser.add_argument("--catalogs", type=int, default=5)
+    parser.add_argument("--schemas", type=int, default=20, help="Schemas per catalog")
+    parser.add_argument("--tables", type=int, default=500, help="Tables per schema")
+    parser.add_argument("--updated", type=int, default=50, help="Tables updated between syncs")
+    parser.add_argument("--created", type=int, default=20, help="Tables created between syncs")
+    parser.add_argument("--dropped", type=int, default=10, help="Tables dropped between syncs")
+    args = parser.parse_args()
+
+    total = args.catalogs * args.schemas * args.tables
+    print("Incremental Unity sync benchmark")
+    print("================================")
+    print(f"{args.catalogs} catalogs x {args.schemas} schemas x {args.tables} tables = {total} tables\n")
+
+    for include_columns in (True, False):
+        metastore = build_metastore(args.catalogs, args.schemas, args.tables)
+        with UnityStubServer(metastore, include_columns_in_listing=include_columns) as stub:
+            client = UnityClient(base_url=stub.base_url)
+            sync = unity_tools.UnityCatalogSync(client)
+            print(f"Table listings {'with' if include_columns else 'without'} columns")
+            measure("full crawl", stub, lambda: unity_tools.load_unity_snapshot(client))
+            measure("first sync", stub, sync.sync)
+            measure("no changes", stub, sync.sync)
+            change = apply_churn(stub.metastore, args.updated, args.created, args.dropped)
+            measure("after churn", stub, sync.sync)
+            print(f"{'':<24} {change}")
+            print(f"{'':<24} {sync.last_sync}\n")
+            client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Benchmark for the pooled Unity catalog client.
+
+Compares requests per second for bare requests.get calls (a new connection per
+request) against the shared keep-alive UnityClient, using the local stand-in
+Unity server.
+
+Usage:
+    python -m benchmarks.unity_session --requests 2000 --threads 8
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.unity_stub_server import UnityStubServer, build_metastore
+from tools.unity_client import UnityClient
+
+
+def run(label: str, fetch, total: int, threads: int) -> float:
+    """Issue `total` GETs across `threads` workers and report requests per second"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda i: fetch(i), range(total)))
+    elapsed = time.perf_counter() - start
+    rps = total / elapsed
+    print(f"{label:<28} {total:>6} requests in {elapsed:6.2f}s  {rps:9.1f} req/s")
+    return rps
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs unpooled Unity catalog requests")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per run")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent client threads")
+    args = parser.parse_args()
+
+    with UnityStubServer(build_metastore(catalogs=2, schemas_per_catalog=5, tables_per_schema=20)) as stub:
+        paths = [
+            f"tables/catalog_{i % 2}.schema_{i % 5}.table_{i % 20}"
+            for i in range(args.requests)
+        ]
+
+        def bare(i):
+            response = requests.get(f"{stub.base_url}/{paths[i]}", timeout=10)
+            response.raise_for_status()
+            return response.json()
+
+        client = UnityClient(base_url=stub.base_url, pool_maxsize=args.threads)
+
+        def pooled(i):
+            return client.get(paths[i])
+
+        print("Unity catalog client benchmark")
+        print("==============================")
+        baseline = run("requests.get (no pooling)", bare, args.requests, args.threads)
+        improved = run("UnityClient (keep-alive)", pooled, args.requests, args.threads)
+        client.close()
+        print(f"\nSpeedup: {improved / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
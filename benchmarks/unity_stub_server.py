@@ -0,0 +1,296 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Local stand-in Unity Catalog server
+
+This module serves a synthetic metastore over the subset of the Unity catalog
+REST API used by tools/unity_tools.py. It speaks HTTP/1.1 with keep-alive so
+that benchmarks can compare pooled and unpooled clients, and counts requests per
+endpoint so that crawl strategies can be compared by request volume. Faults
+(error statuses with an optional Retry-After header, or dropped connections)
+can be injected to exercise the client's retry and circuit breaker handling.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/api/2.1/unity-catalog"
+
+
+def build_metastore(catalogs: int = 2, schemas_per_catalog: int = 3, tables_per_schema: int = 10,
+                    columns_per_table: int = 8) -> dict:
+    """
+    Build a synthetic metastore
+
+    Args:
+        catalogs: Number of catalogs
+        schemas_per_catalog: Number of schemas in each catalog
+        tables_per_schema: Number of tables in each schema
+        columns_per_table: Number of columns in each table
+
+    Returns:
+        dict: Mapping of catalog name to schema name to list of table objects
+    """
+    metastore = {}
+    for c in range(catalogs):
+        catalog_name = f"catalog_{c}"
+        metastore[catalog_name] = {}
+        for s in range(schemas_per_catalog):
+            schema_name = f"schema_{s}"
+            tables = []
+            for t in range(tables_per_schema):
+                table_name = f"table_{t}"
+                tables.append({
+                    "name": table_name,
+                    "catalog_name": catalog_name,
+                    "schema_name": schema_name,
+                    "full_name": f"{catalog_name}.{schema_name}.{table_name}",
+                    "table_type": "EXTERNAL",
+                    "data_source_format": "PARQUET",
+                    "storage_location": f"s3://bucket/{catalog_name}/{schema_name}/{table_name}",
+                    "comment": f"Synthetic table {t} in {catalog_name}.{schema_name}",
+                    "columns": [
+                        {
+                            "name": f"col_{k}" if k else "customer_id",
+                            "type_text": "string" if k % 2 else "bigint",
+                            "type_name": "STRING" if k % 2 else "LONG",
+                            "position": k,
+                            "comment": f"Column {k}"
+                        }
+                        for k in range(columns_per_table)
+                    ],
+                    "updated_at": 1700000000000
+                })
+            metastore[catalog_name][schema_name] = tables
+    return metastore
+
+
+class UnityStubServer:
+    """Threaded stand-in Unity catalog server running on a background thread"""
+
+    def __init__(self, metastore: dict | None = None, host: str = "127.0.0.1", port: int = 0,
+                 include_columns_in_listing: bool = True, latency: float = 0.0,
+                 fault_rate: float = 0.0, fault_status: int = 503):
+        """
+        Create the server
+
+        Args:
+            metastore: Metastore produced by build_metastore
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            include_columns_in_listing: Return columns in the list-tables response like the real server
+            latency: Seconds to sleep before answering each request, to model a remote server
+            fault_rate: Fraction of requests, chosen at random, answered with fault_status
+            fault_status: Status returned for random faults
+        """
+        self.metastore = metastore if metastore is not None else build_metastore()
+        self.include_columns_in_listing = include_columns_in_listing
+        self.latency = latency
+        self.fault_rate = fault_rate
+        self.fault_status = fault_status
+        self.request_counts = Counter()
+        self._faults = deque()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to the Unity client"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def reset_counts(self):
+        """Reset the per-endpoint request counters"""
+        with self._lock:
+            self.request_counts.clear()
+
+    def inject_faults(self, count: int = 1, status: int | None = 503, retry_after: str | None = None):
+        """
+        Fail the next requests instead of answering them
+
+        Faulted requests are counted under 'faults' and not under their endpoint.
+
+        Args:
+            count: Number of requests to fail
+            status: Status to answer with, or None to close the connection without answering
+            retry_after: Value of the Retry-After header to send with the status (seconds or an HTTP date)
+        """
+        with self._lock:
+            self._faults.extend([(status, retry_after)] * count)
+
+    def clear_faults(self):
+        """Drop any injected faults that have not been served yet"""
+        with self._lock:
+            self._faults.clear()
+
+    def next_fault(self) -> tuple | None:
+        """
+        Take the fault to serve for the current request, if any
+
+        Returns:
+            tuple | None: (status, retry_after) for a faulted request, or None to answer normally
+        """
+        with self._lock:
+            if self._faults:
+                fault = self._faults.popleft()
+            elif self.fault_rate and random.random() < self.fault_rate:
+                fault = (self.fault_status, None)
+            else:
+                return None
+            self.request_counts["faults"] += 1
+            return fault
+
+    def start(self) -> "UnityStubServer":
+        """Start serving on a daemon thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _count(self, endpoint: str):
+        with self._lock:
+            self.request_counts[endpoint] += 1
+
+    def handle(self, path: str, query: dict) -> tuple[int, dict]:
+        """
+        Resolve an API request against the metastore
+
+        Args:
+            path: Request path with the API prefix removed
+            query: Parsed query string
+
+        Returns:
+            tuple: HTTP status code and JSON body
+        """
+        metastore = self.metastore
+        if path == "/catalogs":
+            self._count("catalogs")
+            items = [{"name": name} for name in metastore]
+            return 200, self._page("catalogs", items, query)
+
+        if path == "/schemas":
+            self._count("schemas")
+            catalog_name = query.get("catalog_name", [""])[0]
+            if catalog_name not in metastore:
+                return 404, {"error_code": "CATALOG_DOES_NOT_EXIST", "message": catalog_name}
+            items = [
+                {"name": name, "catalog_name": catalog_name, "full_name": f"{catalog_name}.{name}"}
+                for name in metastore[catalog_name]
+            ]
+            return 200, self._page("schemas", items, query)
+
+        if path == "/tables":
+            self._count("tables")
+            catalog_name = query.get("catalog_name", [""])[0]
+            schema_name = query.get("schema_name", [""])[0]
+            tables = metastore.get(catalog_name, {}).get(schema_name)
+            if tables is None:
+                return 404, {"error_code": "SCHEMA_DOES_NOT_EXIST", "message": f"{catalog_name}.{schema_name}"}
+            if not self.include_columns_in_listing:
+                tables = [{k: v for k, v in table.items() if k != "columns"} for table in tables]
+            return 200, self._page("tables", tables, query)
+
+        if path.startswith("/tables/"):
+            self._count("table")
+            full_name = path[len("/tables/"):]
+            parts = full_name.split(".")
+            if len(parts) == 3:
+                for table in metastore.get(parts[0], {}).get(parts[1], []):
+                    if table["name"] == parts[2]:
+                        return 200, table
+            return 404, {"error_code": "TABLE_DOES_NOT_EXIST", "message": full_name}
+
+        return 404, {"error_code": "NOT_FOUND", "message": path}
+
+    @staticmethod
+    def _page(key: str, items: list, query: dict) -> dict:
+        """Apply max_results/page_token pagination the way the Unity API does"""
+        max_results = int(query.get("max_results", ["0"])[0] or 0)
+        start = int(query.get("page_token", ["0"])[0] or 0)
+        if max_results <= 0:
+            return {key: items[start:]}
+        end = start + max_results
+        body = {key: items[start:end]}
+        if end < len(items):
+            body["next_page_token"] = str(end)
+        return body
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path = parsed.path
+                if path.startswith(API_PREFIX):
+                    path = path[len(API_PREFIX):]
+                if server.latency:
+                    time.sleep(server.latency)
+                headers = {}
+                fault = server.next_fault()
+                if fault is None:
+                    status, body = server.handle(path, parse_qs(parsed.query))
+                else:
+                    status, retry_after = fault
+                    if status is None:
+                        # Drop the connection without a response, like a crashed or restarting server
+                        self.close_connection = True
+                        return
+                    body = {"error_code": "INJECTED_FAULT", "message": f"Injected {status} for {path}"}
+                    if retry_after is not None:
+                        headers["Retry-After"] = retry_after
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a stand-in Unity catalog server")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--catalogs", type=int, default=2)
+    parser.add_argument("--schemas", type=int, default=3)
+    parser.add_argument("--tables", type=int, default=10)
+    parser.add_argument("--fault-rate", type=float, default=0.0, help="Fraction of requests answered with --fault-status")
+    parser.add_argument("--fault-status", type=int, default=503)
+    args = parser.parse_args()
+
+    stub = UnityStubServer(build_metastore(args.catalogs, args.schemas, args.tables), port=args.port,
+                           fault_rate=args.fault_rate, fault_status=args.fault_status)
+    print(f"Serving stand-in Unity catalog at {stub.base_url}")
+    stub.start()
+    try:
+        stub._thread.join()
+    except KeyboardInterrupt:
+        stub.stop()
@@ -0,0 +1,54 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from tools import unity_client, unity_tools
+
+
+def make_table(database: str, name: str, columns=(), description: str = "") -> dict:
+    """Table in the get_table_details format with string columns"""
+    return {
+        "database": database,
+        "name": name,
+        "description": description,
+        "columns": [{"name": column, "type": "string", "comment": ""} for column in columns]
+    }
+
+
+@pytest.fixture
+def table():
+    """Factory for tables in the get_table_details format"""
+    return make_table
+
+
+@pytest.fixture
+def ranking_tables():
+    """Small catalog for the ranked search tests"""
+    return [
+        make_table("crm", "customer_churn", ["customer_id", "churn_date", "reason"], "Customers who cancelled"),
+        make_table("crm", "customers", ["customer_id", "email", "signup_date"], "Customer profiles"),
+        make_table("sales", "orders", ["order_id", "customer_id", "order_total"], "Orders placed in the web shop"),
+        make_table("finance", "invoices", ["invoice_id", "amount", "due_date"], "Invoices sent to partners"),
+        make_table("ops", "shipments", ["shipment_id", "carrier", "status"], "Shipment tracking events")
+    ]
+
+
+@pytest.fixture
+def configure_unity_tools(monkeypatch):
+    """
+    Point the Unity tools at a test server for one test
+
+    The catalog snapshot is bypassed and the result cache emptied, and the
+    process-wide client is restored after the test.
+    """
+    monkeypatch.setattr(unity_tools.unity_index, "enabled", False)
+    monkeypatch.setattr(unity_client, "_client", None)
+    unity_tools.unity_cache.clear()
+    yield unity_client.configure_unity_client
+    if unity_client._client is not None:
+        unity_client._client.close()
+    unity_tools.unity_cache.clear()
@@ -1,17 +1,71 @@
 #!/usr/bin/env python3
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: MIT-0
+import os
 import sys
 import json
-from agents.glue_catalog_agent import glue_agent
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from tools import glue_tools
 
-def main():
-    # Read the input from stdin
-    input_data = json.loads(sys.stdin.read())
+# Number of requests a --worker process handles at the same time
+WORKER_THREADS = int(os.environ.get("PYTHON_WORKER_THREADS", "4"))
+
+# Route tool calls through the LLM agent instead of calling the tools directly
+# (INVOKE_AGENT_MODE=llm or --llm)
+USE_LLM = os.environ.get("INVOKE_AGENT_MODE", "direct").lower() == "llm"
+
+# MCP tool names and the Glue tool functions that answer them
+DIRECT_TOOLS = {
+    'list_glue_databases': glue_tools.list_glue_databases,
+    'list_glue_tables': glue_tools.list_glue_tables,
+    'get_glue_table_details': glue_tools.get_table_details,
+    'search_glue_tables_by_name': glue_tools.search_tables_by_name,
+    'search_glue_tables_by_column': glue_tools.search_tables_by_column,
+    'semantic_search_glue_tables': glue_tools.semantic_search_glue_tables,
+    'ranked_search_glue_tables': glue_tools.ranked_search_glue_tables
+}
+
+def dispatch_direct(tool_name, params):
+    """Call the Glue tool for an MCP tool call and return its result"""
+    tool_function = DIRECT_TOOLS.get(tool_name)
+    if tool_function is None:
+        return {
+            "error": "unknown_tool",
+            "message": f"Unknown tool: {tool_name}"
+        }
     
-    # Extract the query and parameters
-    tool_name = input_data.get('tool_name')
-    params = input_data.get('params', {})
+    try:
+        inspect.signature(tool_function).bind(**params)
+    except TypeError as e:
+        return {
+            "error": "invalid_params",
+            "message": f"Invalid parameters for {tool_name}: {str(e)}"
+        }
+    
+    try:
+        return tool_function(**params)
+    except Exception as e:
+        return {
+            "error": "tool_error",
+            "message": f"{tool_name} failed: {str(e)}"
+        }
+
+def handle_request(tool_name, params, use_llm=False):
+    """Run one tool call and return its JSON-serializable response"""
+    # Health check used by the worker pool; it never reaches the agent
+    if tool_name == 'ping':
+        return {"status": "ok"}
+    
+    if not use_llm:
+        return dispatch_direct(tool_name, params)
+    
+    # The agent is only loaded when the LLM path is used. Requests run concurrently in
+    # worker mode, and a strands agent rejects overlapping calls and keeps its history,
+    # so every request gets a new agent
+    from agents.glue_catalog_agent import create_glue_agent
+    glue_agent = create_glue_agent()
     
     # Process the query based on the tool name
     if tool_name == 'list_glue_databases':
@@ -29,13 +83,19 @@ def main():
     elif tool_name == 'search_glue_tables_by_column':
         column_pattern = params.get('column_pattern')
         response = glue_agent(f"Find tables with columns containing '{column_pattern}'")
+    elif tool_name == 'semantic_search_glue_tables':
+        query = params.get('query')
+        response = glue_agent(f"Which tables best match: {query}")
+    elif tool_name == 'ranked_search_glue_tables':
+        query = params.get('query')
+        top_k = params.get('top_k', 10)
+        response = glue_agent(f"Find the {top_k} tables that best match the keywords '{query}'")
     else:
         # Return an error for unknown tool names
-        print(json.dumps({
+        return {
             "error": "unknown_tool",
             "message": f"Unknown tool: {tool_name}"
-        }))
-        return
+        }
     
     # Extract the response message
     if hasattr(response, 'message'):
@@ -43,20 +103,73 @@ def main():
         
         # Try to parse the response as JSON
         try:
-            response_json = json.loads(response_text)
-            print(json.dumps(response_json))
+            return json.loads(response_text)
         except json.JSONDecodeError:
             # If the response is not valid JSON, return it as is
-            print(json.dumps({
+            return {
                 "raw_response": response_text,
                 "error": "invalid_json_response"
-            }))
+            }
     else:
         # Handle case where response doesn't have a message attribute
-        print(json.dumps({
+        return {
             "error": "invalid_response",
             "message": "Agent response does not have a message attribute"
-        }))
+        }
+
+def serve(use_llm=False):
+    """
+    Serve tool calls as newline-delimited JSON until stdin is closed
+    
+    Each input line is {"id": ..., "tool_name": ..., "params": {...}} and is answered
+    with one output line {"id": ..., "result": ...}. Requests run concurrently, so
+    responses may be written in a different order than the requests arrived.
+    """
+    # Reserve stdout for responses; anything else printed goes to stderr
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+    write_lock = threading.Lock()
+    
+    def respond(request_id, result):
+        line = json.dumps({"id": request_id, "result": result}, default=str)
+        with write_lock:
+            protocol_out.write(line + "\n")
+            protocol_out.flush()
+    
+    def run(request):
+        try:
+            result = handle_request(request.get('tool_name'), request.get('params') or {}, use_llm)
+        except Exception as e:
+            result = {"error": "tool_error", "message": str(e)}
+        respond(request.get('id'), result)
+    
+    with ThreadPoolExecutor(max_workers=WORKER_THREADS) as executor:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                respond(None, {"error": "invalid_request", "message": str(e)})
+                continue
+            executor.submit(run, request)
+
+def main():
+    use_llm = USE_LLM or '--llm' in sys.argv[1:]
+    
+    # Long-lived worker mode used by the MCP server's worker pool
+    if '--worker' in sys.argv[1:]:
+        serve(use_llm)
+        return
+    
+    # Read the input from stdin
+    input_data = json.loads(sys.stdin.read())
+    
+    # Extract the query and parameters
+    tool_name = input_data.get('tool_name')
+    params = input_data.get('params', {})
+    
+    print(json.dumps(handle_request(tool_name, params, use_llm), default=str))
 
 if __name__ == "__main__":
     main()
@@ -3,42 +3,94 @@
 AWS Glue Catalog MCP Server using FastMCP for AgentCore Runtime
 """
 
+import asyncio
+import os
 from mcp.server.fastmcp import FastMCP
+from tools.catalog_snapshot import persist_index
+from tools.concurrency import BoundedExecutor
 from tools.glue_tools import (
+    glue_index,
+    glue_sync,
     list_glue_databases,
     list_glue_tables,
     get_table_details,
     search_tables_by_name,
-    search_tables_by_column
+    search_tables_by_column,
+    semantic_search_glue_tables,
+    ranked_search_glue_tables
 )
 
 # Create FastMCP server with AgentCore Runtime compatibility
 mcp = FastMCP(host="0.0.0.0", port=8080, stateless_http=True)
 
+# The AWS Glue tools do blocking I/O, so they run on a bounded thread pool instead of
+# the event loop; concurrent requests then overlap, up to MCP_MAX_CONCURRENCY at once
+tool_executor = BoundedExecutor(int(os.environ.get("MCP_MAX_CONCURRENCY", "16")))
+
 @mcp.tool()
-def list_glue_databases_tool() -> list:
+async def list_glue_databases_tool() -> list:
     """List all databases in the AWS Glue catalog"""
-    return list_glue_databases()
+    return await tool_executor.run(list_glue_databases)
 
 @mcp.tool()
-def list_glue_tables_tool(database_name: str) -> list:
+async def list_glue_tables_tool(database_name: str) -> list:
     """List all tables in a specific AWS Glue database"""
-    return list_glue_tables(database_name)
+    return await tool_executor.run(list_glue_tables, database_name)
 
 @mcp.tool()
-def get_glue_table_details_tool(database_name: str, table_name: str) -> dict:
+async def get_glue_table_details_tool(database_name: str, table_name: str) -> dict:
     """Get detailed information about a specific table in the AWS Glue catalog"""
-    return get_table_details(database_name, table_name)
+    return await tool_executor.run(get_table_details, database_name, table_name)
 
 @mcp.tool()
-def search_glue_tables_by_name_tool(name_pattern: str) -> list:
+async def search_glue_tables_by_name_tool(name_pattern: str) -> list:
     """Search for tables by name pattern in the AWS Glue catalog"""
-    return search_tables_by_name(name_pattern)
+    return await tool_executor.run(search_tables_by_name, name_pattern)
 
 @mcp.tool()
-def search_glue_tables_by_column_tool(column_pattern: str) -> list:
+async def search_glue_tables_by_column_tool(column_pattern: str) -> list:
     """Search for tables containing columns matching the pattern in the AWS Glue catalog"""
-    return search_tables_by_column(column_pattern)
+    return await tool_executor.run(search_tables_by_column, column_pattern)
+
+@mcp.tool()
+async def semantic_search_glue_tables_tool(query: str, top_k: int = 10) -> list | dict:
+    """Rank Glue tables by how well their names, descriptions and columns match a natural-language question"""
+    return await tool_executor.run(semantic_search_glue_tables, query, top_k)
+
+@mcp.tool()
+async def ranked_search_glue_tables_tool(query: str, top_k: int = 10) -> list | dict:
+    """Search for tables by keywords in the AWS Glue catalog, returning the top_k best matches ranked by BM25 score"""
+    return await tool_executor.run(ranked_search_glue_tables, query, top_k)
+
+# Tools that run_tool_batch can call, by MCP tool name
+BATCH_TOOLS = {
+    tool.__name__: tool for tool in (
+        list_glue_databases_tool,
+        list_glue_tables_tool,
+        get_glue_table_details_tool,
+        search_glue_tables_by_name_tool,
+        search_glue_tables_by_column_tool,
+        semantic_search_glue_tables_tool,
+        ranked_search_glue_tables_tool
+    )
+}
+
+async def run_batched_call(call: dict) -> dict:
+    """Run one call of a batch, returning {"result": ...} or {"error": ...}"""
+    tool = BATCH_TOOLS.get(call.get("tool_name"))
+    if tool is None:
+        return {"error": f"Unknown tool: {call.get('tool_name')}"}
+    try:
+        return {"result": await tool(**(call.get("params") or {}))}
+    except Exception as e:
+        return {"error": f"{call.get('tool_name')} failed: {str(e)}"}
+
+@mcp.tool()
+async def run_tool_batch(calls: list[dict]) -> list:
+    """Run several AWS Glue catalog tool calls in one request; each call is {"tool_name": ..., "params": {...}} and results are returned in the same order"""
+    return await asyncio.gather(*(run_batched_call(call) for call in calls))
 
 if __name__ == "__main__":
+    # Answer from the snapshot saved by the last crawl on this host; the index refreshes it in the background
+    persist_index(glue_index, sync=glue_sync)
     mcp.run(transport="streamable-http")
@@ -7,10 +7,10 @@ import {
   ListToolsRequestSchema,
   McpError,
 } from '@modelcontextprotocol/sdk/types.js';
-import { spawn } from 'child_process';
 import { promisify } from 'util';
 import * as path from 'path';
 import * as fs from 'fs';
+import { PythonWorkerPool } from './workerPool.js';
 
 // Get the project root directory
 const projectRoot = process.env.PROJECT_ROOT || process.cwd();
@@ -18,107 +18,21 @@ const projectRoot = process.env.PROJECT_ROOT || process.cwd();
 // Define the path to the Python script that will invoke the Unity catalog agent
 const pythonScript = path.join(projectRoot, 'mcp', 'unity-catalog-server', 'invoke_unity_agent.py');
 
-// Create the Python script if it doesn't exist
+// The worker script is part of the repository; fail at startup rather than on the first tool call
 if (!fs.existsSync(pythonScript)) {
-  const scriptContent = `#!/usr/bin/env python3
-import sys
-import json
-from agents.unity_catalog_agent import unity_agent
-
-def main():
-    # Read the input from stdin
-    input_data = json.loads(sys.stdin.read())
-    
-    # Extract the query and parameters
-    tool_name = input_data.get('tool_name')
-    params = input_data.get('params', {})
-    
-    # Process the query based on the tool name
-    if tool_name == 'list_unity_databases':
-        response = unity_agent("List all databases in the Unity catalog")
-    elif tool_name == 'list_unity_tables':
-        database_name = params.get('database_name')
-        response = unity_agent(f"Show me all tables in {database_name}")
-    elif tool_name == 'get_unity_table_details':
-        database_name = params.get('database_name')
-        table_name = params.get('table_name')
-        response = unity_agent(f"Get details for {table_name} in {database_name}")
-    elif tool_name == 'search_unity_tables_by_name':
-        name_pattern = params.get('name_pattern')
-        response = unity_agent(f"Find tables with '{name_pattern}' in the name")
-    elif tool_name == 'search_unity_tables_by_column':
-        column_pattern = params.get('column_pattern')
-        response = unity_agent(f"Find tables with columns containing '{column_pattern}'")
-    else:
-        # Return an error for unknown tool names
-        print(json.dumps({
-            "error": "unknown_tool",
-            "message": f"Unknown tool: {tool_name}"
-        }))
-        return
-    
-    # Extract the response message
-    if hasattr(response, 'message'):
-        response_text = str(response.message)
-        
-        # Try to parse the response as JSON
-        try:
-            response_json = json.loads(response_text)
-            print(json.dumps(response_json))
-        except json.JSONDecodeError:
-            # If the response is not valid JSON, return it as is
-            print(json.dumps({
-                "raw_response": response_text,
-                "error": "invalid_json_response"
-            }))
-    else:
-        # Handle case where response doesn't have a message attribute
-        print(json.dumps({
-            "error": "invalid_response",
-            "message": "Agent response does not have a message attribute"
-        }))
-
-if __name__ == "__main__":
-    main()
-`;
-  fs.writeFileSync(pythonScript, scriptContent);
-  fs.chmodSync(pythonScript, '755');
+  console.error(`${pythonScript} not found; set PROJECT_ROOT to the repository root`);
+  process.exit(1);
 }
 
-// Function to execute the Python script with the Unity catalog agent
+// Long-lived Python workers keep the Unity catalog tools imported between tool calls
+const workerPool = new PythonWorkerPool({
+  command: 'python3',
+  args: [pythonScript, '--worker'],
+});
+
+// Function to call the Unity catalog agent through the worker pool
 async function invokeUnityAgent(toolName: string, params: Record<string, any> = {}): Promise<any> {
-  return new Promise((resolve, reject) => {
-    const pythonProcess = spawn('python3', [pythonScript]);
-    
-    let stdout = '';
-    let stderr = '';
-    
-    pythonProcess.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
-    
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
-    
-    pythonProcess.on('close', (code) => {
-      if (code !== 0) {
-        reject(new Error(`Python process exited with code ${code}: ${stderr}`));
-        return;
-      }
-      
-      try {
-        const result = JSON.parse(stdout);
-        resolve(result);
-      } catch (error) {
-        reject(new Error(`Failed to parse Python output as JSON: ${stdout}`));
-      }
-    });
-    
-    // Send the input to the Python script
-    pythonProcess.stdin.write(JSON.stringify({ tool_name: toolName, params }));
-    pythonProcess.stdin.end();
-  });
+  return workerPool.call(toolName, params);
 }
 
 class UnityCatalogServer {
@@ -142,6 +56,7 @@ class UnityCatalogServer {
     // Error handling
     this.server.onerror = (error) => console.error('[MCP Error]', error);
     process.on('SIGINT', async () => {
+      workerPool.close();
       await this.server.close();
       process.exit(0);
     });
@@ -219,6 +134,42 @@ class UnityCatalogServer {
             required: ['column_pattern'],
           },
         },
+        {
+          name: 'semantic_search_unity_tables',
+          description: 'Rank tables in the Unity catalog by how well their names, columns and descriptions match a natural-language question',
+          inputSchema: {
+            type: 'object',
+            properties: {
+              query: {
+                type: 'string',
+                description: 'Question or description of the data, e.g. customer churn',
+              },
+              top_k: {
+                type: 'number',
+                description: 'Number of tables to return (default 10, at most 100)',
+              },
+            },
+            required: ['query'],
+          },
+        },
+        {
+          name: 'ranked_search_unity_tables',
+          description: 'Return the tables in the Unity catalog that best match keywords, ranked by BM25 score',
+          inputSchema: {
+            type: 'object',
+            properties: {
+              query: {
+                type: 'string',
+                description: 'Keywords to search table metadata for',
+              },
+              top_k: {
+                type: 'number',
+                description: 'Number of tables to return (default 10, at most 100)',
+              },
+            },
+            required: ['query'],
+          },
+        },
       ],
     }));
 
@@ -235,7 +186,7 @@ class UnityCatalogServer {
             content: [
               {
                 type: 'text',
-                text: `Error: ${result.message || result.error}`,
+                text: `Error: ${result.message || result.error_message || result.error}`,
               },
             ],
             isError: true,
@@ -0,0 +1,216 @@
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+import * as readline from 'readline';
+
+// Pool of long-lived Python processes that answer tool calls as newline-delimited JSON.
+//
+// Each worker runs the invoke script with --worker: it imports the catalog tools once,
+// reads {"id", "tool_name", "params"} lines from stdin and writes {"id", "result"} lines
+// to stdout. In direct mode the tools are called without an agent; in LLM mode a new agent
+// is built for every request. Several requests can be in flight on one worker at a time;
+// responses are matched to requests by id, so they may complete in any order.
+//
+// A request that times out is rejected here but keeps running on one of the worker's
+// PYTHON_WORKER_THREADS threads. Once maxAbandoned timed-out requests are still running,
+// the worker is killed and restarted, failing the other requests it had in flight.
+
+export interface WorkerPoolOptions {
+  // Executable and arguments that start one worker, e.g. python3 invoke_glue_agent.py --worker
+  command: string;
+  args: string[];
+  // Number of worker processes (default: PYTHON_WORKER_POOL_SIZE or 2)
+  size?: number;
+  // Milliseconds before a request is rejected (default: PYTHON_WORKER_TIMEOUT_MS or 120000)
+  requestTimeoutMs?: number;
+  // Timed-out requests still running on a worker before it is restarted
+  // (default: PYTHON_WORKER_THREADS or 4, the worker's thread count)
+  maxAbandoned?: number;
+  // Delay before restarting a crashed worker; doubles while it keeps crashing (default: 1000)
+  restartDelayMs?: number;
+}
+
+type ResolvedOptions = Required<WorkerPoolOptions>;
+
+interface PendingRequest {
+  resolve: (result: any) => void;
+  reject: (error: Error) => void;
+  timer: NodeJS.Timeout;
+}
+
+const MAX_RESTART_DELAY_MS = 30000;
+
+function envInt(name: string, fallback: number): number {
+  const value = parseInt(process.env[name] || '', 10);
+  return Number.isNaN(value) ? fallback : value;
+}
+
+class PythonWorker {
+  private child: ChildProcessWithoutNullStreams | null = null;
+  private readonly pending = new Map<number, PendingRequest>();
+  // Ids of timed-out requests that the worker has not answered yet
+  private readonly abandoned = new Set<number>();
+  private consecutiveRestarts = 0;
+  private closed = false;
+
+  constructor(private readonly index: number, private readonly options: ResolvedOptions) {
+    this.start();
+  }
+
+  get alive(): boolean {
+    return this.child !== null;
+  }
+
+  get inFlight(): number {
+    return this.pending.size;
+  }
+
+  send(id: number, toolName: string, params: Record<string, any>): Promise<any> {
+    return new Promise((resolve, reject) => {
+      const child = this.child;
+      if (!child) {
+        reject(new Error(`Python worker ${this.index} is not running`));
+        return;
+      }
+
+      const timer = setTimeout(() => {
+        // A late response for this id is ignored when it arrives
+        this.pending.delete(id);
+        this.abandoned.add(id);
+        reject(new Error(`Python worker ${this.index} did not answer ${toolName} within ${this.options.requestTimeoutMs}ms`));
+        if (this.abandoned.size >= this.options.maxAbandoned) {
+          this.recycle(`${this.abandoned.size} timed-out requests are still running`);
+        }
+      }, this.options.requestTimeoutMs);
+
+      this.pending.set(id, { resolve, reject, timer });
+      child.stdin.write(JSON.stringify({ id, tool_name: toolName, params }) + '\n');
+    });
+  }
+
+  close() {
+    this.closed = true;
+    const child = this.child;
+    if (child) {
+      // Closing stdin lets the worker finish in-flight requests and exit
+      child.stdin.end();
+      setTimeout(() => child.kill(), 5000).unref();
+    }
+  }
+
+  // Replace a worker whose threads are tied up by abandoned requests
+  private recycle(reason: string) {
+    const child = this.child;
+    if (!child || this.closed) {
+      return;
+    }
+    // Detach first so that the old process's exit does not schedule another restart
+    this.child = null;
+    this.failPending(new Error(`Python worker ${this.index} restarted: ${reason}`));
+    console.error(`Python worker ${this.index}: ${reason}; restarting`);
+    child.kill();
+    this.start();
+  }
+
+  private failPending(error: Error) {
+    for (const request of this.pending.values()) {
+      clearTimeout(request.timer);
+      request.reject(error);
+    }
+    this.pending.clear();
+    this.abandoned.clear();
+  }
+
+  private start() {
+    const child = spawn(this.options.command, this.options.args, { stdio: ['pipe', 'pipe', 'pipe'] });
+    this.child = child;
+
+    readline.createInterface({ input: child.stdout }).on('line', (line) => this.onLine(line));
+    readline.createInterface({ input: child.stderr }).on('line', (line) => {
+      console.error(`[python worker ${this.index}] ${line}`);
+    });
+    // Writes to a worker that just died fail with EPIPE; the exit handler rejects its requests
+    child.stdin.on('error', () => undefined);
+    child.on('error', (error) => this.onExit(child, error.message));
+    child.on('exit', (code, signal) => this.onExit(child, signal ? `signal ${signal}` : `code ${code}`));
+  }
+
+  private onLine(line: string) {
+    if (!line.trim()) {
+      return;
+    }
+
+    let message: { id?: number; result?: any };
+    try {
+      message = JSON.parse(line);
+    } catch {
+      console.error(`[python worker ${this.index}] ignoring non-JSON output: ${line}`);
+      return;
+    }
+
+    const request = message.id === undefined ? undefined : this.pending.get(message.id);
+    if (!request) {
+      // A late answer to a timed-out request frees one of the worker's threads
+      this.abandoned.delete(message.id as number);
+      return;
+    }
+    this.pending.delete(message.id as number);
+    clearTimeout(request.timer);
+    this.consecutiveRestarts = 0;
+    request.resolve(message.result);
+  }
+
+  private onExit(child: ChildProcessWithoutNullStreams, reason: string) {
+    // 'error' and 'exit' can both fire for the same process
+    if (this.child !== child) {
+      return;
+    }
+    this.child = null;
+
+    const error = new Error(`Python worker ${this.index} exited with ${reason}`);
+    this.failPending(error);
+
+    if (this.closed) {
+      return;
+    }
+    const delay = Math.min(this.options.restartDelayMs * 2 ** this.consecutiveRestarts, MAX_RESTART_DELAY_MS);
+    this.consecutiveRestarts += 1;
+    console.error(`${error.message}; restarting in ${delay}ms`);
+    setTimeout(() => {
+      if (!this.closed) {
+        this.start();
+      }
+    }, delay);
+  }
+}
+
+export class PythonWorkerPool {
+  private readonly workers: PythonWorker[];
+  private nextId = 1;
+
+  constructor(options: WorkerPoolOptions) {
+    const resolved: ResolvedOptions = {
+      command: options.command,
+      args: options.args,
+      size: Math.max(1, options.size ?? envInt('PYTHON_WORKER_POOL_SIZE', 2)),
+      requestTimeoutMs: options.requestTimeoutMs ?? envInt('PYTHON_WORKER_TIMEOUT_MS', 120000),
+      maxAbandoned: Math.max(1, options.maxAbandoned ?? envInt('PYTHON_WORKER_THREADS', 4)),
+      restartDelayMs: options.restartDelayMs ?? 1000,
+    };
+    this.workers = Array.from({ length: resolved.size }, (_, index) => new PythonWorker(index, resolved));
+  }
+
+  // Send a tool call to the running worker with the fewest requests in flight
+  call(toolName: string, params: Record<string, any> = {}): Promise<any> {
+    const running = this.workers.filter((worker) => worker.alive);
+    if (running.length === 0) {
+      return Promise.reject(new Error('No Python workers are running'));
+    }
+    const worker = running.reduce((best, candidate) => (candidate.inFlight < best.inFlight ? candidate : best));
+    return worker.send(this.nextId++, toolName, params);
+  }
+
+  close() {
+    for (const worker of this.workers) {
+      worker.close();
+    }
+  }
+}
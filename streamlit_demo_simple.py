@@ -2,6 +2,10 @@ import streamlit as st
 import os
 from agents.glue_catalog_agent import glue_agent
 from agents.unity_catalog_agent import unity_agent
+from tools.catalog_snapshot import persist_index
+from tools.glue_tools import glue_index, glue_sync
+from tools.unity_client import configure_unity_client, get_unity_client
+from tools.unity_tools import unity_index, unity_sync
 
 st.title("🗄️ Catalog Agents Demo")
 st.write("Query both AWS Glue and Unity catalogs deployed on AWS")
@@ -14,6 +18,19 @@ aws_region = st.sidebar.selectbox("AWS Region", ["us-east-1", "us-west-2", "eu-w
 # Set environment variables
 os.environ["AWS_DEFAULT_REGION"] = aws_region
 
+# Point the shared Unity client at the configured URL (keeps its connection pool otherwise)
+if get_unity_client().base_url != unity_url.rstrip("/"):
+    configure_unity_client(base_url=unity_url)
+
+@st.cache_resource
+def warm_start_catalog_indexes():
+    """Load the catalog snapshots saved on this host once per Streamlit process"""
+    persist_index(unity_index, sync=unity_sync)
+    persist_index(glue_index, sync=glue_sync)
+
+# The agents' tools answer from these indexes, which then refresh in the background
+warm_start_catalog_indexes()
+
 # Catalog selection
 catalog_choice = st.selectbox("Select Catalog", ["AWS Glue Catalog", "Unity Catalog", "Both Catalogs"])
 
@@ -34,8 +51,6 @@ if st.button("Execute Query"):
                     
                 elif catalog_choice == "Unity Catalog":
                     st.subheader("🔍 Unity Catalog Results")
-                    # Update Unity agent URL
-                    unity_agent.tools[0].unity_catalog_url = unity_url
                     result = unity_agent.run(query)
                     st.json(result.data)
                     
@@ -53,7 +68,6 @@ if st.button("Execute Query"):
                     with col2:
                         st.subheader("🔍 Unity Catalog")
                         try:
-                            unity_agent.tools[0].unity_catalog_url = unity_url
                             unity_result = unity_agent.run(query)
                             st.json(unity_result.data)
                         except Exception as e:
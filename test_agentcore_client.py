@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the AgentCore Runtime client.
+
+These tests run the runtime invoker against botocore's Stubber, so they need
+no AWS account. Run with `python -m pytest test_agentcore_client.py` or
+`python test_agentcore_client.py`.
+"""
+
+import asyncio
+import io
+import json
+import os
+
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from tools.agentcore_client import AgentCoreRuntime, AgentCoreToolError, create_agentcore_client, tool_result_value
+
+RUNTIME_ARN = "arn:aws:bedrock-agentcore:us-east-1:123456789012:runtime/unityCatalogMcp-abc123"
+
+
+def _request(request_id, tool_name, arguments):
+    payload = {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": tool_name, "arguments": arguments}
+    }
+    return {
+        "agentRuntimeArn": RUNTIME_ARN,
+        "contentType": "application/json",
+        "accept": "application/json, text/event-stream",
+        "payload": json.dumps(payload).encode("utf-8")
+    }
+
+
+def _response(request_id, value, event_stream=False):
+    body = json.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "result": {
+            "content": [{"type": "text", "text": json.dumps(value)}],
+            "structuredContent": {"result": value},
+            "isError": False
+        }
+    })
+    if event_stream:
+        body = f"event: message\ndata: {body}\n\n"
+    data = body.encode("utf-8")
+    return {
+        "response": StreamingBody(io.BytesIO(data), len(data)),
+        "contentType": "text/event-stream" if event_stream else "application/json",
+        "statusCode": 200
+    }
+
+
+def _runtime(client, **kwargs):
+    kwargs.setdefault("batch_window", 0.05)
+    return AgentCoreRuntime(RUNTIME_ARN, client=client, **kwargs)
+
+
+def test_single_call_is_sent_as_tools_call():
+    client = create_agentcore_client(region_name="us-east-1")
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            "invoke_agent_runtime",
+            _response(1, ["main.sales", "main.crm"], event_stream=True),
+            _request(1, "list_unity_databases_tool", {})
+        )
+        runtime = _runtime(client)
+        assert runtime.invoke("list_unity_databases_tool") == ["main.sales", "main.crm"]
+        stubber.assert_no_pending_responses()
+
+
+def test_calls_within_the_window_share_one_invocation():
+    client = create_agentcore_client(region_name="us-east-1")
+    calls = [
+        {"tool_name": "list_unity_tables_tool", "params": {"database_name": "main.sales"}},
+        {"tool_name": "search_unity_tables_by_name_tool", "params": {"name_pattern": "orders"}}
+    ]
+    with Stubber(client) as stubber:
+        # Only one invocation is stubbed: a second one would fail the test
+        stubber.add_response(
+            "invoke_agent_runtime",
+            _response(1, [{"result": ["orders", "returns"]}, {"error": "search failed"}]),
+            _request(1, "run_tool_batch", {"calls": calls})
+        )
+        runtime = _runtime(client, batch_window=1.0)
+        tables = runtime.submit("list_unity_tables_tool", {"database_name": "main.sales"})
+        search = runtime.submit("search_unity_tables_by_name_tool", {"name_pattern": "orders"})
+        runtime.flush()
+
+        assert tables.result(timeout=5) == ["orders", "returns"]
+        assert isinstance(search.exception(timeout=5), AgentCoreToolError)
+        stubber.assert_no_pending_responses()
+
+
+def test_full_batch_is_sent_without_waiting_for_the_window():
+    client = create_agentcore_client(region_name="us-east-1")
+    calls = [{"tool_name": "list_unity_tables_tool", "params": {"database_name": f"main.db_{i}"}} for i in range(2)]
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            "invoke_agent_runtime",
+            _response(1, [{"result": ["a"]}, {"result": ["b"]}]),
+            _request(1, "run_tool_batch", {"calls": calls})
+        )
+        runtime = _runtime(client, batch_window=60, max_batch_size=2)
+        futures = [runtime.submit(call["tool_name"], call["params"]) for call in calls]
+        assert [future.result(timeout=5) for future in futures] == [["a"], ["b"]]
+
+
+def test_ainvoke_and_service_errors():
+    client = create_agentcore_client(region_name="us-east-1")
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            "invoke_agent_runtime",
+            _response(1, {"name": "orders"}),
+            _request(1, "get_unity_table_details_tool", {"database_name": "main.sales", "table_name": "orders"})
+        )
+        stubber.add_client_error(
+            "invoke_agent_runtime",
+            service_error_code="ThrottlingException",
+            http_status_code=429
+        )
+        runtime = _runtime(client, batch_window=0)
+        details = asyncio.run(runtime.ainvoke(
+            "get_unity_table_details_tool", {"database_name": "main.sales", "table_name": "orders"}
+        ))
+        assert details == {"name": "orders"}
+
+        error = runtime.submit("list_unity_databases_tool").exception(timeout=5)
+        assert "ThrottlingException" in str(error)
+
+
+def _unstructured(*items):
+    return {"jsonrpc": "2.0", "id": 1, "result": {"content": [{"type": "text", "text": item} for item in items]}}
+
+
+def test_results_without_structured_content_stay_lists():
+    # One matching table must not be confused with a tool that returns a single object
+    assert tool_result_value(_unstructured(json.dumps({"database": "main.sales", "table": "orders"}))) == [
+        {"database": "main.sales", "table": "orders"}
+    ]
+    assert tool_result_value(_unstructured('"main.sales"', '"main.crm"')) == ["main.sales", "main.crm"]
+    assert tool_result_value(_unstructured()) == []
+    assert tool_result_value(_unstructured("not json")) == ["not json"]
+
+
+if __name__ == "__main__":
+    import pytest
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the on-disk catalog snapshots.
+
+These tests write snapshot files to a temporary directory and resume the
+Unity sync from them against the local stand-in server, so they need no Unity
+catalog. Run with `python -m pytest test_catalog_snapshot.py` or
+`python test_catalog_snapshot.py`.
+"""
+
+import struct
+
+import pytest
+
+from benchmarks.search_index import build_tables
+from benchmarks.unity_stub_server import UnityStubServer, build_metastore
+from tools import catalog_snapshot
+from tools.catalog_index import CatalogSnapshot
+from tools.catalog_snapshot import SnapshotFile, SnapshotFormatError, load_snapshot, read_header, write_snapshot
+from tools.unity_client import UnityClient
+from tools.unity_tools import UnityCatalogSync
+
+
+def _snapshot():
+    tables = build_tables(200, 6, seed=5)
+    tables[0]["description"] = "Straße addresses"
+    return CatalogSnapshot(sorted({table["database"] for table in tables}) + ["empty_db"], tables, loaded_at=1700000000.0)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "snapshots" / "unity.catsnap")
+
+
+def test_round_trip(path):
+    snapshot = _snapshot()
+    size = write_snapshot(path, snapshot, "unity")
+    assert size == len(open(path, "rb").read())
+
+    loaded = load_snapshot(path, "unity")
+    assert loaded.tables == snapshot.tables
+    assert loaded.list_databases() == snapshot.list_databases()
+    assert loaded.loaded_at == snapshot.loaded_at
+    assert loaded.search_by_column("customer") == snapshot.search_by_column("customer")
+
+    header = read_header(path)
+    assert header["table_count"] == len(snapshot.tables)
+    assert "sync" not in header
+    with SnapshotFile(path) as snapshot_file:
+        assert len(snapshot_file) == len(snapshot.tables)
+        assert snapshot_file.table(7) == snapshot.tables[7]
+        with pytest.raises(IndexError):
+            snapshot_file.table(len(snapshot.tables))
+
+
+def test_default_path_is_per_user(monkeypatch, tmp_path):
+    monkeypatch.delenv("CATALOG_SNAPSHOT_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert catalog_snapshot.snapshot_path("glue") == str(tmp_path / "catalog-snapshots" / "glue.catsnap")
+    monkeypatch.setenv("CATALOG_SNAPSHOT_DIR", "")
+    assert catalog_snapshot.snapshot_path("glue") is None
+
+
+@pytest.mark.parametrize("damage,message", [
+    (lambda data: data[:5], "truncated"),
+    (lambda data: data[:-3], "records are truncated"),
+    (lambda data: data[:-1] + bytes([data[-1] ^ 1]), "checksum"),
+    (lambda data: b"NOTSNAP\0" + data[8:], "Not a catalog snapshot"),
+    (lambda data: data[:8] + struct.pack("<H", 99) + data[10:], "version 99"),
+])
+def test_damaged_files_are_rejected(path, damage, message):
+    write_snapshot(path, _snapshot(), "unity")
+    data = open(path, "rb").read()
+    with open(path, "wb") as f:
+        f.write(damage(data))
+    with pytest.raises(SnapshotFormatError, match=message):
+        load_snapshot(path)
+
+
+def test_snapshot_of_another_catalog_is_rejected(path):
+    write_snapshot(path, _snapshot(), "glue")
+    with pytest.raises(SnapshotFormatError, match="glue"):
+        load_snapshot(path, "unity")
+
+
+@pytest.mark.parametrize("include_columns", [True, False], ids=["columns-in-listing", "details-per-table"])
+def test_unity_sync_resumes_from_the_saved_state(path, include_columns):
+    with UnityStubServer(build_metastore(2, 3, 10), include_columns_in_listing=include_columns) as stub:
+        client = UnityClient(base_url=stub.base_url)
+        first = UnityCatalogSync(client)
+        snapshot = first.sync()
+        write_snapshot(path, snapshot, "unity", first.state())
+
+        # A restarted process: the first refresh after loading the file re-reads no table
+        resumed = UnityCatalogSync(client)
+        loaded = load_snapshot(path, "unity", resumed)
+        assert resumed.last_sync["mode"] == "restored"
+        stub.reset_counts()
+        assert resumed.sync().tables == loaded.tables
+        assert resumed.last_sync["mode"] == "incremental"
+        assert resumed.last_sync["tables_updated"] == 0
+        assert stub.request_counts["table"] == 0
+        client.close()
+
+
+def test_invalid_sync_state_is_ignored(path):
+    snapshot = _snapshot()
+    write_snapshot(path, snapshot, "unity", {"syncs": 1, "schemas": {}})
+    sync = UnityCatalogSync()
+    assert load_snapshot(path, "unity", sync).tables == snapshot.tables
+    assert sync.syncs == 0 and sync.last_sync is None
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the single-flight call coalescing.
+
+These tests run concurrent calls of plain functions through SingleFlight, so
+they need no catalog. Run with `python -m pytest test_concurrency.py` or
+`python test_concurrency.py`.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tools.concurrency import SingleFlight, coalesce
+
+CALLERS = 8
+
+
+def _run_blocked(group, name, key, fn):
+    """Start CALLERS identical calls while the first one is held inside fn"""
+    started, release = threading.Event(), threading.Event()
+
+    def held():
+        started.set()
+        release.wait(5)
+        return fn()
+
+    with ThreadPoolExecutor(CALLERS) as pool:
+        leader = pool.submit(group.do, name, key, held)
+        assert started.wait(5)
+        followers = [pool.submit(group.do, name, key, held) for _ in range(CALLERS - 1)]
+        # Wait until every follower has joined the running call
+        while group.stats()[name]["calls"] < CALLERS:
+            time.sleep(0.01)
+        release.set()
+        return [leader] + followers
+
+
+def test_concurrent_identical_calls_run_once():
+    group = SingleFlight(enabled=True)
+    calls = []
+    futures = _run_blocked(group, "tool", "key", lambda: calls.append(1) or {"tables": ["orders"]})
+    results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert results == [{"tables": ["orders"]}] * CALLERS
+    # Each follower gets its own copy
+    results[1]["tables"].append("changed")
+    assert results[2] == {"tables": ["orders"]}
+    assert group.stats() == {"tool": {"calls": CALLERS, "executed": 1, "coalesced": CALLERS - 1}}
+
+
+def test_followers_receive_the_leaders_exception():
+    group = SingleFlight(enabled=True)
+
+    def fail():
+        raise ConnectionError("down")
+
+    futures = _run_blocked(group, "tool", "key", fail)
+    for future in futures:
+        with pytest.raises(ConnectionError, match="down"):
+            future.result()
+
+    # The failed call is not remembered
+    assert group.do("tool", "key", lambda: "ok") == "ok"
+
+
+def test_different_keys_and_sequential_calls_are_not_coalesced():
+    group = SingleFlight(enabled=True)
+    assert [group.do("tool", key, lambda: key) for key in ("a", "b", "a")] == ["a", "b", "a"]
+    assert group.stats()["tool"] == {"calls": 3, "executed": 3, "coalesced": 0}
+    group.reset_stats()
+    assert group.stats() == {}
+
+
+def test_disabled_group_runs_every_call():
+    group = SingleFlight(enabled=False)
+    calls = []
+    futures = _run_blocked(group, "tool", "key", lambda: calls.append(1))
+    for future in futures:
+        future.result()
+    assert len(calls) == CALLERS
+
+
+def test_coalesce_keys_on_normalized_arguments():
+    group = SingleFlight(enabled=True)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    @coalesce(group)
+    def list_tables(database_name: str, limit: int = 10):
+        calls.append((database_name, limit))
+        started.set()
+        release.wait(5)
+        return len(calls)
+
+    with ThreadPoolExecutor(3) as pool:
+        leader = pool.submit(list_tables, "sales")
+        assert started.wait(5)
+        followers = [pool.submit(list_tables, "sales", 10), pool.submit(list_tables, database_name="sales", limit=10)]
+        while group.stats()["list_tables"]["calls"] < 3:
+            time.sleep(0.01)
+        release.set()
+        assert [future.result() for future in [leader] + followers] == [1, 1, 1]
+    assert calls == [("sales", 10)]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the AWS Glue catalog tools.
+
+These tests run the Glue tools against botocore's Stubber or a minimal
+in-process stand-in, so they need no AWS account. Run with `python -m pytest test_glue_tools.py` or `python test_glue_tools.py`.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from botocore.exceptions import ClientError, ParamValidationError
+from botocore.stub import Stubber
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+from tools import glue_client, glue_tools
+from tools.catalog_index import CatalogIndex, CatalogSnapshot
+from tools.catalog_snapshot import load_snapshot, write_snapshot
+from tools.glue_client import configure_glue_client, create_glue_client
+from tools.resilience import CircuitBreaker
+
+
+@pytest.fixture(autouse=True)
+def isolated_glue_client(monkeypatch):
+    # The stubbed calls below must reach the client rather than the catalog
+    # snapshot, and the process-wide client is restored after each test
+    monkeypatch.setattr(glue_tools.glue_index, "enabled", False)
+    monkeypatch.setattr(glue_client, "_client", glue_client._client)
+    monkeypatch.setattr(glue_client, "_client_settings", glue_client._client_settings)
+
+
+def _table(database_name, table_name, columns=()):
+    return {
+        "Name": table_name,
+        "DatabaseName": database_name,
+        "StorageDescriptor": {
+            "Columns": [{"Name": column, "Type": "string"} for column in columns]
+        }
+    }
+
+
+def _stubbed_client():
+    return Stubber(configure_glue_client(region_name="us-east-1"))
+
+
+def test_list_glue_databases_reads_every_page():
+    with _stubbed_client() as stubber:
+        stubber.add_response(
+            "get_databases",
+            {"DatabaseList": [{"Name": "db_1"}, {"Name": "db_2"}], "NextToken": "page-2"},
+            {"MaxResults": glue_tools.PAGE_SIZE}
+        )
+        stubber.add_response(
+            "get_databases",
+            {"DatabaseList": [{"Name": "db_3"}]},
+            {"MaxResults": glue_tools.PAGE_SIZE, "NextToken": "page-2"}
+        )
+        assert glue_tools.list_glue_databases() == ["db_1", "db_2", "db_3"]
+        stubber.assert_no_pending_responses()
+
+
+def test_list_glue_tables_stops_paging_at_limit():
+    with _stubbed_client() as stubber:
+        stubber.add_response(
+            "get_tables",
+            {"TableList": [_table("sales", "orders"), _table("sales", "returns")], "NextToken": "page-2"},
+            {"DatabaseName": "sales", "MaxResults": glue_tools.PAGE_SIZE}
+        )
+        # Only one page is stubbed: a second get_tables call would fail the test
+        assert glue_tools.list_glue_tables("sales", limit=2) == ["orders", "returns"]
+
+
+def test_search_tables_by_name_follows_next_token():
+    with _stubbed_client() as stubber:
+        stubber.add_response(
+            "search_tables",
+            {"TableList": [_table("sales", "customer_orders")], "NextToken": "page-2"},
+            {"SearchText": "customer", "MaxResults": glue_tools.PAGE_SIZE}
+        )
+        stubber.add_response(
+            "search_tables",
+            {"TableList": [_table("crm", "customer_profile")]},
+            {"SearchText": "customer", "MaxResults": glue_tools.PAGE_SIZE, "NextToken": "page-2"}
+        )
+        assert glue_tools.search_tables_by_name("customer") == [
+            {"database": "sales", "table": "customer_orders"},
+            {"database": "crm", "table": "customer_profile"}
+        ]
+        stubber.assert_no_pending_responses()
+
+
+def test_search_tables_by_name_ignores_full_text_matches_outside_the_name():
+    with _stubbed_client() as stubber:
+        described = dict(_table("crm", "profiles"), Description="One row per customer")
+        stubber.add_response(
+            "search_tables",
+            {"TableList": [_table("sales", "customer_orders"), described, _table("web", "clicks", ["customer_id"])]},
+            {"SearchText": "customer", "MaxResults": glue_tools.PAGE_SIZE}
+        )
+        assert glue_tools.search_tables_by_name("customer", fresh=True) == [
+            {"database": "sales", "table": "customer_orders"}
+        ]
+
+    with _stubbed_client() as stubber:
+        stubber.add_response(
+            "search_tables",
+            {"TableList": [_table("sales", "customer_orders"), described]},
+            {"SearchText": "customer", "MaxResults": glue_tools.PAGE_SIZE}
+        )
+        assert glue_tools.search_tables_by_name("customer", fresh=True, include_comments=True) == [
+            {"database": "sales", "table": "customer_orders"},
+            {"database": "crm", "table": "profiles"}
+        ]
+
+
+def test_search_tables_by_column_filters_columns_and_honours_limit():
+    with _stubbed_client() as stubber:
+        stubber.add_response(
+            "search_tables",
+            {
+                "TableList": [
+                    _table("sales", "orders", ["order_id", "customer_id"]),
+                    _table("sales", "customer_notes", ["note"]),
+                    _table("crm", "profiles", ["customer_id", "customer_name"])
+                ],
+                "NextToken": "page-2"
+            },
+            {"SearchText": "customer", "MaxResults": glue_tools.PAGE_SIZE}
+        )
+        assert glue_tools.search_tables_by_column("customer", limit=2) == [
+            {"database": "sales", "table": "orders", "matching_columns": ["customer_id"]},
+            {"database": "crm", "table": "profiles", "matching_columns": ["customer_id", "customer_name"]}
+        ]
+
+
+def test_invalid_parameters_do_not_hold_the_half_open_probe():
+    breaker = CircuitBreaker("glue", min_calls=1, open_seconds=0)
+    breaker.record(False)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    with Stubber(create_glue_client(region_name="us-east-1", breaker=breaker)) as stubber:
+        stubber.add_response("get_table", {"Table": _table("sales", "orders")})
+        # Parameter validation fails before the call is admitted, leaving the probe to the next call
+        with pytest.raises(ParamValidationError):
+            stubber.client.get_table(DatabaseName="sales")
+        assert stubber.client.get_table(DatabaseName="sales", Name="orders")["Table"]["Name"] == "orders"
+        stubber.assert_no_pending_responses()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+class _ThrottlingGlueClient:
+    """Minimal Glue stand-in that throttles the first get_tables call per database"""
+
+    def __init__(self, databases):
+        self.databases = databases
+        self.throttled = set()
+
+    def get_databases(self, **kwargs):
+        return {"DatabaseList": [{"Name": name} for name in self.databases]}
+
+    def get_tables(self, DatabaseName, **kwargs):
+        if DatabaseName not in self.throttled:
+            self.throttled.add(DatabaseName)
+            raise ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "GetTables")
+        return {"TableList": [_table(DatabaseName, name, ["id"]) for name in self.databases[DatabaseName]]}
+
+
+def test_crawl_glue_catalog_retries_throttles_and_reports_stats():
+    client = _ThrottlingGlueClient({"sales": ["orders", "returns"], "crm": ["profiles"]})
+    stats = glue_tools.GlueCrawlStats()
+    tables = list(glue_tools.crawl_glue_catalog(client=client, stats=stats, requests_per_second=100, burst=100))
+
+    assert [(table["database"], table["name"]) for table in tables] == [
+        ("sales", "orders"), ("sales", "returns"), ("crm", "profiles")
+    ]
+    summary = stats.summary()
+    assert summary["total_tables"] == 3
+    assert summary["total_throttles"] == 2
+    assert summary["databases"]["sales"]["pages"] == 1
+    assert summary["failed_databases"] == []
+
+
+class _VersionedGlueClient:
+    """Minimal Glue stand-in that tracks table versions and counts calls"""
+
+    def __init__(self, databases):
+        self.databases = {}
+        self.calls = []
+        for database_name, table_names in databases.items():
+            self.create_database(database_name)
+            for table_name in table_names:
+                self.put_table(database_name, table_name)
+
+    def create_database(self, database_name):
+        self.databases[database_name] = {}
+
+    def put_table(self, database_name, table_name, columns=("id",)):
+        previous = self.databases[database_name].get(table_name)
+        table = _table(database_name, table_name, columns)
+        table["UpdateTime"] = datetime.now(timezone.utc) + timedelta(seconds=1)
+        table["VersionId"] = str(int(previous["VersionId"]) + 1) if previous else "0"
+        self.databases[database_name][table_name] = table
+
+    def get_databases(self, **kwargs):
+        self.calls.append(("get_databases", None))
+        return {"DatabaseList": [{"Name": name} for name in self.databases]}
+
+    def get_tables(self, DatabaseName, AttributesToGet=None, **kwargs):
+        self.calls.append(("get_tables_names" if AttributesToGet else "get_tables", DatabaseName))
+        tables = list(self.databases[DatabaseName].values())
+        if AttributesToGet:
+            tables = [{"Name": table["Name"]} for table in tables]
+        return {"TableList": tables}
+
+    def get_table(self, DatabaseName, Name):
+        self.calls.append(("get_table", f"{DatabaseName}.{Name}"))
+        return {"Table": self.databases[DatabaseName][Name]}
+
+    def search_tables(self, SortCriteria, **kwargs):
+        self.calls.append(("search_tables", None))
+        assert SortCriteria == [{"FieldName": "UpdateTime", "Sort": "DESC"}]
+        tables = [table for database in self.databases.values() for table in database.values()]
+        return {"TableList": sorted(tables, key=lambda table: table["UpdateTime"], reverse=True)}
+
+
+def _synced_tables(snapshot):
+    return {(table["database"], table["name"]): [column["name"] for column in table["columns"]]
+            for table in snapshot.tables}
+
+
+def test_incremental_sync_applies_only_changes():
+    client = _VersionedGlueClient({"sales": ["orders", "returns"], "crm": ["profiles"], "old": ["legacy"]})
+    sync = glue_tools.GlueCatalogSync(client=client, lookback_seconds=0, full_every=0, sweep_every=1)
+    sync.sync()
+    assert sync.last_sync["mode"] == "full"
+
+    # Nothing changed: no table metadata is read again
+    client.calls.clear()
+    sync.sync()
+    assert sync.last_sync["mode"] == "incremental"
+    assert sync.last_sync["tables_updated"] == 0
+    assert {name for name, _ in client.calls} == {"get_databases", "search_tables", "get_tables_names"}
+
+    client.put_table("sales", "orders", columns=("id", "customer_id"))
+    client.put_table("crm", "leads")
+    del client.databases["sales"]["returns"]
+    del client.databases["old"]
+    client.create_database("marketing")
+    client.put_table("marketing", "campaigns")
+    client.calls.clear()
+    snapshot = sync.sync()
+
+    assert _synced_tables(snapshot) == {
+        ("sales", "orders"): ["id", "customer_id"],
+        ("crm", "leads"): ["id"],
+        ("crm", "profiles"): ["id"],
+        ("marketing", "campaigns"): ["id"]
+    }
+    assert snapshot.list_databases() == ["sales", "crm", "marketing"]
+    assert sync.last_sync["databases_added"] == 1
+    assert sync.last_sync["databases_removed"] == 1
+    assert sync.last_sync["tables_deleted"] == 2
+    # Only the new database is listed in full
+    assert [target for name, target in client.calls if name == "get_tables"] == ["marketing"]
+
+
+def test_incremental_sync_fetches_tables_missing_from_search():
+    client = _VersionedGlueClient({"sales": ["orders"]})
+    sync = glue_tools.GlueCatalogSync(client=client, lookback_seconds=0, full_every=0, sweep_every=1)
+    sync.sync()
+
+    # A table created long enough ago that the search stops before it, as if it was indexed late
+    client.put_table("sales", "returns")
+    client.databases["sales"]["returns"]["UpdateTime"] -= timedelta(days=1)
+    client.calls.clear()
+    snapshot = sync.sync()
+    assert ("sales", "returns") in _synced_tables(snapshot)
+    assert ("get_table", "sales.returns") in client.calls
+
+
+def test_incremental_sync_sweeps_table_names_every_sweep_every_syncs():
+    client = _VersionedGlueClient({"sales": ["orders", "returns"]})
+    sync = glue_tools.GlueCatalogSync(client=client, lookback_seconds=0, full_every=0, sweep_every=3)
+    sync.sync()
+    del client.databases["sales"]["returns"]
+
+    for _ in range(2):
+        client.calls.clear()
+        snapshot = sync.sync()
+        assert ("get_tables_names", "sales") not in client.calls
+        assert ("sales", "returns") in _synced_tables(snapshot)
+
+    client.calls.clear()
+    snapshot = sync.sync()
+    assert ("get_tables_names", "sales") in client.calls
+    assert _synced_tables(snapshot) == {("sales", "orders"): ["id"]}
+    assert sync.last_sync["tables_deleted"] == 1
+
+
+def test_incremental_sync_resumes_from_a_saved_snapshot(tmp_path):
+    client = _VersionedGlueClient({"sales": ["orders", "returns"], "crm": ["profiles"]})
+    first = glue_tools.GlueCatalogSync(client=client, lookback_seconds=0, full_every=0)
+    path = str(tmp_path / "glue.catsnap")
+    write_snapshot(path, first.sync(), "glue", first.state())
+
+    # A restarted process: the first refresh after loading the file reads only the changes
+    client.put_table("sales", "orders", columns=("id", "customer_id"))
+    resumed = glue_tools.GlueCatalogSync(client=client, lookback_seconds=0, full_every=0)
+    load_snapshot(path, "glue", resumed)
+    client.calls.clear()
+    snapshot = resumed.sync()
+    assert resumed.last_sync["mode"] == "incremental"
+    assert resumed.last_sync["tables_updated"] == 1
+    assert not [call for call in client.calls if call[0] == "get_tables"]
+    assert _synced_tables(snapshot) == {
+        ("sales", "orders"): ["id", "customer_id"], ("sales", "returns"): ["id"], ("crm", "profiles"): ["id"]
+    }
+
+
+def test_incremental_sync_falls_back_to_a_full_crawl():
+    client = _VersionedGlueClient({"sales": ["orders"]})
+    sync = glue_tools.GlueCatalogSync(client=client, lookback_seconds=0, full_every=0)
+    sync.sync()
+
+    def failing_search(**kwargs):
+        raise ClientError({"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "SearchTables")
+
+    client.search_tables = failing_search
+    client.put_table("sales", "returns")
+    snapshot = sync.sync()
+    assert sync.last_sync["mode"] == "full"
+    assert ("sales", "returns") in _synced_tables(snapshot)
+
+
+def test_table_details_from_the_snapshot_are_copies(monkeypatch, table):
+    index = CatalogIndex("glue", loader=lambda: None, enabled=True)
+    index.set_snapshot(CatalogSnapshot(["sales"], [table("sales", "orders", ["order_id"])]))
+    monkeypatch.setattr(glue_tools, "glue_index", index)
+    details = glue_tools.get_table_details("sales", "orders")
+    details["columns"][0]["name"] = "changed"
+    details["columns"].append({"name": "added", "type": "string", "comment": ""})
+    assert index.current.get_table("sales", "orders") == table("sales", "orders", ["order_id"])
+    index.stop()
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the intent router's fast path.
+
+These tests call the router with plain functions standing in for the catalog
+tools, so they need no catalog and no model. Run with
+`python -m pytest test_intent_router.py` or `python test_intent_router.py`.
+"""
+
+import json
+
+import pytest
+
+from agents.intent_router import CatalogRoutes, FastPathAgent, parse_intent
+
+
+@pytest.mark.parametrize("query,pattern,match", [
+    ("find tables matching sales_202?", "sales_202?", "glob"),
+    ("find tables named sales_*", "sales_*", "glob"),
+    ("which tables have columns named customer_id?", "customer_id", None),
+    ("find tables named 'orders'?", "orders", None),
+    ("Find tables with 'customer' in the name.", "customer", None),
+])
+def test_trailing_question_mark(query, pattern, match):
+    intent = parse_intent(query)
+    key = "column_pattern" if intent.name == "search_tables_by_column" else "name_pattern"
+    assert intent.params[key] == pattern
+    assert intent.params.get("match") == match
+
+
+def test_questions_without_patterns_are_recognised():
+    assert parse_intent("what are the databases?").name == "list_databases"
+    assert parse_intent("list all databases?").name == "list_databases"
+
+
+class _FallbackAgent:
+    def __call__(self, prompt=None, **kwargs):
+        return "model"
+
+
+def _routes(search_tables_by_name):
+    def unused(**kwargs):
+        raise AssertionError("unexpected tool call")
+
+    return CatalogRoutes("Test", unused, unused, unused, search_tables_by_name, unused)
+
+
+def test_match_is_passed_to_tools_that_take_it():
+    calls = []
+
+    def search_tables_by_name(name_pattern: str, match: str = "substring"):
+        calls.append((name_pattern, match))
+        return [{"database": "sales", "table": "sales_2024"}]
+
+    agent = FastPathAgent(_FallbackAgent(), unity=_routes(search_tables_by_name), enabled=True)
+    result = agent("find tables matching sales_202?")
+    assert calls == [("sales_202?", "glob")]
+    assert json.loads(result.message["content"][0]["text"])["results"] == [{"database": "sales", "table": "sales_2024"}]
+
+
+def test_glob_queries_go_to_the_model_when_the_tool_cannot_match_globs():
+    calls = []
+
+    def remote_search(**kwargs):
+        calls.append(kwargs)
+        return []
+
+    agent = FastPathAgent(_FallbackAgent(), unity=_routes(remote_search), enabled=True)
+    assert agent("find tables matching sales_*") == "model"
+    assert calls == []
+
+    agent("find tables named orders")
+    assert calls == [{"name_pattern": "orders"}]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the BM25 field boosts.
+
+Ranking, index updates and top_k are tested for every index in
+test_semantic_index.py; these tests cover what only the BM25 index does.
+Run with `python -m pytest test_ranked_search.py` or `python test_ranked_search.py`.
+"""
+
+import pytest
+
+from tools.ranked_search import FIELDS, BM25Index
+
+
+@pytest.fixture
+def revenue_tables(table):
+    # One table is named after the word, the other only has it as a column
+    return [table("finance", "revenue", ["id", "amount"]), table("finance", "ledger", ["id", "revenue"])]
+
+
+def _ranked_names(index, tables, query):
+    index.sync(tables)
+    return [result["table"] for result in index.search([query])[0]]
+
+
+def test_partial_words_do_not_match(ranking_tables):
+    assert _ranked_names(BM25Index("test"), ranking_tables, "cust") == []
+
+
+def test_boosts_decide_which_field_ranks_first(revenue_tables):
+    assert _ranked_names(BM25Index("test"), revenue_tables, "revenue") == ["revenue", "ledger"]
+    assert _ranked_names(BM25Index("test", boosts={"column": 10}), revenue_tables, "revenue") == ["ledger", "revenue"]
+
+
+def test_boosts_can_be_set_in_the_environment(monkeypatch, revenue_tables):
+    monkeypatch.setenv("BM25_BOOST_COLUMN", "10")
+    assert _ranked_names(BM25Index("test"), revenue_tables, "revenue") == ["ledger", "revenue"]
+    # Explicit boosts take precedence over the environment
+    assert _ranked_names(BM25Index("test", boosts={"column": 1}), revenue_tables, "revenue") == ["revenue", "ledger"]
+
+
+def test_unknown_boost_fields_are_rejected():
+    with pytest.raises(ValueError, match="title") as error:
+        BM25Index("test", boosts={"name": 2, "title": 2})
+    assert ", ".join(FIELDS) in str(error.value)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
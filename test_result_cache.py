@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the tool result cache.
+
+These tests drive ResultCache with plain functions and a fake clock, so they
+need no catalog. Run with `python -m pytest test_result_cache.py` or
+`python test_result_cache.py`.
+"""
+
+import threading
+
+import pytest
+
+from tools import result_cache
+from tools.result_cache import ResultCache, cached, split_stale
+
+UNAVAILABLE = {"error": "ServiceUnavailable", "error_message": "The catalog is down"}
+NOT_FOUND = {"error": "TableNotFound", "error_message": "No such table"}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(result_cache.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def cache():
+    return ResultCache(
+        "test",
+        ttls={"tool": 10},
+        max_stale=100,
+        negative_ttl=5,
+        revalidate_timeout=0.2,
+        is_failure=lambda result: result is UNAVAILABLE,
+        is_not_found=lambda result: result is NOT_FOUND,
+        enabled=True
+    )
+
+
+class _Upstream:
+    """Returns the queued results in order and counts the calls"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def test_fresh_results_are_served_as_copies(clock, cache):
+    upstream = _Upstream({"columns": ["id"]})
+    first = cache.get_or_call("tool", "key", upstream)
+    first["columns"].append("changed")
+    clock.now += 9
+    assert cache.get_or_call("tool", "key", upstream) == {"columns": ["id"]}
+    assert upstream.calls == 1
+    assert cache.stats()["tool"]["hits"] == 1
+
+
+@pytest.mark.parametrize("failure,reason", [
+    (UNAVAILABLE, "The catalog is down"),
+    (ConnectionError("refused"), "The test catalog call failed: refused")
+], ids=["failure-result", "exception"])
+def test_expired_results_are_served_stale_when_the_upstream_fails(clock, cache, failure, reason):
+    upstream = _Upstream(["a", "b"], failure, ["a", "b", "c"])
+    cache.get_or_call("tool", "key", upstream)
+    clock.now += 30
+
+    result, marker = split_stale(cache.get_or_call("tool", "key", upstream))
+    assert result == ["a", "b"]
+    assert marker == {"stale": True, "stale_age_seconds": 30.0, "stale_reason": reason}
+    assert cache.stats()["tool"]["stale"] == 1
+
+    # The next call revalidates again and gets the fresh result
+    assert cache.get_or_call("tool", "key", upstream) == ["a", "b", "c"]
+
+
+def test_slow_revalidation_serves_stale_and_stores_the_late_answer(clock, cache):
+    release = threading.Event()
+    calls = []
+
+    def upstream():
+        calls.append(1)
+        if len(calls) > 1:
+            release.wait(5)
+        return len(calls)
+
+    assert cache.get_or_call("tool", "key", upstream) == 1
+    clock.now += 30
+    result, marker = split_stale(cache.get_or_call("tool", "key", upstream))
+    assert result == 1
+    assert "did not answer within 0.2 seconds" in marker["stale_reason"]
+
+    release.set()
+    cache._refreshers.shutdown(wait=True)
+    assert cache.get_or_call("tool", "key", upstream) == 2
+    assert len(calls) == 2
+
+
+def test_results_past_max_stale_are_not_served(clock, cache):
+    upstream = _Upstream(["a"], UNAVAILABLE)
+    cache.get_or_call("tool", "key", upstream)
+    clock.now += 10 + 100 + 1
+    assert cache.get_or_call("tool", "key", upstream) is UNAVAILABLE
+
+
+def test_not_found_results_are_cached_for_the_negative_ttl(clock, cache):
+    upstream = _Upstream(NOT_FOUND, UNAVAILABLE)
+    assert cache.get_or_call("tool", "missing", upstream) == NOT_FOUND
+    clock.now += 4
+    assert cache.get_or_call("tool", "missing", upstream) == NOT_FOUND
+    assert upstream.calls == 1
+    assert cache.stats()["tool"]["negative_hits"] == 1
+
+    # An expired not-found result is never served stale
+    clock.now += 2
+    assert cache.get_or_call("tool", "missing", upstream) is UNAVAILABLE
+    assert len(cache) == 0
+
+
+def test_other_errors_are_not_cached(clock, cache):
+    error = {"error": "InvalidInput", "error_message": "Bad name"}
+    upstream = _Upstream(error, error)
+    cache.get_or_call("tool", "key", upstream)
+    cache.get_or_call("tool", "key", upstream)
+    assert upstream.calls == 2
+
+
+def test_least_recently_used_results_are_evicted(clock):
+    cache = ResultCache("test", max_entries=2, enabled=True)
+    for key in ("a", "b", "a", "c"):
+        cache.get_or_call("tool", key, lambda: key)
+    assert len(cache) == 2
+    assert cache.stats()["tool"]["evictions"] == 1
+    assert cache.get_or_call("tool", "b", lambda: "again") == "again"
+
+
+def test_cached_keys_on_arguments_and_fresh_skips_the_cache(clock, cache):
+    calls = []
+
+    @cached(cache)
+    def tool(name: str, limit: int = 10, fresh: bool = False):
+        calls.append((name, limit))
+        return len(calls)
+
+    assert tool("orders") == tool("orders", 10) == tool(name="orders", limit=10) == 1
+    assert tool("orders", 5) == 2
+    assert tool("orders", fresh=True) == 3
+    assert tool("orders") == 3
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
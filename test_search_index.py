@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the catalog search index.
+
+These tests compare the n-gram index searches of a catalog snapshot with a
+linear scan over every table and column, in every match mode. Run with
+`python -m pytest test_search_index.py` or `python test_search_index.py`.
+"""
+
+import fnmatch
+import re
+
+import pytest
+
+from benchmarks.search_index import build_tables
+from tools.catalog_index import CatalogSnapshot
+
+
+def _tables():
+    tables = build_tables(400, 12, seed=3)
+    # Mixed case, short names, empty and non-ASCII text, and descriptions for include_comments
+    tables[0]["name"] = "Customer_Orders"
+    tables[1]["name"] = "a"
+    tables[2]["description"] = "Daily SALES totals per store"
+    tables[3]["description"] = "Straße addresses"
+    tables[4]["columns"][0] = {"name": "ID", "type": "bigint", "comment": "Primary KEY"}
+    tables[5]["columns"][1] = {"name": "sales_2024", "type": "string", "comment": None}
+    tables[6]["columns"] = []
+    return tables
+
+
+TABLES = _tables()
+SNAPSHOT = CatalogSnapshot(sorted({table["database"] for table in TABLES}), TABLES)
+
+
+def _matches(pattern, match, text):
+    text = (text or "").lower()
+    if match == "substring":
+        return pattern.lower() in text
+    if match == "prefix":
+        return text.startswith(pattern.lower())
+    if match == "glob":
+        return fnmatch.fnmatchcase(text, pattern.lower())
+    return re.search(pattern, text, re.IGNORECASE) is not None
+
+
+def _scan_names(pattern, match, include_comments):
+    return [
+        {"database": table["database"], "table": table["name"]}
+        for table in TABLES
+        if _matches(pattern, match, table["name"])
+        or (include_comments and _matches(pattern, match, table.get("description")))
+    ]
+
+
+def _scan_columns(pattern, match, include_comments):
+    results = []
+    for table in TABLES:
+        matching_columns = [
+            column["name"] for column in table["columns"]
+            if _matches(pattern, match, column["name"])
+            or (include_comments and _matches(pattern, match, column.get("comment")))
+        ]
+        if matching_columns:
+            results.append({"database": table["database"], "table": table["name"], "matching_columns": matching_columns})
+    return results
+
+
+QUERIES = [
+    ("substring", "customer"), ("substring", "CUSTOMER_ID"), ("substring", "_"), ("substring", "a"),
+    ("substring", "id"), ("substring", "sales"), ("substring", "straße"), ("substring", "no_such_text"),
+    ("substring", ""),
+    ("prefix", "customer"), ("prefix", "Loyalty_"), ("prefix", "a"), ("prefix", "id"),
+    ("glob", "*_id"), ("glob", "customer_*_code"), ("glob", "sales_202?"), ("glob", "[a-c]*_pct"),
+    ("glob", "*"), ("glob", "?"),
+    ("regex", r"^loyalty_\w+_id$"), ("regex", r"(tax|vendor)_amount"), ("regex", r"\d{4}"),
+    ("regex", r"primary\s+key"), ("regex", r"s_[0-9]+$"), ("regex", r"^.$")
+]
+
+
+@pytest.mark.parametrize("include_comments", [False, True])
+@pytest.mark.parametrize("match,pattern", QUERIES)
+def test_name_search_matches_linear_scan(match, pattern, include_comments):
+    assert SNAPSHOT.search_by_name(pattern, match=match, include_comments=include_comments) == \
+        _scan_names(pattern, match, include_comments)
+
+
+@pytest.mark.parametrize("include_comments", [False, True])
+@pytest.mark.parametrize("match,pattern", QUERIES)
+def test_column_search_matches_linear_scan(match, pattern, include_comments):
+    assert SNAPSHOT.search_by_column(pattern, match=match, include_comments=include_comments) == \
+        _scan_columns(pattern, match, include_comments)
+
+
+def test_limit_returns_the_first_matches():
+    expected = _scan_columns("customer", "substring", False)
+    assert len(expected) > 3
+    assert SNAPSHOT.search_by_column("customer", limit=3) == expected[:3]
+    assert SNAPSHOT.search_by_name("_", limit=3) == _scan_names("_", "substring", False)[:3]
+
+
+def test_invalid_patterns_are_rejected():
+    with pytest.raises(ValueError):
+        SNAPSHOT.search_by_column("(unclosed", match="regex")
+    with pytest.raises(ValueError):
+        SNAPSHOT.search_by_name("customer", match="fuzzy")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the ranked table indexes.
+
+These tests rank a small hand-written catalog (see conftest.py) with both
+TableVectorIndex implementations, the TF-IDF SemanticIndex and the BM25Index,
+so they need no catalog and no model. Run with
+`python -m pytest test_semantic_index.py` or `python test_semantic_index.py`.
+"""
+
+import pytest
+
+from tools.ranked_search import BM25Index
+from tools.semantic_index import DEFAULT_TOP_K, MAX_TOP_K, SemanticIndex
+
+
+@pytest.fixture(params=[SemanticIndex, BM25Index])
+def index(request, ranking_tables):
+    index = request.param("test")
+    index.sync(ranking_tables)
+    return index
+
+
+def _names(results):
+    return [result["table"] for result in results]
+
+
+def test_results_are_ranked_best_first(index):
+    results = index.search(["customer churn"])[0]
+    # SemanticIndex also returns weak trigram matches further down
+    assert _names(results)[:3] == ["customer_churn", "customers", "orders"]
+    scores = [result["score"] for result in results]
+    assert scores == sorted(scores, reverse=True)
+    assert results[0]["matching_columns"] == ["customer_id", "churn_date"]
+
+
+def test_batched_queries_match_single_queries(index):
+    queries = ["customer churn", "invoice amount", "shipment carrier status", "zzz qqq"]
+    assert index.search(queries, 3) == [index.search([query], 3)[0] for query in queries]
+    assert index.search(["zzz qqq"]) == [[]]
+
+
+def test_upsert_remove_and_sync_change_the_results(index, ranking_tables, table):
+    assert _names(index.search(["carrier"], 1)[0]) == ["shipments"]
+
+    index.upsert(("sales", "orders"), table("sales", "orders", ["order_id", "carrier"], "Orders and their carrier"))
+    assert _names(index.search(["carrier"], 2)[0]) == ["orders", "shipments"]
+
+    assert index.remove(("ops", "shipments"))
+    assert not index.remove(("ops", "shipments"))
+    assert "shipments" not in _names(index.search(["carrier"])[0])
+
+    assert index.sync(ranking_tables[:2]) == {"updated": 0, "removed": 2}
+    assert len(index) == 2
+    assert _names(index.search(["carrier customer"])[0]) == ["customers", "customer_churn"]
+
+
+@pytest.mark.parametrize("index_class", [SemanticIndex, BM25Index])
+@pytest.mark.parametrize("top_k,expected", [(1, 1), (3, 3), (0, DEFAULT_TOP_K), (-5, 1), (10 * MAX_TOP_K, MAX_TOP_K)])
+def test_top_k_is_clamped(index_class, top_k, expected, table):
+    index = index_class("test")
+    index.sync([table("db", f"metrics_{position}", ["metric_value"]) for position in range(MAX_TOP_K + 20)])
+    assert len(index.search(["metric"], top_k)[0]) == expected
+
+
+def test_partial_words_match_through_name_trigrams(ranking_tables):
+    index = SemanticIndex("test")
+    index.sync(ranking_tables)
+    assert _names(index.search(["cust"], 2)[0]) == ["customers", "customer_churn"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
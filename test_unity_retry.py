@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for retrying Unity catalog requests.
+
+These tests run the Unity client against the local stand-in server with
+injected faults, so they need no Unity catalog. Run with
+`python -m pytest test_unity_retry.py` or `python test_unity_retry.py`.
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from benchmarks.unity_stub_server import UnityStubServer, build_metastore
+from tools import unity_client as unity_client_module
+from tools import unity_tools
+from tools.resilience import CircuitBreaker, RetryPolicy
+from tools.unity_client import UnityClient, retry_after_seconds
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with UnityStubServer(build_metastore(catalogs=1, schemas_per_catalog=1, tables_per_schema=2)) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def reset_stub(stub):
+    stub.clear_faults()
+    stub.reset_counts()
+    yield
+    stub.clear_faults()
+
+
+def _policy(**kwargs):
+    kwargs.setdefault("max_attempts", 4)
+    kwargs.setdefault("base_delay", 0.01)
+    kwargs.setdefault("max_delay", 0.05)
+    kwargs.setdefault("budget_seconds", 5)
+    return RetryPolicy(
+        is_retryable=unity_client_module.is_retryable,
+        retry_after=retry_after_seconds,
+        **kwargs
+    )
+
+
+def _client(stub, **policy_kwargs):
+    return UnityClient(
+        base_url=stub.base_url,
+        timeout=2,
+        breaker=CircuitBreaker("unity", enabled=False),
+        retry=_policy(**policy_kwargs)
+    )
+
+
+def test_transient_errors_are_retried(stub):
+    client = _client(stub)
+    stub.inject_faults(1, status=503)
+    stub.inject_faults(1, status=502)
+    assert client.get("catalogs")["catalogs"] == [{"name": "catalog_0"}]
+    assert stub.request_counts["faults"] == 2
+    assert stub.request_counts["catalogs"] == 1
+    assert client.retry.stats()["retries"] == 2
+
+
+def test_dropped_connection_is_retried(stub):
+    client = _client(stub)
+    stub.inject_faults(1, status=None)
+    assert client.get("catalogs")["catalogs"] == [{"name": "catalog_0"}]
+    assert stub.request_counts["faults"] == 1
+
+
+def test_retry_after_is_honoured(stub):
+    client = _client(stub)
+    stub.inject_faults(1, status=429, retry_after="1")
+    started = time.monotonic()
+    client.get("catalogs")
+    assert time.monotonic() - started >= 1
+    assert stub.request_counts["catalogs"] == 1
+
+
+def test_retry_after_http_date():
+    response = requests.Response()
+    response.status_code = 503
+    response.headers["Retry-After"] = formatdate(time.time() + 30, usegmt=True)
+    delay = retry_after_seconds(requests.exceptions.HTTPError(response=response))
+    assert 25 <= delay <= 30
+
+    response.headers["Retry-After"] = "not a delay"
+    assert retry_after_seconds(requests.exceptions.HTTPError(response=response)) is None
+
+
+def test_attempts_are_bounded(stub):
+    client = _client(stub, max_attempts=3)
+    stub.inject_faults(10, status=503)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get("catalogs")
+    assert stub.request_counts["faults"] == 3
+    assert client.retry.stats()["attempts_exhausted"] == 1
+
+
+def test_retry_budget_is_not_exceeded(stub):
+    client = _client(stub, budget_seconds=2)
+    # The server asks for a longer wait than the request has left, so the client gives up at once
+    stub.inject_faults(3, status=503, retry_after="30")
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get("catalogs")
+    assert time.monotonic() - started < 1
+    assert stub.request_counts["faults"] == 1
+    assert client.retry.stats()["budget_exhausted"] == 1
+
+
+def test_client_errors_are_not_retried(stub):
+    client = _client(stub)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get("tables/catalog_0.schema_0.missing")
+    assert stub.request_counts["table"] == 1
+    assert client.retry.stats()["retries"] == 0
+
+
+def test_backoff_is_jittered_and_capped():
+    delays = []
+    policy = RetryPolicy(max_attempts=6, base_delay=0.1, max_delay=0.5, budget_seconds=60, sleep=delays.append)
+
+    def fail():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        policy.call(fail)
+    assert len(delays) == 5
+    for retry, delay in enumerate(delays):
+        assert 0 <= delay <= min(0.5, 0.1 * 2 ** retry)
+
+
+def test_tools_recover_from_transient_errors(stub, configure_unity_tools):
+    configure_unity_tools(base_url=stub.base_url, breaker=CircuitBreaker("unity", enabled=False), retry=_policy())
+    stub.inject_faults(2, status=503)
+    details = unity_tools.get_table_details("catalog_0.schema_0", "table_1")
+    assert details["name"] == "table_1"
+    assert stub.request_counts["faults"] == 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tests for the Unity catalog tools.
+
+These tests run the tools through the pooled Unity client against the local
+stand-in server and compare their results with the original sequential,
+one-request-per-connection implementation. They also change a stand-in
+metastore between incremental syncs. They need no Unity catalog.
+Run with `python -m pytest test_unity_tools.py` or `python test_unity_tools.py`.
+"""
+
+import pytest
+import requests
+
+from benchmarks.unity_stub_server import UnityStubServer, build_metastore
+from tools import unity_tools
+from tools.catalog_index import CatalogIndex, CatalogSnapshot
+from tools.resilience import CircuitBreaker
+from tools.unity_client import UnityClient
+
+
+def _metastore():
+    """A metastore whose tables differ in their column names"""
+    metastore = build_metastore(catalogs=2, schemas_per_catalog=3, tables_per_schema=12, columns_per_table=4)
+    for schemas in metastore.values():
+        for tables in schemas.values():
+            for position, table in enumerate(tables):
+                if position % 3 == 0:
+                    table["columns"].append({"name": "Order_Total", "type_text": "decimal", "comment": ""})
+                if position % 4 == 0:
+                    table["columns"][0]["name"] = "account_id"
+    return metastore
+
+
+@pytest.fixture(scope="module", params=[True, False], ids=["columns-in-listing", "details-per-table"])
+def stub(request):
+    with UnityStubServer(_metastore(), include_columns_in_listing=request.param) as server:
+        yield server
+
+
+@pytest.fixture(autouse=True)
+def client(stub, configure_unity_tools):
+    # Every call below must reach the stand-in server rather than the catalog snapshot
+    return configure_unity_tools(base_url=stub.base_url, breaker=CircuitBreaker("unity", enabled=False))
+
+
+def _get(base_url, path):
+    response = requests.get(f"{base_url}{path}", timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def _sequential_databases(base_url):
+    """The original list_unity_databases: one unpooled request at a time"""
+    return [
+        f"{catalog['name']}.{schema['name']}"
+        for catalog in _get(base_url, "/catalogs").get("catalogs", [])
+        for schema in _get(base_url, f"/schemas?catalog_name={catalog['name']}").get("schemas", [])
+    ]
+
+
+def _sequential_column_search(base_url, column_pattern):
+    """The original search_tables_by_column: list everything, then fetch each table's details in turn"""
+    all_tables = []
+    for database_name in _sequential_databases(base_url):
+        catalog_name, schema_name = database_name.split(".")
+        for table in _get(base_url, f"/tables?catalog_name={catalog_name}&schema_name={schema_name}").get("tables", []):
+            all_tables.append((catalog_name, schema_name, table.get("name")))
+
+    results = []
+    for catalog_name, schema_name, table_name in all_tables:
+        table_data = _get(base_url, f"/tables/{catalog_name}.{schema_name}.{table_name}")
+        matching_columns = [
+            col.get("name", "") for col in table_data.get("columns", [])
+            if column_pattern.lower() in col.get("name", "").lower()
+        ]
+        if matching_columns:
+            results.append({
+                "database": f"{catalog_name}.{schema_name}",
+                "table": table_name,
+                "matching_columns": matching_columns
+            })
+    return results
+
+
+def test_listings_match_sequential_requests(stub):
+    databases = _sequential_databases(stub.base_url)
+    assert unity_tools.list_unity_databases(fresh=True) == databases
+    for database_name in databases:
+        catalog_name, schema_name = database_name.split(".")
+        expected = [
+            table["name"] for table in
+            _get(stub.base_url, f"/tables?catalog_name={catalog_name}&schema_name={schema_name}")["tables"]
+        ]
+        assert unity_tools.list_unity_tables(database_name, fresh=True) == expected
+
+
+def test_table_details_match_the_api(stub):
+    data = _get(stub.base_url, "/tables/catalog_1.schema_2.table_3")
+    details = unity_tools.get_table_details("catalog_1.schema_2", "table_3", fresh=True)
+    assert details == unity_tools.format_table(data, "catalog_1.schema_2")
+    assert [column["name"] for column in details["columns"]] == [column["name"] for column in data["columns"]]
+
+
+@pytest.mark.parametrize("workers", [1, 8])
+@pytest.mark.parametrize("pattern", ["customer", "ORDER", "account_id", "col_3", "missing"])
+def test_column_search_matches_sequential_crawl(stub, monkeypatch, workers, pattern):
+    monkeypatch.setattr(unity_tools, "SEARCH_MAX_WORKERS", workers)
+    expected = _sequential_column_search(stub.base_url, pattern)
+    assert unity_tools.search_tables_by_column(pattern, fresh=True) == expected
+
+
+def test_column_search_limit_returns_the_first_matches(stub):
+    expected = _sequential_column_search(stub.base_url, "order")
+    assert len(expected) > 5
+    assert unity_tools.search_tables_by_column("order", limit=5, fresh=True) == expected[:5]
+
+
+@pytest.fixture
+def synced(stub):
+    """A sync of its own stand-in server, in the same listing mode, after its first (full) sync"""
+    with UnityStubServer(build_metastore(2, 2, 5, 3), include_columns_in_listing=stub.include_columns_in_listing) as server:
+        client = UnityClient(base_url=server.base_url)
+        sync = unity_tools.UnityCatalogSync(client)
+        sync.sync()
+        assert sync.last_sync["mode"] == "full"
+        server.reset_counts()
+        yield server, sync
+        client.close()
+
+
+def _table_names(snapshot):
+    return [(table["database"], table["name"]) for table in snapshot.tables]
+
+
+def test_sync_without_changes_reads_no_table(synced):
+    server, sync = synced
+    before = sync.snapshot()
+    after = sync.sync()
+    assert after.tables == before.tables
+    assert sync.last_sync["mode"] == "incremental"
+    assert sync.last_sync["schemas_changed"] == 0
+    assert server.request_counts["table"] == 0
+
+
+def test_sync_rereads_only_updated_and_new_tables(synced):
+    server, sync = synced
+    tables = server.metastore["catalog_0"]["schema_1"]
+    tables[2]["updated_at"] += 1
+    tables[2]["columns"].append({"name": "discount", "type_text": "double", "comment": ""})
+    tables.append(dict(tables[0], name="table_new", updated_at=tables[0]["updated_at"] + 5))
+
+    snapshot = sync.sync()
+    assert sync.last_sync["schemas_changed"] == 1
+    assert sync.last_sync["tables_updated"] == 2
+    assert server.request_counts["table"] == (0 if server.include_columns_in_listing else 2)
+    assert snapshot.tables_by_database["catalog_0.schema_1"][2]["columns"][-1]["name"] == "discount"
+    assert ("catalog_0.schema_1", "table_new") in _table_names(snapshot)
+
+
+def test_sync_drops_deleted_tables_and_schemas(synced):
+    server, sync = synced
+    del server.metastore["catalog_1"]["schema_0"][3]
+    del server.metastore["catalog_0"]["schema_1"]
+
+    snapshot = sync.sync()
+    assert sync.last_sync["tables_deleted"] == 1 + 5
+    assert sync.last_sync["schemas_removed"] == 1
+    assert sync.last_sync["tables_updated"] == 0
+    assert server.request_counts["table"] == 0
+    assert snapshot.list_databases() == ["catalog_0.schema_0", "catalog_1.schema_0", "catalog_1.schema_1"]
+    assert ("catalog_1.schema_0", "table_3") not in _table_names(snapshot)
+    assert len(snapshot.tables) == 3 * 5 - 1
+
+
+def test_table_details_from_the_snapshot_are_copies(monkeypatch, table):
+    index = CatalogIndex("unity", loader=lambda: None, enabled=True)
+    index.set_snapshot(CatalogSnapshot(["catalog_0.schema_0"], [table("catalog_0.schema_0", "orders", ["order_id"])]))
+    monkeypatch.setattr(unity_tools, "unity_index", index)
+    details = unity_tools.get_table_details("catalog_0.schema_0", "orders")
+    details["columns"][0]["name"] = "changed"
+    details["columns"].append({"name": "added", "type": "string", "comment": ""})
+    assert index.current.get_table("catalog_0.schema_0", "orders") == table("catalog_0.schema_0", "orders", ["order_id"])
+    index.stop()
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
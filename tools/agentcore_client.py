@@ -0,0 +1,345 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+AgentCore Runtime Client
+
+This module provides a shared, lazily created boto3 bedrock-agentcore client
+and a per-runtime invoker for calling the catalog MCP servers hosted on
+AgentCore Runtime. Tool calls are sent as MCP tools/call requests through
+InvokeAgentRuntime. Calls to the same runtime that arrive within a short
+window (for example the tool calls of one agent turn) are sent together as a
+single run_tool_batch invocation.
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import boto3
+from botocore.config import Config
+
+# MCP server tool that runs several tool calls in one invocation
+BATCH_TOOL_NAME = "run_tool_batch"
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+class AgentCoreToolError(Exception):
+    """Raised when an MCP server on AgentCore Runtime returns an error for a tool call"""
+
+
+def build_agentcore_config(
+    max_pool_connections: int | None = None,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+    max_attempts: int | None = None
+) -> Config:
+    """
+    Build the botocore configuration used for the shared AgentCore client
+
+    Args:
+        max_pool_connections: Maximum pooled HTTP connections (defaults to AGENTCORE_MAX_POOL_CONNECTIONS or 32)
+        connect_timeout: Connection timeout in seconds (defaults to AGENTCORE_CONNECT_TIMEOUT or 5)
+        read_timeout: Read timeout in seconds (defaults to AGENTCORE_READ_TIMEOUT or 120)
+        max_attempts: Total attempts including retries (defaults to AGENTCORE_MAX_ATTEMPTS or 3)
+
+    Returns:
+        Config: botocore client configuration with adaptive retries
+    """
+    return Config(
+        max_pool_connections=max_pool_connections or _env_int("AGENTCORE_MAX_POOL_CONNECTIONS", 32),
+        connect_timeout=connect_timeout or _env_float("AGENTCORE_CONNECT_TIMEOUT", 5),
+        read_timeout=read_timeout or _env_float("AGENTCORE_READ_TIMEOUT", 120),
+        retries={
+            "mode": "adaptive",
+            "total_max_attempts": max_attempts or _env_int("AGENTCORE_MAX_ATTEMPTS", 3)
+        },
+        tcp_keepalive=True
+    )
+
+
+def create_agentcore_client(region_name: str | None = None, **config_kwargs):
+    """
+    Create a new bedrock-agentcore client from a fresh boto3 session
+
+    Args:
+        region_name: AWS region (defaults to AGENTCORE_REGION, then the standard AWS region resolution)
+        **config_kwargs: Keyword arguments accepted by build_agentcore_config
+
+    Returns:
+        botocore.client.BedrockAgentCore: A new AgentCore data plane client
+    """
+    # A dedicated session keeps client creation thread-safe and re-resolves credentials
+    session = boto3.session.Session()
+    return session.client(
+        "bedrock-agentcore",
+        region_name=region_name or os.environ.get("AGENTCORE_REGION") or None,
+        config=build_agentcore_config(**config_kwargs)
+    )
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_agentcore_client():
+    """
+    Get the process-wide AgentCore client, creating it on first use
+
+    Returns:
+        botocore.client.BedrockAgentCore: The shared client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_agentcore_client()
+    return _client
+
+
+def parse_mcp_response(body: bytes, content_type: str | None = None) -> dict:
+    """
+    Decode the JSON-RPC message returned by a streamable HTTP MCP server
+
+    Args:
+        body: Response body
+        content_type: Response content type; text/event-stream bodies are read as server-sent events
+
+    Returns:
+        dict: The JSON-RPC response message
+    """
+    text = body.decode("utf-8") if isinstance(body, bytes) else body
+    if content_type and content_type.startswith("text/event-stream"):
+        # The response is the last data event; earlier events are notifications
+        events = [line[len("data:"):].strip() for line in text.splitlines() if line.startswith("data:")]
+        text = events[-1] if events else ""
+    return json.loads(text)
+
+
+def tool_result_value(message: dict) -> Any:
+    """
+    Extract a tool's return value from an MCP tools/call response
+
+    Args:
+        message: JSON-RPC response message
+
+    Returns:
+        Any: The value the tool returned, or, when the server sends no structured content, the list of
+        its decoded text items (a tool returning a single object yields a one-element list)
+
+    Raises:
+        AgentCoreToolError: If the response is a JSON-RPC error or the tool reported an error
+    """
+    if "error" in message:
+        raise AgentCoreToolError(message["error"].get("message") or str(message["error"]))
+
+    result = message.get("result") or {}
+    texts = [item.get("text", "") for item in result.get("content", []) if item.get("type") == "text"]
+    if result.get("isError"):
+        raise AgentCoreToolError(" ".join(texts) or "Tool call failed")
+
+    structured = result.get("structuredContent")
+    if structured is not None:
+        # FastMCP wraps return values that are not objects as {"result": value}
+        if isinstance(structured, dict) and list(structured) == ["result"]:
+            return structured["result"]
+        return structured
+
+    # Without structured output, lists are returned as one text item per element. A list of one
+    # element and a single object look alike, so the list is kept and callers that know the tool
+    # returns one object unwrap it
+    values = []
+    for text in texts:
+        try:
+            values.append(json.loads(text))
+        except json.JSONDecodeError:
+            values.append(text)
+    return values
+
+
+class AgentCoreRuntime:
+    """
+    Invoker for the tools of one MCP server hosted on AgentCore Runtime
+
+    Calls are queued and sent after batch_window seconds, or as soon as
+    max_batch_size calls are waiting. A single queued call is sent as a plain
+    tools/call request; several are sent as one run_tool_batch call and the
+    per-call results are handed back to their callers.
+    """
+
+    def __init__(
+        self,
+        runtime_arn: str,
+        client=None,
+        batch_window: float | None = None,
+        max_batch_size: int | None = None,
+        max_concurrency: int | None = None
+    ):
+        """
+        Create an invoker for a runtime
+
+        Args:
+            runtime_arn: ARN of the AgentCore runtime hosting the MCP server
+            client: bedrock-agentcore client to use (defaults to the shared client)
+            batch_window: Seconds to collect calls before sending them (defaults to AGENTCORE_BATCH_WINDOW_MS / 1000 or 0.01)
+            max_batch_size: Calls that trigger an immediate send (defaults to AGENTCORE_MAX_BATCH_SIZE or 10)
+            max_concurrency: Invocations in flight at once (defaults to AGENTCORE_MAX_CONCURRENCY or 8)
+        """
+        self.runtime_arn = runtime_arn
+        self._client = client
+        self.batch_window = _env_float("AGENTCORE_BATCH_WINDOW_MS", 10) / 1000 if batch_window is None else batch_window
+        self.max_batch_size = max(1, max_batch_size or _env_int("AGENTCORE_MAX_BATCH_SIZE", 10))
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency or _env_int("AGENTCORE_MAX_CONCURRENCY", 8),
+            thread_name_prefix="agentcore"
+        )
+        self._request_ids = itertools.count(1)
+        self._queue = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        """The bedrock-agentcore client used for invocations"""
+        return self._client or get_agentcore_client()
+
+    def submit(self, tool_name: str, params: dict | None = None) -> Future:
+        """
+        Queue a tool call without waiting for it
+
+        Args:
+            tool_name: Name of the MCP tool
+            params: Tool arguments
+
+        Returns:
+            Future: Resolves to the tool's return value, or fails with AgentCoreToolError or a botocore error
+        """
+        future = Future()
+        with self._lock:
+            self._queue.append((tool_name, params or {}, future))
+            if len(self._queue) >= self.max_batch_size or self.batch_window <= 0:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.batch_window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def invoke(self, tool_name: str, params: dict | None = None) -> Any:
+        """
+        Call a tool and wait for its return value
+
+        Args:
+            tool_name: Name of the MCP tool
+            params: Tool arguments
+
+        Returns:
+            Any: The tool's return value
+        """
+        return self.submit(tool_name, params).result()
+
+    async def ainvoke(self, tool_name: str, params: dict | None = None) -> Any:
+        """
+        Call a tool from asyncio code without blocking the event loop
+
+        Args:
+            tool_name: Name of the MCP tool
+            params: Tool arguments
+
+        Returns:
+            Any: The tool's return value
+        """
+        return await asyncio.wrap_future(self.submit(tool_name, params))
+
+    def flush(self):
+        """Send the queued calls now"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, []
+        if batch:
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch: list):
+        live = [(tool_name, params, future) for tool_name, params, future in batch if future.set_running_or_notify_cancel()]
+        try:
+            if len(live) == 1:
+                tool_name, params, future = live[0]
+                future.set_result(self._call_tool(tool_name, params))
+                return
+            if not live:
+                return
+
+            calls = [{"tool_name": tool_name, "params": params} for tool_name, params, _ in live]
+            results = self._call_tool(BATCH_TOOL_NAME, {"calls": calls})
+            if not isinstance(results, list) or len(results) != len(live):
+                raise AgentCoreToolError(f"{BATCH_TOOL_NAME} returned {results!r} for {len(live)} calls")
+            for (_, _, future), outcome in zip(live, results):
+                if "error" in outcome:
+                    future.set_exception(AgentCoreToolError(outcome["error"]))
+                else:
+                    future.set_result(outcome.get("result"))
+        except Exception as e:
+            for _, _, future in live:
+                if not future.done():
+                    future.set_exception(e)
+
+    def _call_tool(self, tool_name: str, params: dict) -> Any:
+        message = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": "tools/call",
+            "params": {"name": tool_name, "arguments": params}
+        }
+        response = self.client.invoke_agent_runtime(
+            agentRuntimeArn=self.runtime_arn,
+            contentType="application/json",
+            accept="application/json, text/event-stream",
+            payload=json.dumps(message).encode("utf-8")
+        )
+        body = response["response"].read()
+        return tool_result_value(parse_mcp_response(body, response.get("contentType")))
+
+    def close(self):
+        """Send any queued calls and stop the invocation threads once they finish"""
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+_runtimes = {}
+_runtimes_lock = threading.Lock()
+
+
+def get_agentcore_runtime(runtime_arn: str) -> AgentCoreRuntime:
+    """
+    Get the process-wide invoker for a runtime, creating it on first use
+
+    Args:
+        runtime_arn: ARN of the AgentCore runtime
+
+    Returns:
+        AgentCoreRuntime: The shared invoker, so calls from every tool wrapper for the runtime batch together
+    """
+    with _runtimes_lock:
+        runtime = _runtimes.get(runtime_arn)
+        if runtime is None:
+            runtime = _runtimes[runtime_arn] = AgentCoreRuntime(runtime_arn)
+        return runtime
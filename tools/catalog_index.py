@@ -0,0 +1,271 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Catalog Metadata Index
+
+This module provides a process-wide, in-memory snapshot of catalog metadata
+(databases, tables, columns, types and comments) that the Unity and Glue tools
+answer from instead of going back to the upstream catalog on every call. Each
+catalog gets one CatalogIndex that reloads its snapshot in the background once
+the TTL expires.
+"""
+
+import logging
+import os
+import threading
+import time
+from itertools import islice
+from typing import Callable, Iterable
+
+from tools.search_index import Matcher, SearchIndex
+
+logger = logging.getLogger(__name__)
+
+# Seconds a snapshot is served before it is refreshed, and whether indexing is enabled at all
+DEFAULT_TTL_SECONDS = float(os.environ.get("CATALOG_INDEX_TTL", "300"))
+INDEX_ENABLED = os.environ.get("CATALOG_INDEX_ENABLED", "true").lower() not in ("0", "false", "no")
+
+
+class CatalogSnapshot:
+    """Immutable point-in-time view of one catalog's metadata"""
+
+    def __init__(self, databases: Iterable[str], tables: Iterable[dict], loaded_at: float | None = None):
+        """
+        Create a snapshot
+
+        Args:
+            databases: Database names, in catalog order
+            tables: Tables in the get_table_details format, in catalog order
+            loaded_at: time.time() at which the metadata was read (defaults to now)
+        """
+        self.loaded_at = loaded_at if loaded_at is not None else time.time()
+        self.databases = list(databases)
+        self.tables = list(tables)
+        self.tables_by_database = {name: [] for name in self.databases}
+        self._tables_by_key = {}
+        for table in self.tables:
+            self.tables_by_database.setdefault(table["database"], []).append(table)
+            self._tables_by_key[(table["database"], table["name"])] = table
+        self.search_index = SearchIndex(self.tables)
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the snapshot was read from the upstream catalog"""
+        return time.time() - self.loaded_at
+
+    def list_databases(self) -> list:
+        """Database names in catalog order"""
+        return list(self.tables_by_database)
+
+    def list_tables(self, database_name: str) -> list | None:
+        """
+        List table names in a database
+
+        Returns:
+            list | None: Table names, or None if the database is not in the snapshot
+        """
+        tables = self.tables_by_database.get(database_name)
+        return None if tables is None else [table["name"] for table in tables]
+
+    def get_table(self, database_name: str, table_name: str) -> dict | None:
+        """
+        Look up a table
+
+        Returns:
+            dict | None: Table details in the get_table_details format, or None if not in the snapshot
+        """
+        return self._tables_by_key.get((database_name, table_name))
+
+    def search_by_name(self, name_pattern: str, limit: int | None = None, match: str = "substring",
+                       include_comments: bool = False) -> list:
+        """
+        Find tables by name, in the search_tables_by_name format
+
+        Args:
+            name_pattern: Pattern to match table names against
+            limit: Maximum number of tables to return
+            match: One of search_index.MATCH_MODES
+            include_comments: Also match table descriptions
+
+        Returns:
+            list: Matching tables in catalog order
+
+        Raises:
+            ValueError: If the match mode or pattern is invalid
+        """
+        matcher = Matcher(name_pattern, match)
+        return [
+            {"database": self.tables[table_id]["database"], "table": self.tables[table_id]["name"]}
+            for table_id in self.search_index.match_tables(matcher, include_comments)[:limit or None]
+        ]
+
+    def search_by_column(self, column_pattern: str, limit: int | None = None, match: str = "substring",
+                         include_comments: bool = False) -> list:
+        """
+        Find tables with matching columns, in the search_tables_by_column format
+
+        Args:
+            column_pattern: Pattern to match column names against
+            limit: Maximum number of tables to return
+            match: One of search_index.MATCH_MODES
+            include_comments: Also match column comments
+
+        Returns:
+            list: Matching tables in catalog order, with matching columns in table order
+
+        Raises:
+            ValueError: If the match mode or pattern is invalid
+        """
+        matcher = Matcher(column_pattern, match)
+        results = []
+        for table_id, positions in islice(self.search_index.match_columns(matcher, include_comments), limit or None):
+            table = self.tables[table_id]
+            results.append({
+                "database": table["database"],
+                "table": table["name"],
+                "matching_columns": [table["columns"][position]["name"] for position in positions]
+            })
+        return results
+
+
+class CatalogIndex:
+    """
+    Process-wide holder of a catalog's latest snapshot with background TTL refresh
+
+    snapshot() never blocks on the upstream catalog: when no snapshot has been
+    loaded yet (or the last one is too old to serve) it returns None so the
+    caller can read through, and it starts a background reload.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], CatalogSnapshot], ttl_seconds: float | None = None,
+                 max_stale_factor: float = 3.0, enabled: bool | None = None):
+        """
+        Create an index
+
+        Args:
+            name: Catalog name used in log messages
+            loader: Function that crawls the upstream catalog and returns a CatalogSnapshot
+            ttl_seconds: Age after which the snapshot is refreshed (defaults to CATALOG_INDEX_TTL or 300)
+            max_stale_factor: Snapshots older than ttl * max_stale_factor are no longer served
+            enabled: Serve lookups from the index (defaults to CATALOG_INDEX_ENABLED)
+        """
+        self.name = name
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else DEFAULT_TTL_SECONDS
+        self.max_stale_factor = max_stale_factor
+        self.enabled = INDEX_ENABLED if enabled is None else enabled
+        self.last_error = None
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._refresher = None
+        self._stop = threading.Event()
+        self._loaded = threading.Event()
+
+    def snapshot(self) -> CatalogSnapshot | None:
+        """
+        Get the snapshot to answer from, scheduling a background refresh when it is due
+
+        Returns:
+            CatalogSnapshot | None: The current snapshot, or None if the caller should read through
+        """
+        if not self.enabled:
+            return None
+        self._ensure_refresher()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.age_seconds >= self.ttl_seconds:
+            self.refresh_async()
+        if snapshot is None or snapshot.age_seconds >= self.ttl_seconds * self.max_stale_factor:
+            return None
+        return snapshot
+
+    def refresh(self) -> CatalogSnapshot | None:
+        """
+        Reload the snapshot from the upstream catalog, keeping the previous one on failure
+
+        Returns:
+            CatalogSnapshot | None: The snapshot in use after the refresh
+        """
+        started = time.monotonic()
+        try:
+            snapshot = self.loader()
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning(f"Refreshing {self.name} catalog index failed: {e}")
+            return self._snapshot
+        self.set_snapshot(snapshot)
+        self.last_error = None
+        logger.info(
+            f"Refreshed {self.name} catalog index: {len(snapshot.tables)} tables "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+        return snapshot
+
+    def refresh_async(self):
+        """Start a background refresh unless one is already running"""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name=f"{self.name}-index-refresh", daemon=True).start()
+
+    def wait(self, timeout: float) -> CatalogSnapshot | None:
+        """
+        Get the snapshot to answer from, waiting up to timeout seconds for a cold index to load
+
+        Returns:
+            CatalogSnapshot | None: The current snapshot, or None if none was loaded in time
+        """
+        snapshot = self.snapshot()
+        if snapshot is None and self.enabled and self._loaded.wait(timeout):
+            snapshot = self.snapshot()
+        return snapshot
+
+    @property
+    def current(self) -> CatalogSnapshot | None:
+        """The installed snapshot regardless of its age, without scheduling a refresh"""
+        return self._snapshot
+
+    def start(self):
+        """Start the periodic background refresh now instead of on the first lookup"""
+        if self.enabled:
+            self._ensure_refresher()
+
+    def set_snapshot(self, snapshot: CatalogSnapshot):
+        """Install a snapshot, e.g. one loaded from disk or built by an incremental sync"""
+        with self._lock:
+            self._snapshot = snapshot
+            self._loaded.set()
+
+    def invalidate(self):
+        """Drop the current snapshot so lookups read through until the next refresh"""
+        with self._lock:
+            self._snapshot = None
+            self._loaded.clear()
+
+    def stop(self):
+        """Stop the periodic background refresh"""
+        self._stop.set()
+
+    def _ensure_refresher(self):
+        """Start the periodic refresh thread on first use"""
+        if self._refresher is not None:
+            return
+        with self._lock:
+            if self._refresher is not None:
+                return
+
+            def loop():
+                while not self._stop.wait(self.ttl_seconds):
+                    self.refresh_async()
+
+            self._refresher = threading.Thread(target=loop, name=f"{self.name}-index-ttl", daemon=True)
+            self._refresher.start()
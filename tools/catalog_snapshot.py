@@ -0,0 +1,370 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+On-Disk Catalog Snapshots
+
+This module persists a catalog index's snapshot (databases, tables, columns,
+types and comments) to a compact, versioned and checksummed file, so that a
+restarted MCP server or in-process demo answers from the last crawl instead
+of crawling the whole catalog again. A file is read into memory whole when it
+is loaded. Files are replaced atomically, so a process never reads a partly
+written file, and a process can pick up a newer file written by another
+process on the same host instead of crawling.
+
+File layout (little-endian):
+
+    magic            8 bytes, b"CATSNAP\\0"
+    format version   uint16
+    reserved         uint16
+    header length    uint32
+    header           UTF-8 JSON: catalog, loaded_at, written_at, databases,
+                     table_count, the CRC-32 of the index and records, and
+                     optionally sync, the incremental sync's watermarks
+    padding          to an 8-byte boundary
+    index            table_count + 1 uint64 record offsets
+    records          one compact JSON object per table, in catalog order
+"""
+
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from typing import Iterator
+
+from tools.catalog_index import CatalogIndex, CatalogSnapshot
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CATSNAP\0"
+
+# Bumped whenever the layout or the table record format changes; other versions are ignored
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct("<8sHHI")
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a snapshot file is truncated, corrupt or written in another format version"""
+
+
+def snapshot_path(name: str) -> str | None:
+    """
+    Path of a catalog's snapshot file
+
+    Args:
+        name: Catalog name, e.g. 'unity'
+
+    Returns:
+        str | None: File in CATALOG_SNAPSHOT_DIR (defaults to catalog-snapshots in the user's
+        cache directory, $XDG_CACHE_HOME or ~/.cache), or None if CATALOG_SNAPSHOT_DIR is set to an empty value
+    """
+    # A per-user default, unlike the shared temporary directory, cannot hold files planted by other users
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    directory = os.environ.get("CATALOG_SNAPSHOT_DIR", os.path.join(cache_home, "catalog-snapshots"))
+    return os.path.join(directory, f"{name}.catsnap") if directory else None
+
+
+def _encode(value) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_snapshot(path: str, snapshot: CatalogSnapshot, catalog: str, sync_state: dict | None = None) -> int:
+    """
+    Write a snapshot file, replacing any previous one atomically
+
+    The file is written under a temporary name in the same directory, synced
+    and renamed over the old file, so readers see either the old or the new
+    file and never a partial one. A missing directory is created readable by
+    the current user only.
+
+    Args:
+        path: File to write
+        snapshot: Snapshot to persist
+        catalog: Catalog name stored in the header and checked on load
+        sync_state: State of the incremental sync that produced the snapshot, stored in the header
+
+    Returns:
+        int: Size of the file in bytes
+    """
+    records = [_encode(table) for table in snapshot.tables]
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+    body = struct.pack(f"<{len(offsets)}Q", *offsets) + b"".join(records)
+
+    header = _encode({
+        "catalog": catalog,
+        "loaded_at": snapshot.loaded_at,
+        "written_at": time.time(),
+        "databases": snapshot.list_databases(),
+        "table_count": len(records),
+        "crc32": zlib.crc32(body),
+        **({"sync": sync_state} if sync_state is not None else {})
+    })
+    preamble = _PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(header))
+    padding = b"\0" * (-(len(preamble) + len(header)) % 8)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(preamble)
+            f.write(header)
+            f.write(padding)
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    # Make the rename itself durable
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        pass
+    else:
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+    return len(preamble) + len(header) + len(padding) + len(body)
+
+
+def read_header(path: str) -> dict:
+    """
+    Read a snapshot file's header without reading its tables
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        dict: The header fields
+
+    Raises:
+        OSError: If the file cannot be read
+        SnapshotFormatError: If the file is not a snapshot in FORMAT_VERSION
+    """
+    with open(path, "rb") as f:
+        preamble = f.read(_PREAMBLE.size)
+        return _parse_header(preamble, lambda length: f.read(length))
+
+
+def _parse_header(preamble: bytes, read) -> dict:
+    if len(preamble) < _PREAMBLE.size:
+        raise SnapshotFormatError("Snapshot file is truncated")
+    magic, version, _, header_length = _PREAMBLE.unpack(preamble[:_PREAMBLE.size])
+    if magic != MAGIC:
+        raise SnapshotFormatError("Not a catalog snapshot file")
+    if version != FORMAT_VERSION:
+        raise SnapshotFormatError(f"Snapshot format version {version} is not supported (expected {FORMAT_VERSION})")
+    data = read(header_length)
+    if len(data) < header_length:
+        raise SnapshotFormatError("Snapshot header is truncated")
+    try:
+        header = json.loads(data)
+    except ValueError as e:
+        raise SnapshotFormatError(f"Snapshot header is corrupt: {e}") from e
+    header["header_length"] = header_length
+    return header
+
+
+class SnapshotFile:
+    """
+    Read-only snapshot file
+
+    The file is read into memory once; table records are decoded on access,
+    so opening a file costs only the read, its header and checksum.
+    """
+
+    def __init__(self, path: str, verify: bool = True):
+        """
+        Read a snapshot file
+
+        Args:
+            path: Snapshot file
+            verify: Check the CRC-32 of the index and records
+
+        Raises:
+            OSError: If the file cannot be opened
+            SnapshotFormatError: If the file is truncated, corrupt or in another format version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = f.read()
+        position = _PREAMBLE.size
+        self.header = _parse_header(self._data[:position], lambda length: self._data[position:position + length])
+        count = self.header["table_count"]
+        index_start = position + self.header["header_length"]
+        index_start += -index_start % 8
+        self._index_start = index_start
+        self._records_start = index_start + 8 * (count + 1)
+        if self._records_start > len(self._data):
+            raise SnapshotFormatError("Snapshot index is truncated")
+        if self._records_start + self._offset(count) != len(self._data):
+            raise SnapshotFormatError("Snapshot records are truncated")
+        if verify and zlib.crc32(memoryview(self._data)[index_start:]) != self.header["crc32"]:
+            raise SnapshotFormatError("Snapshot checksum does not match")
+
+    @property
+    def catalog(self) -> str:
+        """Name of the catalog the snapshot was taken of"""
+        return self.header["catalog"]
+
+    @property
+    def loaded_at(self) -> float:
+        """time.time() at which the metadata was read from the catalog"""
+        return self.header["loaded_at"]
+
+    @property
+    def databases(self) -> list:
+        """Database names in catalog order"""
+        return self.header["databases"]
+
+    @property
+    def sync_state(self) -> dict | None:
+        """State of the incremental sync that produced the snapshot, if it was saved"""
+        return self.header.get("sync")
+
+    def __len__(self) -> int:
+        return self.header["table_count"]
+
+    def _offset(self, position: int) -> int:
+        return struct.unpack_from("<Q", self._data, self._index_start + 8 * position)[0]
+
+    def table(self, position: int) -> dict:
+        """Decode the table at a position, in the get_table_details format"""
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        start = self._records_start + self._offset(position)
+        end = self._records_start + self._offset(position + 1)
+        return json.loads(self._data[start:end])
+
+    def __iter__(self) -> Iterator[dict]:
+        for position in range(len(self)):
+            yield self.table(position)
+
+    def to_snapshot(self) -> CatalogSnapshot:
+        """Decode every table into a CatalogSnapshot"""
+        return CatalogSnapshot(self.databases, iter(self), self.loaded_at)
+
+    def close(self):
+        """Release the file's contents"""
+        self._data = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_snapshot(path: str, catalog: str | None = None, sync=None) -> CatalogSnapshot:
+    """
+    Load a snapshot file into a CatalogSnapshot
+
+    Args:
+        path: Snapshot file
+        catalog: Expected catalog name, if it should be checked
+        sync: Incremental sync (UnityCatalogSync or GlueCatalogSync) to resume from the file's saved state
+
+    Returns:
+        CatalogSnapshot: The persisted snapshot, with its original loaded_at
+
+    Raises:
+        OSError: If the file cannot be read
+        SnapshotFormatError: If the file is corrupt, in another format version or of another catalog
+    """
+    with SnapshotFile(path) as snapshot_file:
+        if catalog is not None and snapshot_file.catalog != catalog:
+            raise SnapshotFormatError(f"Snapshot is of the {snapshot_file.catalog} catalog, not {catalog}")
+        snapshot = snapshot_file.to_snapshot()
+        sync_state = snapshot_file.sync_state
+    # Without its watermarks the sync starts over, and its first refresh is a full crawl
+    if sync is not None and sync_state is not None and not sync.restore(snapshot, sync_state):
+        logger.warning(f"Ignoring the incremental sync state in catalog snapshot {path}")
+    return snapshot
+
+
+def persist_index(index: CatalogIndex, path: str | None = None, sync=None) -> CatalogSnapshot | None:
+    """
+    Warm-start a catalog index from its snapshot file and keep the file up to date
+
+    The file's snapshot is installed right away (the index still refreshes it
+    once it is older than the TTL, and stops serving it past the index's stale
+    limit). After that, each background refresh first checks whether another
+    process on the host has written a newer snapshot that is still within the
+    TTL and loads it instead of crawling; otherwise it crawls and rewrites the
+    file. Periodic background refresh is started.
+
+    When the index is refreshed by an incremental sync, pass the sync: its
+    watermarks are saved with each snapshot and restored whenever a file is
+    loaded, so the first refresh after a warm start is incremental too.
+
+    Args:
+        index: Catalog index to persist
+        path: Snapshot file (defaults to snapshot_path(index.name))
+        sync: Incremental sync behind index.loader, e.g. unity_sync
+
+    Returns:
+        CatalogSnapshot | None: The snapshot loaded from disk, or None if there was no usable file
+    """
+    path = path or snapshot_path(index.name)
+    if path is None or not index.enabled:
+        return None
+
+    crawl = index.loader
+    write_lock = threading.Lock()
+
+    def load() -> CatalogSnapshot:
+        current = index.current
+        try:
+            header = read_header(path)
+            newer = current is None or header["loaded_at"] > current.loaded_at
+            if newer and header.get("catalog") == index.name and time.time() - header["loaded_at"] < index.ttl_seconds:
+                return load_snapshot(path, index.name, sync)
+        except FileNotFoundError:
+            pass
+        except (OSError, SnapshotFormatError) as e:
+            logger.warning(f"Ignoring {index.name} catalog snapshot {path}: {e}")
+
+        snapshot = crawl()
+        try:
+            with write_lock:
+                size = write_snapshot(path, snapshot, index.name, sync.state() if sync is not None else None)
+            logger.info(f"Wrote {index.name} catalog snapshot to {path} ({size} bytes)")
+        except OSError as e:
+            logger.warning(f"Writing {index.name} catalog snapshot to {path} failed: {e}")
+        return snapshot
+
+    index.loader = load
+
+    snapshot = None
+    try:
+        started = time.monotonic()
+        snapshot = load_snapshot(path, index.name, sync)
+        index.set_snapshot(snapshot)
+        logger.info(
+            f"Loaded {index.name} catalog snapshot from {path}: {len(snapshot.tables)} tables, "
+            f"{snapshot.age_seconds:.0f}s old, in {time.monotonic() - started:.2f}s"
+        )
+    except FileNotFoundError:
+        pass
+    except (OSError, SnapshotFormatError) as e:
+        logger.warning(f"Ignoring {index.name} catalog snapshot {path}: {e}")
+
+    index.start()
+    if snapshot is None or snapshot.age_seconds >= index.ttl_seconds:
+        index.refresh_async()
+    return snapshot
@@ -0,0 +1,395 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Concurrency Helpers
+
+This module provides small concurrency primitives shared by the catalog tools.
+"""
+
+import asyncio
+import contextvars
+import copy
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a fan-out does not finish before its deadline"""
+
+
+class Outcome:
+    """Result of applying a function to a single item of a fan-out"""
+
+    __slots__ = ("item", "result", "error", "elapsed")
+
+    def __init__(self, item: Any, result: Any = None, error: BaseException | None = None,
+                 elapsed: float | None = None):
+        self.item = item
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call completed without raising"""
+        return self.error is None
+
+
+def deadline_after(seconds: float | None) -> float | None:
+    """
+    Convert a relative timeout into an absolute monotonic deadline
+
+    Args:
+        seconds: Timeout in seconds, or None/0 for no deadline
+
+    Returns:
+        float | None: Absolute deadline suitable for bounded_ordered_map
+    """
+    return time.monotonic() + seconds if seconds else None
+
+
+def bounded_ordered_map(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int,
+    deadline: float | None = None
+) -> Iterator[Outcome]:
+    """
+    Apply fn to items concurrently and yield outcomes in input order
+
+    At most max_workers calls are in flight at any time and items are pulled
+    from the iterable lazily, so arbitrarily long inputs are processed with
+    bounded memory. An exception raised by fn is captured in its Outcome
+    instead of aborting the remaining items.
+
+    Args:
+        fn: Function to apply to each item
+        items: Items to process
+        max_workers: Maximum number of concurrent calls
+        deadline: Absolute time.monotonic() deadline, or None for no deadline
+
+    Yields:
+        Outcome: One outcome per item, in the order the items were supplied
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before all items are processed
+    """
+    max_workers = max(1, max_workers)
+    iterator = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_workers:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append((item, executor.submit(fn, item)))
+            if not pending:
+                return
+
+            item, future = pending[0]
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    raise DeadlineExceeded()
+            done, _ = wait([future], timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded()
+
+            pending.popleft()
+            error = future.exception()
+            yield Outcome(item, None if error else future.result(), error)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_concurrently(calls: dict, timeout: float | None = None) -> dict:
+    """
+    Run independent calls in parallel and collect their outcomes by key
+
+    A call still running when the timeout expires gets an outcome whose error
+    is DeadlineExceeded. Its thread cannot be interrupted, so it finishes in
+    the background and its result is discarded.
+
+    Args:
+        calls: Mapping of key to a function taking no arguments
+        timeout: Seconds to wait for all calls, or None to wait indefinitely
+
+    Returns:
+        dict: Mapping of key to Outcome, in the order of calls, with elapsed set to the seconds each call took
+    """
+    started = time.monotonic()
+    finished = {}
+
+    def timed(key, fn):
+        try:
+            return fn()
+        finally:
+            finished[key] = time.monotonic() - started
+
+    executor = ThreadPoolExecutor(max_workers=max(1, len(calls)))
+    try:
+        futures = {key: executor.submit(timed, key, fn) for key, fn in calls.items()}
+        wait(futures.values(), timeout=timeout)
+        outcomes = {}
+        for key, future in futures.items():
+            if not future.done():
+                future.cancel()
+                outcomes[key] = Outcome(key, error=DeadlineExceeded(), elapsed=time.monotonic() - started)
+            else:
+                error = future.exception()
+                outcomes[key] = Outcome(key, None if error else future.result(), error, finished.get(key))
+        return outcomes
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class BoundedExecutor:
+    """
+    Run blocking calls from asyncio code on a bounded pool of threads
+
+    At most max_concurrency calls run at the same time; further calls wait for a
+    free thread without blocking the event loop. Each call runs in a copy of the
+    caller's context, so context variables such as tracing spans carry over.
+    """
+
+    def __init__(self, max_concurrency: int):
+        """
+        Create a bounded executor
+
+        Args:
+            max_concurrency: Maximum number of calls running at the same time
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="bounded")
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Call fn(*args, **kwargs) on a worker thread and wait for its result
+
+        Args:
+            fn: Blocking function to call
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Any: The value returned by fn; exceptions raised by fn are re-raised
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, fn, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads once the calls already submitted have finished"""
+        self._executor.shutdown(wait=wait)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into one in-flight call
+
+    The first caller for a key runs the call; callers arriving with the same key
+    while it is running wait for it and receive a copy of its result (or its
+    exception) instead of repeating the work. Counts of calls made, calls that
+    actually ran and calls that were coalesced are kept per name.
+    """
+
+    def __init__(self, enabled: bool | None = None):
+        """
+        Create a single-flight group
+
+        Args:
+            enabled: Coalesce calls (defaults to SINGLE_FLIGHT_ENABLED, which is on unless set to 0/false/no)
+        """
+        if enabled is None:
+            enabled = os.environ.get("SINGLE_FLIGHT_ENABLED", "true").lower() not in ("0", "false", "no")
+        self.enabled = enabled
+        self._in_flight = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def do(self, name: str, key: Any, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for an identical call that is already running
+
+        Args:
+            name: Name the call is counted under (e.g. the tool name)
+            key: Hashable arguments identifying identical calls of name
+            fn: Function taking no arguments that performs the call
+
+        Returns:
+            Any: The call's result; callers that joined a running call get a deep copy
+        """
+        with self._lock:
+            stats = self._stats.setdefault(name, {"calls": 0, "executed": 0, "coalesced": 0})
+            stats["calls"] += 1
+            future = self._in_flight.get((name, key)) if self.enabled else None
+            if future is None:
+                stats["executed"] += 1
+                if self.enabled:
+                    leader = self._in_flight[(name, key)] = Future()
+                else:
+                    leader = None
+            else:
+                stats["coalesced"] += 1
+
+        if future is not None:
+            # Each caller gets its own copy, so one caller modifying the result can't affect another
+            return copy.deepcopy(future.result())
+
+        try:
+            result = fn()
+        except BaseException as e:
+            if leader is not None:
+                leader.set_exception(e)
+            raise
+        else:
+            if leader is not None:
+                leader.set_result(result)
+            return result
+        finally:
+            if leader is not None:
+                with self._lock:
+                    del self._in_flight[(name, key)]
+
+    def stats(self) -> dict:
+        """
+        Get the coalescing counters
+
+        Returns:
+            dict: For each name, the calls made, calls executed and calls coalesced into another call
+        """
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._stats.items()}
+
+    def reset_stats(self):
+        """Clear the coalescing counters"""
+        with self._lock:
+            self._stats.clear()
+
+
+def call_key(signature: inspect.Signature, args: tuple, kwargs: dict, exclude: tuple = ()) -> str:
+    """
+    Build a key identifying a call by its normalized arguments
+
+    Args:
+        signature: Signature of the called function
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        exclude: Names of arguments that do not change the result (e.g. 'fresh')
+
+    Returns:
+        str: The arguments bound to the signature with defaults applied, as canonical JSON
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = {name: value for name, value in bound.arguments.items() if name not in exclude}
+    return json.dumps(arguments, sort_keys=True, default=repr)
+
+
+def coalesce(group: SingleFlight) -> Callable:
+    """
+    Decorate a function so that concurrent identical calls share one execution
+
+    Calls are identical when their arguments are equal after binding them to
+    the function's signature and applying defaults, so positional, keyword and
+    defaulted arguments with the same values coalesce.
+
+    Args:
+        group: Single-flight group the calls are coalesced in
+
+    Returns:
+        Callable: Decorator for the function
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = call_key(signature, args, kwargs)
+            return group.do(fn.__name__, key, lambda: fn(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter with multiplicative back-off
+
+    The bucket refills at `rate` tokens per second up to `burst` tokens. When the
+    upstream signals throttling, penalize() halves the refill rate; each
+    successful call through reward() then restores it gradually towards the
+    configured target (additive increase, multiplicative decrease).
+    """
+
+    def __init__(self, rate: float, burst: float | None = None, min_rate: float = 0.5):
+        """
+        Create a token bucket
+
+        Args:
+            rate: Target refill rate in tokens per second
+            burst: Bucket capacity (defaults to rate)
+            min_rate: Lowest rate penalize() may reduce the bucket to
+        """
+        self.target_rate = rate
+        self.rate = rate
+        self.burst = burst or rate
+        self.min_rate = min(min_rate, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket, sleeping until enough are available
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def penalize(self):
+        """Halve the refill rate after a throttling response"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0)
+
+    def reward(self):
+        """Move the refill rate back towards its target after a successful call"""
+        with self._lock:
+            if self.rate < self.target_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.target_rate, self.rate + self.target_rate / 20)
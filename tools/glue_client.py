@@ -0,0 +1,169 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+AWS Glue Client
+
+This module provides a shared, lazily created boto3 Glue client for the Glue
+catalog tools. Creating a client re-resolves credentials, endpoints and the
+service model, so the tools reuse one thread-safe client per process instead
+of building a new one on every call.
+"""
+
+import os
+import threading
+import boto3
+from botocore.config import Config
+from tools.resilience import CircuitBreaker, Hedger
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+def build_glue_config(
+    max_pool_connections: int | None = None,
+    connect_timeout: float | None = None,
+    read_timeout: float | None = None,
+    max_attempts: int | None = None
+) -> Config:
+    """
+    Build the botocore configuration used for the shared Glue client
+
+    Args:
+        max_pool_connections: Maximum pooled HTTP connections (defaults to GLUE_MAX_POOL_CONNECTIONS or 32)
+        connect_timeout: Connection timeout in seconds (defaults to GLUE_CONNECT_TIMEOUT or 5)
+        read_timeout: Read timeout in seconds (defaults to GLUE_READ_TIMEOUT or 30)
+        max_attempts: Total attempts including retries (defaults to GLUE_MAX_ATTEMPTS or 5)
+
+    Returns:
+        Config: botocore client configuration with adaptive retries
+    """
+    return Config(
+        max_pool_connections=max_pool_connections or _env_int("GLUE_MAX_POOL_CONNECTIONS", 32),
+        connect_timeout=connect_timeout or _env_float("GLUE_CONNECT_TIMEOUT", 5),
+        read_timeout=read_timeout or _env_float("GLUE_READ_TIMEOUT", 30),
+        retries={
+            "mode": "adaptive",
+            "total_max_attempts": max_attempts or _env_int("GLUE_MAX_ATTEMPTS", 5)
+        },
+        tcp_keepalive=True
+    )
+
+
+# Circuit breaker shared by the Glue clients, and hedger for single-object reads such as get_table
+glue_breaker = CircuitBreaker("glue")
+glue_hedger = Hedger("glue")
+
+
+def install_circuit_breaker(client, breaker: CircuitBreaker):
+    """
+    Route every API call of a Glue client through a circuit breaker
+
+    Calls are rejected with CircuitOpenError while the breaker is open. Server
+    errors (5xx) and calls that fail without a response, after botocore's own
+    retries, count as failures; other error responses come from a healthy
+    service and count as successes.
+
+    Args:
+        client: Glue client to instrument
+        breaker: Circuit breaker to record outcomes in
+    """
+    def admit(context, **kwargs):
+        context["circuit_probe"] = breaker.admit()
+
+    def after_call(http_response, context, **kwargs):
+        breaker.record(http_response.status_code < 500, context.get("circuit_probe", False))
+
+    def after_call_error(context, **kwargs):
+        breaker.record(False, context.get("circuit_probe", False))
+
+    events = client.meta.events
+    # Admit calls once their parameters are valid, so every admitted call ends in after-call or
+    # after-call-error. The handler goes first on the same event as botocore's Stubber, which
+    # answers before-call and would otherwise skip the admission
+    events.register_first("before-call.*.*", admit)
+    events.register("after-call.glue", after_call)
+    events.register("after-call-error.glue", after_call_error)
+
+
+def create_glue_client(region_name: str | None = None, breaker: CircuitBreaker | None = None, **config_kwargs):
+    """
+    Create a new Glue client from a fresh boto3 session
+
+    Args:
+        region_name: AWS region (defaults to GLUE_REGION, then the standard AWS region resolution)
+        breaker: Circuit breaker for the client's calls (defaults to glue_breaker)
+        **config_kwargs: Keyword arguments accepted by build_glue_config
+
+    Returns:
+        botocore.client.Glue: A new Glue client
+    """
+    # A dedicated session keeps client creation thread-safe and re-resolves credentials
+    session = boto3.session.Session()
+    client = session.client(
+        "glue",
+        region_name=region_name or os.environ.get("GLUE_REGION") or None,
+        config=build_glue_config(**config_kwargs)
+    )
+    install_circuit_breaker(client, breaker or glue_breaker)
+    return client
+
+
+_client = None
+_client_settings = {}
+_client_lock = threading.Lock()
+
+
+def get_glue_client():
+    """
+    Get the process-wide Glue client, creating it on first use
+
+    Returns:
+        botocore.client.Glue: The shared client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_glue_client(**_client_settings)
+    return _client
+
+
+def configure_glue_client(**settings):
+    """
+    Replace the process-wide Glue client with a newly configured one
+
+    Args:
+        **settings: Keyword arguments accepted by create_glue_client
+
+    Returns:
+        botocore.client.Glue: The new shared client
+    """
+    global _client, _client_settings
+    with _client_lock:
+        _client_settings = dict(settings)
+        _client = create_glue_client(**_client_settings)
+    return _client
+
+
+def refresh_glue_credentials():
+    """
+    Rebuild the shared Glue client so that it picks up new credentials
+
+    Use this after rotating credentials or assuming a different role; the
+    current client settings are kept.
+
+    Returns:
+        botocore.client.Glue: The new shared client
+    """
+    with _client_lock:
+        settings = dict(_client_settings)
+    return configure_glue_client(**settings)
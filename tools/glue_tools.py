@@ -6,123 +6,707 @@ AWS Glue Catalog Tools
 This module provides tools for interacting with the AWS Glue catalog.
 """
 
-import boto3
+import copy
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Iterable, Iterator
+from botocore.exceptions import ClientError
 from strands import tool
+from tools.catalog_index import CatalogIndex, CatalogSnapshot
+from tools.concurrency import SingleFlight, TokenBucket, bounded_ordered_map, coalesce
+from tools.glue_client import get_glue_client, glue_hedger
+from tools.ranked_search import BM25Index
+from tools.search_index import Matcher
+from tools.semantic_index import DEFAULT_TOP_K, SemanticIndex
+
+logger = logging.getLogger(__name__)
+
+# Default page size (MaxResults) for Glue list and search calls
+PAGE_SIZE = int(os.environ.get("GLUE_PAGE_SIZE", "100"))
+
+
+def iter_databases(page_size: int | None = None, client=None) -> Iterator[dict]:
+    """
+    Stream every database in the AWS Glue catalog using the get_databases paginator
+    
+    Args:
+        page_size: Databases requested per page (defaults to GLUE_PAGE_SIZE)
+        client: Glue client to use (defaults to the shared client)
+    
+    Yields:
+        dict: Database objects as returned by Glue
+    """
+    client = client or get_glue_client()
+    paginator = client.get_paginator('get_databases')
+    for page in paginator.paginate(PaginationConfig={'PageSize': page_size or PAGE_SIZE}):
+        yield from page.get('DatabaseList', [])
+
+
+def iter_tables(database_name: str, page_size: int | None = None, client=None) -> Iterator[dict]:
+    """
+    Stream every table in a Glue database using the get_tables paginator
+    
+    Args:
+        database_name: Name of the database
+        page_size: Tables requested per page (defaults to GLUE_PAGE_SIZE)
+        client: Glue client to use (defaults to the shared client)
+    
+    Yields:
+        dict: Table objects as returned by Glue
+    """
+    client = client or get_glue_client()
+    paginator = client.get_paginator('get_tables')
+    pages = paginator.paginate(
+        DatabaseName=database_name,
+        PaginationConfig={'PageSize': page_size or PAGE_SIZE}
+    )
+    for page in pages:
+        yield from page.get('TableList', [])
+
+
+def iter_search_tables(search_text: str, page_size: int | None = None, client=None) -> Iterator[dict]:
+    """
+    Stream every result of a Glue search_tables query, following NextToken
+    
+    Args:
+        search_text: Text to search for (empty to list every table)
+        page_size: Tables requested per page (defaults to GLUE_PAGE_SIZE)
+        client: Glue client to use (defaults to the shared client)
+    
+    Yields:
+        dict: Table objects as returned by Glue
+    """
+    client = client or get_glue_client()
+    # search_tables has no boto3 paginator, so follow NextToken by hand
+    request = {'MaxResults': page_size or PAGE_SIZE}
+    if search_text:
+        request['SearchText'] = search_text
+    while True:
+        response = client.search_tables(**request)
+        yield from response.get('TableList', [])
+        next_token = response.get('NextToken')
+        if not next_token:
+            return
+        request['NextToken'] = next_token
+
+
+def format_table(table: dict, database_name: str | None = None) -> dict:
+    """
+    Format a Glue table object into the shape returned by get_table_details
+    
+    Args:
+        table: Table object as returned by Glue
+        database_name: Name of the database (defaults to the table's DatabaseName)
+    
+    Returns:
+        dict: Key information about the table
+    """
+    storage = table.get('StorageDescriptor', {})
+    return {
+        "name": table['Name'],
+        "database": database_name or table.get('DatabaseName', ''),
+        "description": table.get('Description', ''),
+        "columns": [
+            {
+                "name": col['Name'],
+                "type": col['Type'],
+                "comment": col.get('Comment', '')
+            }
+            for col in storage.get('Columns', [])
+        ],
+        "location": storage.get('Location', ''),
+        "format": storage.get('InputFormat', '').split('.')[-1].replace('InputFormat', '') if storage.get('InputFormat') else ''
+    }
+
+
+# Error codes Glue uses to signal that a caller is over its request rate
+THROTTLING_ERROR_CODES = {'ThrottlingException', 'Throttling', 'TooManyRequestsException', 'RequestLimitExceeded'}
+
+# Crawl defaults: worker threads, sustained requests per second and burst size
+CRAWL_MAX_WORKERS = int(os.environ.get("GLUE_CRAWL_CONCURRENCY", "8"))
+CRAWL_REQUESTS_PER_SECOND = float(os.environ.get("GLUE_CRAWL_RPS", "10"))
+CRAWL_BURST = float(os.environ.get("GLUE_CRAWL_BURST", "20"))
+CRAWL_THROTTLE_RETRIES = 5
+
+
+class GlueCrawlStats:
+    """Thread-safe per-database timing and throttle counters for a Glue catalog crawl"""
+    
+    def __init__(self):
+        self.databases = {}
+        self.started_at = time.monotonic()
+        self.finished_at = None
+        self._lock = threading.Lock()
+    
+    def record(self, database_name: str, **counters):
+        """Add counters (tables, pages, throttles, seconds, ...) to a database's entry"""
+        with self._lock:
+            entry = self.databases.setdefault(
+                database_name,
+                {"tables": 0, "pages": 0, "throttles": 0, "seconds": 0.0, "error": None}
+            )
+            for key, value in counters.items():
+                if key == "error":
+                    entry["error"] = value
+                else:
+                    entry[key] += value
+    
+    def summary(self) -> dict:
+        """
+        Summarize the crawl
+        
+        Returns:
+            dict: Totals plus the per-database breakdown
+        """
+        with self._lock:
+            databases = {name: dict(entry) for name, entry in self.databases.items()}
+        end = self.finished_at or time.monotonic()
+        return {
+            "databases": databases,
+            "total_tables": sum(entry["tables"] for entry in databases.values()),
+            "total_pages": sum(entry["pages"] for entry in databases.values()),
+            "total_throttles": sum(entry["throttles"] for entry in databases.values()),
+            "failed_databases": [name for name, entry in databases.items() if entry["error"]],
+            "elapsed_seconds": round(end - self.started_at, 3)
+        }
+
+
+def _rate_limited_call(operation, bucket: TokenBucket, stats: GlueCrawlStats, stats_key: str, **kwargs) -> dict:
+    """Call a Glue operation through the token bucket, backing off when Glue throttles"""
+    for attempt in range(CRAWL_THROTTLE_RETRIES + 1):
+        bucket.acquire()
+        try:
+            response = operation(**kwargs)
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') not in THROTTLING_ERROR_CODES or attempt == CRAWL_THROTTLE_RETRIES:
+                raise
+            stats.record(stats_key, throttles=1)
+            bucket.penalize()
+            time.sleep(min(20.0, 0.2 * 2 ** attempt) * random.random())
+            continue
+        # botocore's adaptive retries absorb most throttles; count them from the response metadata
+        retries = response.get('ResponseMetadata', {}).get('RetryAttempts', 0)
+        if retries:
+            stats.record(stats_key, throttles=retries)
+            bucket.penalize()
+        else:
+            bucket.reward()
+        return response
+
+
+def _list_database_names(client, bucket: TokenBucket, stats: GlueCrawlStats, page_size: int) -> Iterator[str]:
+    """Database names in catalog order, one rate-limited get_databases page at a time"""
+    request = {'MaxResults': page_size}
+    while True:
+        response = _rate_limited_call(client.get_databases, bucket, stats, "<catalog>", **request)
+        for database in response.get('DatabaseList', []):
+            yield database['Name']
+        if not response.get('NextToken'):
+            return
+        request['NextToken'] = response['NextToken']
+
+
+def crawl_glue_catalog(
+    max_workers: int | None = None,
+    requests_per_second: float | None = None,
+    burst: float | None = None,
+    page_size: int | None = None,
+    stats: GlueCrawlStats | None = None,
+    database_names: Iterable[str] | None = None,
+    client=None,
+    raw: bool = False
+) -> Iterator[dict]:
+    """
+    Crawl every table of every database in the AWS Glue catalog concurrently
+    
+    Databases are fetched on a thread pool while a shared token bucket keeps
+    the combined request rate under Glue API limits, halving the rate whenever
+    Glue throttles. A database that fails is recorded in the stats and skipped.
+    
+    Args:
+        max_workers: Databases crawled in parallel (defaults to GLUE_CRAWL_CONCURRENCY or 8)
+        requests_per_second: Sustained Glue request rate (defaults to GLUE_CRAWL_RPS or 10)
+        burst: Token bucket capacity (defaults to GLUE_CRAWL_BURST or 20)
+        page_size: Tables requested per get_tables page (defaults to GLUE_PAGE_SIZE)
+        stats: Collector for per-database timing and throttle counts
+        database_names: Databases to crawl (defaults to every database in the catalog)
+        client: Glue client to use (defaults to the shared client)
+        raw: Yield the Glue table objects instead of formatting them
+    
+    Yields:
+        dict: Table metadata in the get_table_details format (or as returned by Glue), database by database
+    """
+    client = client or get_glue_client()
+    stats = stats if stats is not None else GlueCrawlStats()
+    bucket = TokenBucket(requests_per_second or CRAWL_REQUESTS_PER_SECOND, burst or CRAWL_BURST)
+    page_size = page_size or PAGE_SIZE
+    
+    def crawl_database(database_name):
+        started = time.monotonic()
+        tables = []
+        request = {'DatabaseName': database_name, 'MaxResults': page_size}
+        try:
+            while True:
+                response = _rate_limited_call(client.get_tables, bucket, stats, database_name, **request)
+                page = response.get('TableList', [])
+                tables.extend(page if raw else (format_table(table, database_name) for table in page))
+                stats.record(database_name, pages=1)
+                if not response.get('NextToken'):
+                    break
+                request['NextToken'] = response['NextToken']
+        except ClientError as e:
+            stats.record(database_name, error=str(e))
+        stats.record(database_name, tables=len(tables), seconds=time.monotonic() - started)
+        return tables
+    
+    try:
+        databases = _list_database_names(client, bucket, stats, page_size) if database_names is None else database_names
+        for outcome in bounded_ordered_map(crawl_database, databases, max_workers or CRAWL_MAX_WORKERS):
+            if not outcome.ok:
+                stats.record(outcome.item, error=str(outcome.error))
+                continue
+            yield from outcome.result
+    finally:
+        stats.finished_at = time.monotonic()
+
+
+def load_glue_snapshot(client=None) -> CatalogSnapshot:
+    """
+    Crawl the whole AWS Glue catalog into a CatalogSnapshot
+    
+    Args:
+        client: Glue client to use (defaults to the shared client)
+    
+    Returns:
+        CatalogSnapshot: Databases and tables with their columns
+    
+    Raises:
+        RuntimeError: If any database could not be crawled, so that a partial snapshot is never served
+    """
+    loaded_at = time.time()
+    database_names = [db['Name'] for db in iter_databases(client=client)]
+    stats = GlueCrawlStats()
+    tables = list(crawl_glue_catalog(stats=stats, database_names=database_names, client=client))
+    failed = stats.summary()["failed_databases"]
+    if failed:
+        raise RuntimeError(f"Failed to crawl Glue databases: {', '.join(failed)}")
+    return CatalogSnapshot(database_names, tables, loaded_at)
+
+
+# Incremental sync settings: whether the index uses it, seconds re-read before the last sync to
+# cover the search index's lag and clock skew, and how often a full crawl or deletion sweep runs
+INCREMENTAL_SYNC_ENABLED = os.environ.get("GLUE_INCREMENTAL_SYNC", "true").lower() not in ("0", "false", "no")
+SYNC_LOOKBACK_SECONDS = float(os.environ.get("GLUE_SYNC_LOOKBACK", "300"))
+SYNC_FULL_EVERY = int(os.environ.get("GLUE_SYNC_FULL_EVERY", "12"))
+SYNC_SWEEP_EVERY = int(os.environ.get("GLUE_SYNC_SWEEP_EVERY", "4"))
+
+
+def _update_time(table: dict) -> datetime | None:
+    """When a Glue table was last changed"""
+    return table.get('UpdateTime') or table.get('CreateTime')
+
+
+class GlueCatalogSync:
+    """
+    Copy of the Glue catalog's table metadata kept current by incremental syncs
+    
+    The first sync crawls every database. Later syncs list the databases
+    (crawling new ones and dropping removed ones), read the tables changed
+    since the previous sync from search_tables sorted by UpdateTime, newest
+    first, stopping at the previous sync's start, and apply those whose
+    VersionId changed, so the table metadata read per sync follows the
+    catalog's churn. Every sweep_every syncs, a sweep lists each database's
+    table names (get_tables returning only NAME) to drop deleted tables and
+    fetch new tables that the search index has not caught up with. A sweep's
+    requests grow with the size of the catalog, which is why it is periodic;
+    a deleted table can stay in the copy for up to sweep_every syncs. A full
+    crawl runs every full_every syncs, and whenever an incremental sync fails.
+    """
+    
+    def __init__(
+        self,
+        client=None,
+        lookback_seconds: float | None = None,
+        full_every: int | None = None,
+        sweep_every: int | None = None,
+        page_size: int | None = None
+    ):
+        """
+        Create an empty sync state
+        
+        Args:
+            client: Glue client to use (defaults to the shared client at each sync)
+            lookback_seconds: Overlap re-read before the previous sync (defaults to GLUE_SYNC_LOOKBACK or 300)
+            full_every: Syncs between full crawls, 0 for never (defaults to GLUE_SYNC_FULL_EVERY or 12)
+            sweep_every: Syncs between deletion sweeps (defaults to GLUE_SYNC_SWEEP_EVERY or 4)
+            page_size: Tables requested per page (defaults to GLUE_PAGE_SIZE)
+        """
+        self.client = client
+        self.lookback_seconds = SYNC_LOOKBACK_SECONDS if lookback_seconds is None else lookback_seconds
+        self.full_every = SYNC_FULL_EVERY if full_every is None else full_every
+        self.sweep_every = max(1, SYNC_SWEEP_EVERY if sweep_every is None else sweep_every)
+        self.page_size = page_size or PAGE_SIZE
+        self.databases = []
+        self.tables = {}
+        self.versions = {}
+        self.watermark = None
+        self.syncs = 0
+        self.last_sync = None
+        self._lock = threading.Lock()
+    
+    def sync(self) -> CatalogSnapshot:
+        """
+        Bring the copy up to date with the Glue catalog
+        
+        Returns:
+            CatalogSnapshot: Databases and tables with their columns
+        
+        Raises:
+            RuntimeError: If a full crawl could not read every database; the previous state is kept
+        """
+        with self._lock:
+            started = time.monotonic()
+            loaded_at = time.time()
+            client = self.client or get_glue_client()
+            stats = GlueCrawlStats()
+            changes = None
+            if self.watermark is not None and not (self.full_every and self.syncs % self.full_every == 0):
+                try:
+                    changes = self._sync_incremental(client, stats)
+                except (ClientError, RuntimeError) as e:
+                    logger.warning(f"Incremental Glue sync failed, crawling the whole catalog: {e}")
+            mode = "incremental"
+            if changes is None:
+                mode = "full"
+                changes = self._sync_full(client, stats)
+            self.syncs += 1
+            self.last_sync = {"mode": mode, **changes, "seconds": round(time.monotonic() - started, 3)}
+            return self.snapshot(loaded_at)
+    
+    def snapshot(self, loaded_at: float | None = None) -> CatalogSnapshot:
+        """
+        Build a CatalogSnapshot of the current state
+        
+        Args:
+            loaded_at: time.time() of the sync that produced the state (defaults to now)
+        
+        Returns:
+            CatalogSnapshot: Databases in catalog order, tables in name order within each database
+        """
+        tables = [
+            table
+            for database_name in self.databases
+            for _, table in sorted(self.tables.get(database_name, {}).items())
+        ]
+        return CatalogSnapshot(self.databases, tables, loaded_at)
+    
+    def state(self) -> dict | None:
+        """
+        Watermark and table versions of the current state, to be saved with its snapshot
+        
+        Returns:
+            dict | None: Sync count, watermark and VersionId of each table, or None before the first sync
+        """
+        with self._lock:
+            if self.watermark is None:
+                return None
+            versions = {}
+            for (database_name, name), version in self.versions.items():
+                versions.setdefault(database_name, {})[name] = version
+            return {"syncs": self.syncs, "watermark": self.watermark.isoformat(), "versions": versions}
+    
+    def restore(self, snapshot: CatalogSnapshot, state: dict) -> bool:
+        """
+        Resume from a snapshot saved with state(), so that the next sync is incremental
+        
+        Args:
+            snapshot: Snapshot the state was saved with
+            state: Value returned by state()
+        
+        Returns:
+            bool: Whether the state was valid and was restored
+        """
+        try:
+            watermark = datetime.fromisoformat(state["watermark"])
+            syncs = int(state["syncs"])
+            tables = {
+                database_name: {table["name"]: table for table in snapshot.tables_by_database[database_name]}
+                for database_name in snapshot.list_databases()
+            }
+            versions = {
+                (database_name, name): version
+                for database_name, names in state["versions"].items()
+                for name, version in names.items()
+                if name in tables.get(database_name, {})
+            }
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return False
+        with self._lock:
+            self.databases = snapshot.list_databases()
+            self.tables, self.versions, self.watermark, self.syncs = tables, versions, watermark, syncs
+            self.last_sync = {"mode": "restored", "databases": len(tables), "tables": len(snapshot.tables)}
+        return True
+    
+    @staticmethod
+    def _store(tables: dict, versions: dict, table: dict, database_name: str):
+        tables.setdefault(database_name, {})[table['Name']] = format_table(table, database_name)
+        versions[(database_name, table['Name'])] = table.get('VersionId')
+    
+    def _crawl(self, client, stats: GlueCrawlStats, database_names: list, tables: dict, versions: dict) -> int:
+        """Crawl whole databases into tables/versions, returning the number of tables read"""
+        count = 0
+        for table in crawl_glue_catalog(page_size=self.page_size, stats=stats, database_names=database_names,
+                                        client=client, raw=True):
+            self._store(tables, versions, table, table.get('DatabaseName') or '')
+            count += 1
+        failed = stats.summary()["failed_databases"]
+        if failed:
+            raise RuntimeError(f"Failed to crawl Glue databases: {', '.join(failed)}")
+        return count
+    
+    def _sync_full(self, client, stats: GlueCrawlStats) -> dict:
+        # Anything changed after this point is picked up by the next incremental sync
+        watermark = datetime.now(timezone.utc)
+        bucket = TokenBucket(CRAWL_REQUESTS_PER_SECOND, CRAWL_BURST)
+        database_names = list(_list_database_names(client, bucket, stats, self.page_size))
+        tables = {name: {} for name in database_names}
+        versions = {}
+        count = self._crawl(client, stats, database_names, tables, versions)
+        self.databases, self.tables, self.versions, self.watermark = database_names, tables, versions, watermark
+        return {"databases": len(database_names), "tables_read": count, "tables_updated": count, "tables_deleted": 0}
+    
+    def _sync_incremental(self, client, stats: GlueCrawlStats) -> dict:
+        watermark = datetime.now(timezone.utc)
+        bucket = TokenBucket(CRAWL_REQUESTS_PER_SECOND, CRAWL_BURST)
+        database_names = list(_list_database_names(client, bucket, stats, self.page_size))
+        added = [name for name in database_names if name not in self.tables]
+        removed = [name for name in self.tables if name not in set(database_names)]
+        
+        # Work on copies so that a failed sync leaves the previous state intact
+        tables = {name: dict(self.tables.get(name, {})) for name in database_names}
+        versions = {key: version for key, version in self.versions.items() if key[0] in tables}
+        tables_deleted = sum(len(self.tables[name]) for name in removed)
+        tables_read = self._crawl(client, stats, added, tables, versions) if added else 0
+        tables_updated = tables_read
+        
+        # Tables changed since the previous sync, newest first
+        since = self.watermark - timedelta(seconds=self.lookback_seconds)
+        request = {'MaxResults': self.page_size, 'SortCriteria': [{'FieldName': 'UpdateTime', 'Sort': 'DESC'}]}
+        while True:
+            response = _rate_limited_call(client.search_tables, bucket, stats, "<search>", **request)
+            reached_watermark = False
+            for table in response.get('TableList', []):
+                updated_at = _update_time(table)
+                if updated_at is not None and updated_at <= since:
+                    reached_watermark = True
+                    break
+                tables_read += 1
+                database_name = table.get('DatabaseName')
+                if database_name not in tables or database_name in added:
+                    continue
+                key = (database_name, table['Name'])
+                version = table.get('VersionId')
+                if key in versions and version is not None and versions[key] == version:
+                    continue
+                self._store(tables, versions, table, database_name)
+                tables_updated += 1
+            if reached_watermark or not response.get('NextToken'):
+                break
+            request['NextToken'] = response['NextToken']
+        
+        # Deleted tables, and new ones the search index has not caught up with yet
+        if self.syncs % self.sweep_every == 0:
+            def sweep(database_name):
+                names = set()
+                request = {'DatabaseName': database_name, 'MaxResults': self.page_size, 'AttributesToGet': ['NAME']}
+                while True:
+                    response = _rate_limited_call(client.get_tables, bucket, stats, database_name, **request)
+                    names.update(table['Name'] for table in response.get('TableList', []))
+                    if not response.get('NextToken'):
+                        break
+                    request['NextToken'] = response['NextToken']
+                missing = [
+                    _rate_limited_call(client.get_table, bucket, stats, database_name,
+                                       DatabaseName=database_name, Name=name)['Table']
+                    for name in sorted(names - set(tables[database_name]))
+                ]
+                return names, missing
+            
+            existing = [name for name in database_names if name not in added]
+            for outcome in bounded_ordered_map(sweep, existing, CRAWL_MAX_WORKERS):
+                if not outcome.ok:
+                    raise outcome.error
+                names, missing = outcome.result
+                database_name = outcome.item
+                for name in [name for name in tables[database_name] if name not in names]:
+                    del tables[database_name][name]
+                    versions.pop((database_name, name), None)
+                    tables_deleted += 1
+                for table in missing:
+                    self._store(tables, versions, table, database_name)
+                    tables_read += 1
+                    tables_updated += 1
+        
+        self.databases, self.tables, self.versions, self.watermark = database_names, tables, versions, watermark
+        return {
+            "databases": len(database_names),
+            "databases_added": len(added),
+            "databases_removed": len(removed),
+            "tables_read": tables_read,
+            "tables_updated": tables_updated,
+            "tables_deleted": tables_deleted
+        }
+
+
+# Glue metadata kept current by incremental syncs; see glue_sync.last_sync
+glue_sync = GlueCatalogSync()
+
+# Process-wide snapshot of the Glue catalog that the tools answer from
+glue_index = CatalogIndex("glue", glue_sync.sync if INCREMENTAL_SYNC_ENABLED else load_glue_snapshot)
+
+# Concurrent identical tool calls share one upstream request; see glue_flights.stats()
+glue_flights = SingleFlight()
 
 
 @tool
-def list_glue_databases() -> list:
+@coalesce(glue_flights)
+def list_glue_databases(limit: int | None = None, fresh: bool = False) -> list:
     """
     List all databases in the AWS Glue catalog
     
+    Args:
+        limit: Maximum number of databases to return (default: all databases)
+        fresh: Bypass the cached catalog snapshot and read directly from AWS Glue
+    
     Returns:
         list: A list of database names
     """
-    glue_client = boto3.client('glue')
-    response = glue_client.get_databases()
-    return [db['Name'] for db in response['DatabaseList']]
+    snapshot = None if fresh else glue_index.snapshot()
+    if snapshot is not None:
+        return snapshot.list_databases()[:limit or None]
+    
+    return [db['Name'] for db in islice(iter_databases(), limit or None)]
 
 
 @tool
-def list_glue_tables(database_name: str) -> list:
+@coalesce(glue_flights)
+def list_glue_tables(database_name: str, limit: int | None = None, fresh: bool = False) -> list:
     """
     List all tables in a specific Glue database
     
     Args:
         database_name: Name of the database
-        
+        limit: Maximum number of tables to return (default: all tables)
+        fresh: Bypass the cached catalog snapshot and read directly from AWS Glue
+    
     Returns:
         list: A list of table names
     """
-    glue_client = boto3.client('glue')
-    response = glue_client.get_tables(DatabaseName=database_name)
-    return [table['Name'] for table in response['TableList']]
+    snapshot = None if fresh else glue_index.snapshot()
+    if snapshot is not None:
+        tables = snapshot.list_tables(database_name)
+        if tables is not None:
+            return tables[:limit or None]
+    
+    return [table['Name'] for table in islice(iter_tables(database_name), limit or None)]
 
 
 @tool
-def get_table_details(database_name: str, table_name: str) -> dict:
+@coalesce(glue_flights)
+def get_table_details(database_name: str, table_name: str, fresh: bool = False) -> dict:
     """
     Get detailed information about a specific table
     
     Args:
         database_name: Name of the database
         table_name: Name of the table
-        
+        fresh: Bypass the cached catalog snapshot and read directly from AWS Glue
+    
     Returns:
         dict: Detailed information about the table
     """
-    glue_client = boto3.client('glue')
-    response = glue_client.get_table(DatabaseName=database_name, Name=table_name)
-    table = response['Table']
+    snapshot = None if fresh else glue_index.snapshot()
+    if snapshot is not None:
+        table = snapshot.get_table(database_name, table_name)
+        if table is not None:
+            return copy.deepcopy(table)
     
-    # Format the response to include key information
-    return {
-        "name": table['Name'],
-        "database": database_name,
-        "description": table.get('Description', ''),
-        "columns": [
-            {
-                "name": col['Name'],
-                "type": col['Type'],
-                "comment": col.get('Comment', '')
-            }
-            for col in table.get('StorageDescriptor', {}).get('Columns', [])
-        ],
-        "location": table.get('StorageDescriptor', {}).get('Location', ''),
-        "format": table.get('StorageDescriptor', {}).get('InputFormat', '').split('.')[-1].replace('InputFormat', '') if table.get('StorageDescriptor', {}).get('InputFormat') else ''
-    }
+    glue_client = get_glue_client()
+    response = glue_hedger.call(lambda: glue_client.get_table(DatabaseName=database_name, Name=table_name))
+    return format_table(response['Table'], database_name)
 
 
 @tool
-def search_tables_by_name(name_pattern: str) -> list:
+@coalesce(glue_flights)
+def search_tables_by_name(name_pattern: str, limit: int | None = None, fresh: bool = False,
+                          match: str = "substring", include_comments: bool = False) -> list:
     """
     Search for tables by name pattern
     
     Args:
         name_pattern: Pattern to match table names
-        
+        limit: Maximum number of tables to return; no further pages are requested once it is reached (default: no limit)
+        fresh: Bypass the cached catalog snapshot and use the Glue search API directly
+        match: How to match the pattern: 'substring' (default), 'prefix', 'glob' (e.g. 'sales_*') or 'regex'
+        include_comments: Also match the pattern against table descriptions
+    
     Returns:
         list: A list of matching tables with their database names
     """
-    glue_client = boto3.client('glue')
-    response = glue_client.search_tables(
-        SearchText=name_pattern,
-        MaxResults=100
-    )
+    matcher = Matcher(name_pattern, match)
+    snapshot = None if fresh else glue_index.snapshot()
+    if snapshot is not None:
+        return snapshot.search_by_name(name_pattern, limit, match, include_comments)
     
+    # Glue's full-text search also matches descriptions and columns, so narrow its results
+    # with the same matcher as the snapshot path
+    tables = (
+        table for table in iter_search_tables(matcher.search_text)
+        if matcher(table['Name']) or (include_comments and matcher(table.get('Description')))
+    )
     return [
         {
             "database": table['DatabaseName'],
             "table": table['Name']
         }
-        for table in response.get('TableList', [])
+        for table in islice(tables, limit or None)
     ]
 
 
 @tool
-def search_tables_by_column(column_pattern: str) -> list:
+@coalesce(glue_flights)
+def search_tables_by_column(column_pattern: str, limit: int | None = None, fresh: bool = False,
+                            match: str = "substring", include_comments: bool = False) -> list:
     """
     Search for tables containing columns matching the pattern
     
     Args:
         column_pattern: Pattern to match column names
-        
+        limit: Maximum number of tables to return; no further pages are requested once it is reached (default: no limit)
+        fresh: Bypass the cached catalog snapshot and use the Glue search API directly
+        match: How to match the pattern: 'substring' (default), 'prefix', 'glob' (e.g. '*_id') or 'regex'
+        include_comments: Also match the pattern against column comments
+    
     Returns:
         list: A list of tables with matching columns
     """
-    glue_client = boto3.client('glue')
-    response = glue_client.search_tables(
-        SearchText=column_pattern,
-        MaxResults=100
-    )
+    matcher = Matcher(column_pattern, match)
+    snapshot = None if fresh else glue_index.snapshot()
+    if snapshot is not None:
+        return snapshot.search_by_column(column_pattern, limit, match, include_comments)
     
     results = []
-    for table in response.get('TableList', []):
+    for table in iter_search_tables(matcher.search_text):
         # Check if any column matches the pattern
         columns = table.get('StorageDescriptor', {}).get('Columns', [])
         matching_columns = [
             col['Name'] for col in columns 
-            if column_pattern.lower() in col['Name'].lower()
+            if matcher(col['Name']) or (include_comments and matcher(col.get('Comment')))
         ]
         
         if matching_columns:
@@ -131,5 +715,55 @@ def search_tables_by_column(column_pattern: str) -> list:
                 "table": table['Name'],
                 "matching_columns": matching_columns
             })
+            if limit and len(results) >= limit:
+                break
     
     return results
+
+
+# Ranked search over the table and column metadata in the Glue snapshot
+glue_semantic_index = SemanticIndex("glue")
+
+
+@tool
+def semantic_search_glue_tables(query: str, top_k: int = DEFAULT_TOP_K) -> list | dict:
+    """
+    Find the AWS Glue tables most related to a natural-language question
+    
+    Tables are ranked by how well their names, descriptions, column names and
+    column comments match the words of the query, so one call replaces several
+    guesses with search_tables_by_name and search_tables_by_column.
+    
+    Args:
+        query: Question or keywords, e.g. 'where is customer churn data'
+        top_k: Number of tables to return (default 10, at most 100)
+    
+    Returns:
+        list: Tables with database, table, description, score and matching_columns, best match first
+        dict: Error information if the query is empty or the Glue catalog has not been indexed
+    """
+    return glue_semantic_index.search_catalog(glue_index, "AWS Glue", query, top_k)
+
+
+# BM25 keyword ranking over the same metadata, with impacts precomputed per snapshot
+glue_ranked_index = BM25Index("glue")
+
+
+@tool
+def ranked_search_glue_tables(query: str, top_k: int = DEFAULT_TOP_K) -> list | dict:
+    """
+    Search AWS Glue tables by keywords and return only the best matches, ranked by BM25 score
+    
+    Unlike search_tables_by_name, which returns every match in catalog order,
+    results are scored over table names, descriptions, column names, column
+    types and column comments, with matches in the table name weighted most.
+    
+    Args:
+        query: Keywords, e.g. 'customer orders'
+        top_k: Number of tables to return (default 10, at most 100)
+    
+    Returns:
+        list: Tables with database, table, description, score and matching_columns, best match first
+        dict: Error information if the query is empty or the Glue catalog has not been indexed
+    """
+    return glue_ranked_index.search_catalog(glue_index, "AWS Glue", query, top_k)
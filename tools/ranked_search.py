@@ -0,0 +1,120 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+BM25-Ranked Catalog Search
+
+This module provides a keyword index that ranks tables with BM25F: the
+words of a table's name, database, description, column names, column types
+and column comments are counted per field, length-normalized against the
+field's average length and combined with per-field boosts. The BM25 impact
+of every (table, word) pair is computed when the index is built, so a query
+only sums the precomputed postings of its words and its cost grows with the
+number of matching tables, not with the size of the catalog.
+
+Boosts and the BM25 parameters can be set with BM25_BOOST_<FIELD> (e.g.
+BM25_BOOST_NAME=4), BM25_K1 and BM25_B.
+"""
+
+import os
+
+import numpy as np
+
+from tools.semantic_index import TableVectorIndex, tokenize
+
+# Relative weight of a word match by field; a table's own name counts most
+FIELD_BOOSTS = {"name": 3.0, "column": 2.0, "description": 1.0, "comment": 1.0, "database": 0.5, "type": 0.2}
+
+FIELDS = tuple(FIELD_BOOSTS)
+
+# Term frequency saturation and length normalization
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+
+def field_boosts() -> np.ndarray:
+    """Boost of each field in FIELDS order, with BM25_BOOST_<FIELD> overrides"""
+    return np.array([
+        float(os.environ.get(f"BM25_BOOST_{field.upper()}") or boost) for field, boost in FIELD_BOOSTS.items()
+    ])
+
+
+def field_terms(table: dict) -> dict:
+    """
+    Words of a table's metadata by field
+
+    Args:
+        table: Table in the get_table_details format
+
+    Returns:
+        dict: Field name to the list of its words
+    """
+    columns = table.get("columns") or []
+    return {
+        "name": tokenize(table.get("name", "")),
+        "column": [word for column in columns for word in tokenize(column.get("name", ""))],
+        "description": tokenize(table.get("description", "")),
+        "comment": [word for column in columns for word in tokenize(column.get("comment", ""))],
+        "database": tokenize(table.get("database", "")),
+        "type": [word for column in columns for word in tokenize(column.get("type", ""))]
+    }
+
+
+class BM25Index(TableVectorIndex):
+    """
+    BM25F index of tables with precomputed term impacts
+
+    A result's score is the sum, over the distinct words of the query, of
+    idf(word) * tf / (k1 + tf), scaled by (k1 + 1), where tf is the boosted,
+    length-normalized frequency of the word across the table's fields.
+    """
+
+    def __init__(self, name: str, boosts: dict | None = None, k1: float | None = None, b: float | None = None):
+        """
+        Create an empty index
+
+        Args:
+            name: Catalog name, e.g. 'unity'
+            boosts: Boosts by field name, overriding FIELD_BOOSTS and the environment
+            k1: Term frequency saturation (defaults to BM25_K1 or 1.2)
+            b: Strength of the length normalization, 0 to 1 (defaults to BM25_B or 0.75)
+
+        Raises:
+            ValueError: If boosts names a field that is not in FIELDS
+        """
+        super().__init__(name)
+        unknown = sorted(set(boosts or {}) - set(FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown BM25 boost field(s) {', '.join(unknown)}; expected one of {', '.join(FIELDS)}")
+        self.boosts = field_boosts()
+        for field, boost in (boosts or {}).items():
+            self.boosts[FIELDS.index(field)] = boost
+        self.k1 = float(os.environ.get("BM25_K1") or DEFAULT_K1) if k1 is None else k1
+        self.b = float(os.environ.get("BM25_B") or DEFAULT_B) if b is None else b
+
+    def _vectorize(self, table: dict) -> tuple:
+        terms = field_terms(table)
+        frequencies = {}
+        for position, field in enumerate(FIELDS):
+            for word in terms[field]:
+                frequencies.setdefault(word, np.zeros(len(FIELDS)))[position] += 1
+        field_frequencies = np.array(list(frequencies.values())).reshape(len(frequencies), len(FIELDS))
+        field_lengths = np.array([len(terms[field]) for field in FIELDS], dtype=np.float64)
+        return self._term_ids(frequencies), field_frequencies, field_lengths
+
+    def _weigh(self, vectors: list, doc_ids: np.ndarray, term_ids: np.ndarray, document_frequency: np.ndarray) -> tuple:
+        document_count = len(vectors)
+        field_frequencies = np.concatenate([vector[1] for vector in vectors])
+        field_lengths = np.stack([vector[2] for vector in vectors])
+        average_lengths = field_lengths.mean(axis=0)
+        average_lengths[average_lengths == 0] = 1.0
+
+        # Boosted, per-field length-normalized term frequency of each (table, word) pair
+        normalization = 1 - self.b + self.b * field_lengths / average_lengths
+        tf = (field_frequencies * (self.boosts / normalization[doc_ids])).sum(axis=1)
+
+        idf = np.log1p((document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+        return idf, idf[term_ids] * tf * (self.k1 + 1) / (tf + self.k1)
+
+    def _query_vector(self, query: str, vocabulary: dict, idf: np.ndarray) -> tuple:
+        term_ids = {vocabulary[word] for word in tokenize(query) if vocabulary.get(word, len(idf)) < len(idf)}
+        return np.fromiter(term_ids, dtype=np.int64, count=len(term_ids)), np.ones(len(term_ids))
@@ -0,0 +1,409 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Resilience Helpers
+
+This module provides a retry policy, a circuit breaker and a request hedger
+for the catalog upstreams. The retry policy retries transient failures with
+exponential backoff and full jitter, honours server-supplied Retry-After
+delays and stops once a per-request time budget is spent. The circuit
+breaker stops calling an upstream whose recent calls mostly failed, so tools
+fail fast instead of waiting out a timeout on every call, and lets a single
+probe through after a cool-down to detect recovery.
+The hedger sends a second attempt of an idempotent read when the first one
+is slower than the upstream's recent p95 latency, and uses whichever answer
+arrives first.
+"""
+
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read an on/off setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    return value.lower() not in ("0", "false", "no")
+
+
+class RetryPolicy:
+    """
+    Retry transient failures with exponential backoff, jitter and a time budget
+
+    Attempt n (counting from 0) that fails with a retryable error is followed
+    by a delay drawn uniformly from [0, min(max_delay, base_delay * 2**n)]. A
+    Retry-After delay supplied by the server replaces the drawn delay when it
+    is longer. Retrying stops after max_attempts attempts, or when the next
+    delay would take the request past budget_seconds since its first attempt.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.2,
+        max_delay: float = 5.0,
+        budget_seconds: float = 10.0,
+        is_retryable: Callable[[BaseException], bool] | None = None,
+        retry_after: Callable[[BaseException], float | None] | None = None,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Create a retry policy
+
+        Args:
+            max_attempts: Total attempts including the first
+            base_delay: Backoff ceiling in seconds for the first retry, doubling for each retry after it
+            max_delay: Largest backoff ceiling in seconds
+            budget_seconds: Time from the first attempt after which no further retry is started
+            is_retryable: Returns True for errors worth retrying (default: every exception)
+            retry_after: Returns the server-requested delay in seconds for an error, if any
+            sleep: Function used to wait between attempts
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_seconds = budget_seconds
+        self.is_retryable = is_retryable or (lambda error: True)
+        self.retry_after = retry_after or (lambda error: None)
+        self.sleep = sleep
+        self._counts = {"calls": 0, "retries": 0, "attempts_exhausted": 0, "budget_exhausted": 0}
+        self._lock = threading.Lock()
+
+    def backoff(self, retry: int) -> float:
+        """Jittered delay in seconds before retry number `retry` (counting from 0)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counts[counter] += 1
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Call fn, retrying it while it fails with retryable errors
+
+        Args:
+            fn: Function taking no arguments that calls the upstream
+
+        Returns:
+            Any: The value returned by the first successful attempt
+
+        Raises:
+            Exception: The last attempt's error, when it is not retryable or no retry is left
+        """
+        self._count("calls")
+        started = time.monotonic()
+        for attempt in range(self.max_attempts):
+            try:
+                return fn()
+            except Exception as e:
+                if not self.is_retryable(e):
+                    raise
+                if attempt + 1 >= self.max_attempts:
+                    self._count("attempts_exhausted")
+                    raise
+                delay = self.backoff(attempt)
+                requested = self.retry_after(e)
+                if requested is not None:
+                    delay = max(delay, requested)
+                if time.monotonic() - started + delay > self.budget_seconds:
+                    self._count("budget_exhausted")
+                    raise
+                self._count("retries")
+                self.sleep(delay)
+
+    def stats(self) -> dict:
+        """
+        Get the retry counters
+
+        Returns:
+            dict: Calls, retries made, and calls that failed after using every attempt or the time budget
+        """
+        with self._lock:
+            return dict(self._counts)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream while its circuit breaker is open"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(
+            f"The {name} circuit breaker is open after repeated failures; retrying in {max(retry_after, 0):.0f} seconds"
+        )
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker with a sliding window of call outcomes
+
+    While closed, calls go through and their outcomes are recorded. Once at
+    least min_calls of the last window_size calls have completed and the
+    fraction that failed reaches failure_rate, the breaker opens: calls are
+    rejected with CircuitOpenError for open_seconds. It then half-opens and
+    lets one probe call through; the breaker closes if the probe succeeds and
+    opens again if it fails.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float | None = None,
+        min_calls: int | None = None,
+        window_size: int | None = None,
+        open_seconds: float | None = None,
+        is_failure: Callable[[BaseException], bool] | None = None,
+        enabled: bool | None = None
+    ):
+        """
+        Create a circuit breaker
+
+        Args:
+            name: Upstream name used in errors and stats (e.g. 'unity')
+            failure_rate: Fraction of failed calls that opens the breaker (defaults to CIRCUIT_FAILURE_RATE or 0.5)
+            min_calls: Calls needed in the window before the breaker can open (defaults to CIRCUIT_MIN_CALLS or 5)
+            window_size: Number of recent calls considered (defaults to CIRCUIT_WINDOW_SIZE or 20)
+            open_seconds: Seconds to reject calls before probing (defaults to CIRCUIT_OPEN_SECONDS or 30)
+            is_failure: Returns True for exceptions that count as upstream failures (default: every exception)
+            enabled: Reject calls while open (defaults to CIRCUIT_BREAKER_ENABLED, which is on)
+        """
+        self.name = name
+        self.failure_rate = _env_float("CIRCUIT_FAILURE_RATE", 0.5) if failure_rate is None else failure_rate
+        self.min_calls = int(min_calls or _env_float("CIRCUIT_MIN_CALLS", 5))
+        self.window_size = int(window_size or _env_float("CIRCUIT_WINDOW_SIZE", 20))
+        self.open_seconds = _env_float("CIRCUIT_OPEN_SECONDS", 30) if open_seconds is None else open_seconds
+        self.is_failure = is_failure or (lambda error: True)
+        self.enabled = _env_flag("CIRCUIT_BREAKER_ENABLED", True) if enabled is None else enabled
+        self._outcomes = deque(maxlen=self.window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._counts = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open"""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                return self.HALF_OPEN
+            return self._state
+
+    def admit(self) -> bool:
+        """
+        Admit or reject a call made outside call(); its outcome must then be passed to record()
+
+        Returns:
+            bool: Whether the call is the half-open probe
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        with self._lock:
+            self._counts["calls"] += 1
+            if not self.enabled or self._state == self.CLOSED:
+                return False
+            waited = time.monotonic() - self._opened_at
+            if self._state == self.OPEN and waited >= self.open_seconds:
+                self._state = self.HALF_OPEN
+            if self._state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self._counts["rejected"] += 1
+            raise CircuitOpenError(self.name, self.open_seconds - waited)
+
+    def _open_locked(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._counts["opened"] += 1
+
+    def record(self, success: bool, probe: bool = False):
+        """
+        Record the outcome of a call made outside call()
+
+        Args:
+            success: Whether the upstream answered
+            probe: Whether the call was the half-open probe
+        """
+        with self._lock:
+            if not success:
+                self._counts["failures"] += 1
+            if probe:
+                self._probing = False
+                if success:
+                    self._state = self.CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._open_locked()
+                return
+            self._outcomes.append(success)
+            if self._state != self.CLOSED or len(self._outcomes) < self.min_calls:
+                return
+            failures = self._outcomes.count(False)
+            if failures / len(self._outcomes) >= self.failure_rate:
+                self._open_locked()
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Call the upstream through the breaker
+
+        Args:
+            fn: Function taking no arguments that calls the upstream
+
+        Returns:
+            Any: The value returned by fn
+
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        probe = self.admit()
+        try:
+            result = fn()
+        except BaseException as e:
+            self.record(not self.is_failure(e), probe)
+            raise
+        self.record(True, probe)
+        return result
+
+    def reset(self):
+        """Close the breaker and forget recorded outcomes"""
+        with self._lock:
+            self._state = self.CLOSED
+            self._outcomes.clear()
+            self._probing = False
+
+    def stats(self) -> dict:
+        """
+        Get the breaker's state and counters
+
+        Returns:
+            dict: State, calls, failures, rejected calls and the number of times the breaker opened
+        """
+        state = self.state
+        with self._lock:
+            return {"state": state, **self._counts}
+
+
+class Hedger:
+    """
+    Send a second attempt of slow idempotent calls and keep the first answer
+
+    Latencies of successful attempts are kept in a rolling window. Once
+    min_samples are known, a call that has not finished after the window's
+    percentile latency gets a second, concurrent attempt; the first attempt
+    to succeed provides the result and the other is left to finish in the
+    background. Attempts run on the hedger's own thread pool.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        percentile: float | None = None,
+        min_samples: int | None = None,
+        window_size: int = 200,
+        max_workers: int | None = None,
+        enabled: bool | None = None
+    ):
+        """
+        Create a hedger
+
+        Args:
+            name: Upstream name used in stats (e.g. 'unity')
+            percentile: Latency percentile after which a second attempt is sent (defaults to HEDGE_PERCENTILE or 0.95)
+            min_samples: Latencies needed before hedging starts (defaults to HEDGE_MIN_SAMPLES or 20)
+            window_size: Number of recent latencies kept
+            max_workers: Attempts running at once (defaults to HEDGE_MAX_WORKERS or 64)
+            enabled: Hedge calls (defaults to HEDGE_ENABLED, which is off)
+        """
+        self.name = name
+        self.percentile = _env_float("HEDGE_PERCENTILE", 0.95) if percentile is None else percentile
+        self.min_samples = int(min_samples or _env_float("HEDGE_MIN_SAMPLES", 20))
+        self.enabled = _env_flag("HEDGE_ENABLED", False) if enabled is None else enabled
+        self._latencies = deque(maxlen=window_size)
+        self._counts = {"calls": 0, "hedged": 0, "hedge_wins": 0}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=int(max_workers or _env_float("HEDGE_MAX_WORKERS", 64)),
+            thread_name_prefix=f"{name}-hedge"
+        )
+
+    def delay(self) -> float | None:
+        """Seconds after which a call is hedged, or None while too few latencies are known"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)]
+
+    def _timed(self, fn: Callable[[], Any]) -> Any:
+        started = time.monotonic()
+        result = fn()
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+        return result
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """
+        Call fn, hedging it with a second attempt if it is slower than usual
+
+        Args:
+            fn: Idempotent function taking no arguments that calls the upstream
+
+        Returns:
+            Any: The result of the first attempt to succeed
+
+        Raises:
+            Exception: The first attempt's exception, if every attempt fails
+        """
+        with self._lock:
+            self._counts["calls"] += 1
+        delay = self.delay() if self.enabled else None
+        if delay is None:
+            return self._timed(fn)
+
+        first = self._executor.submit(self._timed, fn)
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+
+        with self._lock:
+            self._counts["hedged"] += 1
+        second = self._executor.submit(self._timed, fn)
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is second:
+                        with self._lock:
+                            self._counts["hedge_wins"] += 1
+                    return future.result()
+        return first.result()
+
+    def stats(self) -> dict:
+        """
+        Get the hedging counters
+
+        Returns:
+            dict: Calls, hedged calls, calls won by the second attempt, and the current hedge delay in ms
+        """
+        delay = self.delay()
+        with self._lock:
+            return {**self._counts, "hedge_after_ms": None if delay is None else round(delay * 1000, 1)}
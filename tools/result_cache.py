@@ -0,0 +1,280 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Tool Result Cache
+
+This module provides a size-bounded LRU cache for catalog tool results with
+per-tool TTLs. Expired results are kept for a while longer: when a tool is
+called again its upstream call is made, and if that call fails or does not
+answer within a short revalidation timeout the expired result is returned
+with a staleness marker instead of an error. Not-found results are cached
+for a short time so that repeated lookups of missing tables do not reach the
+catalog every time.
+"""
+
+import copy
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable
+
+from tools.concurrency import call_key
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+def stale_result(value: Any, age_seconds: float, reason: str) -> dict:
+    """
+    Wrap a cached result that is served after it expired
+
+    Args:
+        value: The cached tool result
+        age_seconds: Seconds since the result was fetched
+        reason: Why the cached result is served instead of a fresh one
+
+    Returns:
+        dict: The staleness marker with the cached result under 'result'
+    """
+    return {
+        "stale": True,
+        "stale_age_seconds": round(age_seconds, 1),
+        "stale_reason": reason,
+        "result": value
+    }
+
+
+def split_stale(result: Any) -> tuple:
+    """
+    Separate a tool result from its staleness marker
+
+    Args:
+        result: A tool result, possibly wrapped by stale_result
+
+    Returns:
+        tuple: (result, marker) where marker is None for fresh results and otherwise the marker without 'result'
+    """
+    if isinstance(result, dict) and result.get("stale") is True and "result" in result:
+        marker = {key: value for key, value in result.items() if key != "result"}
+        return result["result"], marker
+    return result, None
+
+
+class _Entry:
+    __slots__ = ("value", "fetched_at", "expires_at", "negative", "refreshing")
+
+    def __init__(self, value: Any, fetched_at: float, expires_at: float, negative: bool):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.expires_at = expires_at
+        self.negative = negative
+        self.refreshing = None
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of tool results with stale-while-revalidate
+
+    Results are classified with two callables: is_failure marks results that
+    mean the upstream is unavailable (never cached; an expired entry is served
+    stale instead), and is_not_found marks results that are cached for
+    negative_ttl seconds. Any other result that is an error dict is returned
+    without being cached.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttls: dict | None = None,
+        default_ttl: float | None = None,
+        max_entries: int | None = None,
+        max_stale: float | None = None,
+        negative_ttl: float | None = None,
+        revalidate_timeout: float | None = None,
+        is_failure: Callable[[Any], bool] | None = None,
+        is_not_found: Callable[[Any], bool] | None = None,
+        enabled: bool | None = None
+    ):
+        """
+        Create a result cache
+
+        Args:
+            name: Cache name used in logs and stats (e.g. 'unity')
+            ttls: Seconds each tool's results stay fresh, by tool name; RESULT_CACHE_TTL_<TOOL> overrides an entry
+            default_ttl: Seconds results of other tools stay fresh (defaults to RESULT_CACHE_TTL or 60)
+            max_entries: Results kept before the least recently used is evicted (defaults to RESULT_CACHE_MAX_ENTRIES or 1024)
+            max_stale: Seconds past expiry a result may still be served stale (defaults to RESULT_CACHE_MAX_STALE or 3600)
+            negative_ttl: Seconds not-found results are cached (defaults to RESULT_CACHE_NEGATIVE_TTL or 30)
+            revalidate_timeout: Seconds to wait for the upstream before serving a stale result (defaults to RESULT_CACHE_REVALIDATE_TIMEOUT or 2)
+            is_failure: Returns True for results meaning the upstream failed
+            is_not_found: Returns True for not-found results
+            enabled: Use the cache (defaults to RESULT_CACHE_ENABLED, which is on unless set to 0/false/no)
+        """
+        self.name = name
+        self.ttls = dict(ttls or {})
+        self.default_ttl = _env_float("RESULT_CACHE_TTL", 60) if default_ttl is None else default_ttl
+        self.max_entries = max(1, int(max_entries or _env_float("RESULT_CACHE_MAX_ENTRIES", 1024)))
+        self.max_stale = _env_float("RESULT_CACHE_MAX_STALE", 3600) if max_stale is None else max_stale
+        self.negative_ttl = _env_float("RESULT_CACHE_NEGATIVE_TTL", 30) if negative_ttl is None else negative_ttl
+        self.revalidate_timeout = (
+            _env_float("RESULT_CACHE_REVALIDATE_TIMEOUT", 2) if revalidate_timeout is None else revalidate_timeout
+        )
+        self.is_failure = is_failure or (lambda result: False)
+        self.is_not_found = is_not_found or (lambda result: False)
+        if enabled is None:
+            enabled = os.environ.get("RESULT_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+        self.enabled = enabled
+        self._entries = OrderedDict()
+        self._stats = {}
+        self._lock = threading.Lock()
+        # Upstream calls that revalidate an expired entry, so a slow one can finish after we stop waiting
+        self._refreshers = ThreadPoolExecutor(max_workers=4, thread_name_prefix=f"{name}-revalidate")
+
+    def ttl(self, tool_name: str) -> float:
+        """Seconds a tool's results stay fresh"""
+        override = os.environ.get(f"RESULT_CACHE_TTL_{tool_name.upper()}")
+        if override:
+            return float(override)
+        return self.ttls.get(tool_name, self.default_ttl)
+
+    def _count(self, tool_name: str, counter: str):
+        stats = self._stats.setdefault(
+            tool_name, {"hits": 0, "negative_hits": 0, "misses": 0, "stale": 0, "evictions": 0}
+        )
+        stats[counter] += 1
+
+    def get_or_call(self, tool_name: str, key: str, fn: Callable[[], Any], fresh: bool = False) -> Any:
+        """
+        Return a cached result for a call, or make the call and cache its result
+
+        Args:
+            tool_name: Name of the tool, which selects its TTL
+            key: Normalized arguments of the call
+            fn: Function taking no arguments that calls the upstream
+            fresh: Skip fresh cached results and call the upstream (a stale result is still served if it fails)
+
+        Returns:
+            Any: The result, a copy of the cached result, or a stale_result marker
+        """
+        if not self.enabled:
+            return fn()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((tool_name, key))
+            if entry is not None and (now > entry.expires_at + self.max_stale or (entry.negative and now > entry.expires_at)):
+                del self._entries[(tool_name, key)]
+                entry = None
+            if entry is not None and not fresh and now <= entry.expires_at:
+                self._entries.move_to_end((tool_name, key))
+                self._count(tool_name, "negative_hits" if entry.negative else "hits")
+                return copy.deepcopy(entry.value)
+            self._count(tool_name, "misses")
+            if entry is not None and entry.negative:
+                entry = None
+            if entry is not None:
+                if entry.refreshing is None:
+                    entry.refreshing = self._refreshers.submit(self._call_and_store, tool_name, key, fn)
+                refreshing = entry.refreshing
+
+        if entry is None:
+            return self._call_and_store(tool_name, key, fn)
+
+        # An expired result exists: use the upstream answer if it arrives in time, else serve the old one
+        try:
+            result = refreshing.result(timeout=self.revalidate_timeout)
+            reason = None if not self.is_failure(result) else self._failure_reason(result)
+        except FutureTimeoutError:
+            reason = f"The {self.name} catalog did not answer within {self.revalidate_timeout:g} seconds"
+        except Exception as e:
+            reason = f"The {self.name} catalog call failed: {str(e)}"
+        if reason is None:
+            return result
+
+        with self._lock:
+            self._count(tool_name, "stale")
+        return stale_result(copy.deepcopy(entry.value), time.monotonic() - entry.fetched_at, reason)
+
+    def _failure_reason(self, result: Any) -> str:
+        if isinstance(result, dict):
+            return result.get("error_message") or str(result.get("error"))
+        return f"The {self.name} catalog returned an error"
+
+    def _call_and_store(self, tool_name: str, key: str, fn: Callable[[], Any]) -> Any:
+        try:
+            result = fn()
+        finally:
+            with self._lock:
+                entry = self._entries.get((tool_name, key))
+                if entry is not None:
+                    entry.refreshing = None
+
+        negative = self.is_not_found(result)
+        if self.is_failure(result) or (not negative and isinstance(result, dict) and "error" in result):
+            return result
+
+        now = time.monotonic()
+        ttl = self.negative_ttl if negative else self.ttl(tool_name)
+        with self._lock:
+            self._entries[(tool_name, key)] = _Entry(copy.deepcopy(result), now, now + ttl, negative)
+            self._entries.move_to_end((tool_name, key))
+            while len(self._entries) > self.max_entries:
+                (evicted_tool, _), _ = self._entries.popitem(last=False)
+                self._count(evicted_tool, "evictions")
+        return result
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters
+
+        Returns:
+            dict: For each tool, fresh hits, not-found hits, misses, stale results served and evictions
+        """
+        with self._lock:
+            return {tool_name: dict(counts) for tool_name, counts in self._stats.items()}
+
+    def clear(self):
+        """Drop every cached result and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def cached(cache: ResultCache) -> Callable:
+    """
+    Decorate a tool function so that its results go through a ResultCache
+
+    Calls are keyed by the tool name and their normalized arguments. A 'fresh'
+    argument, if the function has one, is not part of the key: fresh=True
+    skips cached results but still refreshes the entry.
+
+    Args:
+        cache: Cache to store the results in
+
+    Returns:
+        Callable: Decorator for the tool function
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            fresh = bool(bound.arguments.get("fresh", False))
+            key = call_key(signature, args, kwargs, exclude=("fresh",))
+            return cache.get_or_call(fn.__name__, key, lambda: fn(*args, **kwargs), fresh=fresh)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,246 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Catalog Search Index
+
+This module provides the n-gram index that catalog snapshots use to answer
+table name, column name and comment searches. Every distinct lowercased string
+is indexed under all of its substrings of up to three characters, so a query
+only has to verify the strings that share its rarest n-gram instead of scanning
+the whole catalog. Patterns can be matched as a substring (the default), a
+prefix, a shell-style glob or a regular expression; matching is always
+case-insensitive.
+"""
+
+import fnmatch
+import re
+from array import array
+from collections import defaultdict
+from itertools import groupby
+from typing import Hashable, Iterable, Iterator
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Supported values for the `match` argument of the search tools
+MATCH_MODES = ("substring", "prefix", "glob", "regex")
+
+# Longest substring indexed per string; queries look up literals of up to this length directly
+GRAM_SIZE = 3
+
+# ASCII letters that case-insensitive regexes also match against non-ASCII characters
+# (e.g. "s" matches "ſ"), so they cannot be required as literals of a regex query
+_UNSAFE_REGEX_LITERALS = frozenset("iks")
+
+
+def _glob_literals(pattern: str) -> list:
+    """Literal fragments every string matching a lowercased glob must contain"""
+    # Bracket expressions are hard to split safely; only text before the first one is used
+    head = pattern.split("[", 1)[0]
+    return re.split(r"[*?]", head)
+
+
+def _regex_literals(pattern: str) -> list:
+    """Literal fragments every string matching a regex must contain (lowercased)"""
+    try:
+        parsed = sre_parse.parse(pattern, re.IGNORECASE)
+    except Exception:
+        return []
+    literals, run = [], []
+    # Only top-level literals are mandatory; groups, repeats and alternations end a run
+    for op, arg in parsed:
+        if op == sre_parse.LITERAL and arg < 128 and chr(arg).lower() not in _UNSAFE_REGEX_LITERALS:
+            run.append(chr(arg).lower())
+        else:
+            literals.append("".join(run))
+            run = []
+    literals.append("".join(run))
+    return literals
+
+
+class Matcher:
+    """Case-insensitive pattern compiled for one of the MATCH_MODES"""
+
+    def __init__(self, pattern: str, match: str = "substring"):
+        """
+        Compile a pattern
+
+        Args:
+            pattern: Text, prefix, glob or regular expression to match
+            match: One of MATCH_MODES
+
+        Raises:
+            ValueError: If the match mode is unknown or the regular expression is invalid
+        """
+        if match not in MATCH_MODES:
+            raise ValueError(f"Unknown match mode '{match}'. Use one of: {', '.join(MATCH_MODES)}")
+        self.pattern = pattern
+        self.match = match
+        lowered = pattern.lower()
+        if match == "substring":
+            self._test = lambda text: lowered in text
+            literals = [lowered]
+        elif match == "prefix":
+            self._test = lambda text: text.startswith(lowered)
+            literals = [lowered]
+        elif match == "glob":
+            self._test = re.compile(fnmatch.translate(lowered)).match
+            literals = _glob_literals(lowered)
+        else:
+            try:
+                self._test = re.compile(pattern, re.IGNORECASE).search
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression '{pattern}': {e}") from e
+            literals = _regex_literals(pattern)
+        # Fragments every matching string contains, used to pick index candidates
+        self.literals = [literal for literal in literals if literal]
+
+    @property
+    def search_text(self) -> str:
+        """Text to pass to a server-side search that must return a superset of the matches"""
+        if self.match == "substring":
+            return self.pattern
+        return max(self.literals, key=len, default="")
+
+    def matches_lowered(self, text: str) -> bool:
+        """Test an already lowercased string"""
+        return bool(self._test(text))
+
+    def __call__(self, text: str | None) -> bool:
+        """Test a string"""
+        return bool(self._test((text or "").lower()))
+
+
+class NgramIndex:
+    """Inverted index from n-grams to the distinct strings that contain them"""
+
+    def __init__(self):
+        self.terms = []
+        self.refs = []
+        self._term_ids = {}
+        self._postings = defaultdict(list)
+
+    def add(self, text: str, ref: Hashable):
+        """
+        Index a string
+
+        Args:
+            text: String to index (matched case-insensitively)
+            ref: Value yielded by search() when the string matches
+        """
+        key = text.lower()
+        term_id = self._term_ids.get(key)
+        if term_id is None:
+            term_id = len(self.terms)
+            self._term_ids[key] = term_id
+            self.terms.append(key)
+            self.refs.append([])
+            grams = {key[i:i + n] for n in range(1, GRAM_SIZE + 1) for i in range(len(key) - n + 1)}
+            for gram in grams:
+                self._postings[gram].append(term_id)
+        self.refs[term_id].append(ref)
+
+    def candidates(self, literals: Iterable[str]) -> Iterable[int]:
+        """
+        Narrow the strings that can match to those sharing the query's rarest n-gram
+
+        Args:
+            literals: Lowercased fragments every match contains
+
+        Returns:
+            Iterable[int]: Candidate term ids (every term when there are no literals)
+        """
+        best = None
+        for literal in literals:
+            if len(literal) <= GRAM_SIZE:
+                grams = [literal]
+            else:
+                grams = [literal[i:i + GRAM_SIZE] for i in range(len(literal) - GRAM_SIZE + 1)]
+            for gram in grams:
+                posting = self._postings.get(gram)
+                if posting is None:
+                    return ()
+                if best is None or len(posting) < len(best):
+                    best = posting
+        return range(len(self.terms)) if best is None else best
+
+    def search(self, matcher: Matcher) -> Iterator[Hashable]:
+        """
+        Yield the refs of every indexed string the matcher accepts
+
+        Args:
+            matcher: Compiled pattern
+
+        Yields:
+            Hashable: Refs of matching strings, grouped by string
+        """
+        terms = self.terms
+        for term_id in self.candidates(matcher.literals):
+            if matcher.matches_lowered(terms[term_id]):
+                yield from self.refs[term_id]
+
+
+class SearchIndex:
+    """Name, column and comment indexes over the tables of one catalog snapshot"""
+
+    def __init__(self, tables: list):
+        """
+        Build the indexes
+
+        Args:
+            tables: Tables in the get_table_details format, in catalog order
+        """
+        self.names = NgramIndex()
+        self.descriptions = NgramIndex()
+        self.columns = NgramIndex()
+        self.column_comments = NgramIndex()
+        # Columns are numbered across the whole catalog so that ordinal order is catalog order
+        self._column_table = array("L")
+        self._first_column = array("L")
+        for table_id, table in enumerate(tables):
+            self.names.add(table["name"], table_id)
+            if table.get("description"):
+                self.descriptions.add(table["description"], table_id)
+            self._first_column.append(len(self._column_table))
+            for column in table["columns"]:
+                ordinal = len(self._column_table)
+                self._column_table.append(table_id)
+                self.columns.add(column["name"], ordinal)
+                if column.get("comment"):
+                    self.column_comments.add(column["comment"], ordinal)
+
+    def match_tables(self, matcher: Matcher, include_comments: bool = False) -> list:
+        """
+        Find tables whose name (or, optionally, description) matches
+
+        Args:
+            matcher: Compiled pattern
+            include_comments: Also match table descriptions
+
+        Returns:
+            list: Matching table positions in catalog order
+        """
+        hits = set(self.names.search(matcher))
+        if include_comments:
+            hits.update(self.descriptions.search(matcher))
+        return sorted(hits)
+
+    def match_columns(self, matcher: Matcher, include_comments: bool = False) -> Iterator[tuple]:
+        """
+        Find columns whose name (or, optionally, comment) matches
+
+        Args:
+            matcher: Compiled pattern
+            include_comments: Also match column comments
+
+        Yields:
+            tuple: (table position, positions of its matching columns), in catalog order
+        """
+        ordinals = set(self.columns.search(matcher))
+        if include_comments:
+            ordinals.update(self.column_comments.search(matcher))
+        for table_id, group in groupby(sorted(ordinals), key=self._column_table.__getitem__):
+            first = self._first_column[table_id]
+            yield table_id, [ordinal - first for ordinal in group]
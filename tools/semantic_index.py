@@ -0,0 +1,405 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Semantic Catalog Search
+
+This module provides a local, CPU-only TF-IDF vector index over table
+metadata, so that a question such as "where is customer churn data" can be
+answered with one ranked search instead of many literal name and column
+searches. Each table is a sparse vector of the words (and, for names,
+character trigrams) in its name, database, description, column names and
+column comments, weighted by field. Queries are ranked by cosine similarity.
+
+Tables are indexed incrementally: only new or changed tables are tokenized,
+and the NumPy arrays used for scoring are rebuilt from the cached per-table
+vectors the next time the index is searched. TableVectorIndex holds this
+machinery for other ranking schemes as well (see tools/ranked_search.py).
+"""
+
+import math
+import os
+import re
+import threading
+from typing import Hashable, Iterable
+
+import numpy as np
+
+# Seconds a semantic search waits for a cold catalog index to finish loading
+INDEX_WAIT_SECONDS = float(os.environ.get("SEMANTIC_INDEX_WAIT", "30"))
+
+# Default and maximum number of results returned per query
+DEFAULT_TOP_K = 10
+MAX_TOP_K = 100
+
+# Weight of a word by where it occurs; a table's own name counts most
+FIELD_WEIGHTS = {"name": 3.0, "column": 2.0, "database": 1.0, "description": 1.0, "comment": 1.0}
+
+# Character trigrams of names count for this fraction of the word's weight, so that
+# abbreviations and partial words ("cust", "txn_amt") still match
+TRIGRAM_WEIGHT = 0.3
+
+# Words that carry no meaning in catalog questions
+STOP_WORDS = frozenset("""
+    a about all an and any are as at be by can data do does find for from get has have how i in is it
+    its list me my of on or our show that the their there these this to we what where which who with
+    table tables column columns dataset datasets field fields contain contains containing stored store
+""".split())
+
+_WORD = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+def _stem(word: str) -> str:
+    """Fold plurals so that 'customers' matches 'customer'"""
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list:
+    """
+    Split text or an identifier into lowercased, plural-folded words
+
+    snake_case, camelCase and dotted names are split into their parts, and
+    stop words are dropped.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        list: Words in order of appearance
+    """
+    words = (word.lower() for word in _WORD.findall(text or ""))
+    return [_stem(word) for word in words if word not in STOP_WORDS]
+
+
+def _trigrams(word: str) -> list:
+    padded = f"^{word}$"
+    return ["#" + padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def table_features(table: dict) -> dict:
+    """
+    Weighted term frequencies of a table's metadata
+
+    Args:
+        table: Table in the get_table_details format
+
+    Returns:
+        dict: Feature (word, or '#'-prefixed trigram) to weighted frequency
+    """
+    features = {}
+
+    def add(text: str, field: str, trigrams: bool = False):
+        weight = FIELD_WEIGHTS[field]
+        for word in tokenize(text):
+            features[word] = features.get(word, 0.0) + weight
+            if trigrams:
+                for gram in _trigrams(word):
+                    features[gram] = features.get(gram, 0.0) + weight * TRIGRAM_WEIGHT
+
+    add(table.get("name", ""), "name", trigrams=True)
+    add(table.get("database", ""), "database")
+    add(table.get("description", ""), "description")
+    for column in table.get("columns") or []:
+        add(column.get("name", ""), "column", trigrams=True)
+        add(column.get("comment", ""), "comment")
+    return features
+
+
+def query_features(query: str) -> dict:
+    """Term frequencies of a search query, with trigrams of its words"""
+    features = {}
+    for word in tokenize(query):
+        features[word] = features.get(word, 0.0) + 1.0
+        for gram in _trigrams(word):
+            features[gram] = features.get(gram, 0.0) + TRIGRAM_WEIGHT
+    return features
+
+
+def _matching_columns(table: dict, words: set) -> list:
+    """Columns whose name or comment shares a word (or a word prefix of 3+ letters) with the query"""
+    matches = []
+    for column in table.get("columns") or []:
+        column_words = set(tokenize(column.get("name", ""))) | set(tokenize(column.get("comment", "")))
+        if any(
+            word == column_word or (min(len(word), len(column_word)) >= 3
+                                    and (word.startswith(column_word) or column_word.startswith(word)))
+            for word in words for column_word in column_words
+        ):
+            matches.append(column.get("name", ""))
+    return matches
+
+
+class TableVectorIndex:
+    """
+    Thread-safe sparse vector index of tables with batched top-k search
+
+    Tables are added, replaced and removed by key. Subclasses turn a table
+    into term frequencies (_vectorize), weight them into per-table term
+    impacts (_weigh) and weight query terms (_query_vector); a table's score
+    for a query is the dot product of the two, summed from the postings of
+    the query's terms.
+    """
+
+    def __init__(self, name: str):
+        """
+        Create an empty index
+
+        Args:
+            name: Catalog name, e.g. 'unity'
+        """
+        self.name = name
+        self._vocabulary = {}
+        self._tables = {}
+        self._vectors = {}
+        self._synced = None
+        self._arrays = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tables)
+
+    def _term_ids(self, features: Iterable) -> np.ndarray:
+        return np.fromiter(
+            (self._vocabulary.setdefault(feature, len(self._vocabulary)) for feature in features),
+            dtype=np.int64
+        )
+
+    def _vectorize(self, table: dict) -> tuple:
+        """Term ids of a table's features followed by their per-table statistics; term ids are unique"""
+        raise NotImplementedError
+
+    def _weigh(self, vectors: list, doc_ids: np.ndarray, term_ids: np.ndarray, document_frequency: np.ndarray) -> tuple:
+        """Return (idf per term, impact per concatenated (document, term) entry)"""
+        raise NotImplementedError
+
+    def _query_vector(self, query: str, vocabulary: dict, idf: np.ndarray) -> tuple:
+        """Return (term ids, weights) of the query's known terms"""
+        raise NotImplementedError
+
+    def upsert(self, key: Hashable, table: dict):
+        """
+        Add a table, or replace the table indexed under the same key
+
+        Args:
+            key: Identifier of the table, e.g. (database, name)
+            table: Table in the get_table_details format
+        """
+        with self._lock:
+            self._tables[key] = table
+            self._vectors[key] = self._vectorize(table)
+            self._arrays = None
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove a table
+
+        Returns:
+            bool: Whether the table was indexed
+        """
+        with self._lock:
+            if self._tables.pop(key, None) is None:
+                return False
+            del self._vectors[key]
+            self._arrays = None
+            return True
+
+    def sync(self, tables: Iterable[dict]) -> dict:
+        """
+        Make the index hold exactly the given tables, keyed by (database, name)
+
+        Only tables that are new or differ from the indexed ones are tokenized;
+        the catalog snapshots reuse unchanged table objects, which are skipped
+        without comparing them.
+
+        Args:
+            tables: Tables in the get_table_details format
+
+        Returns:
+            dict: Number of tables added or updated, and removed
+        """
+        with self._lock:
+            seen = set()
+            changed = 0
+            for table in tables:
+                key = (table.get("database"), table.get("name"))
+                seen.add(key)
+                current = self._tables.get(key)
+                if current is table or current == table:
+                    continue
+                self._tables[key] = table
+                self._vectors[key] = self._vectorize(table)
+                changed += 1
+            removed = [key for key in self._tables if key not in seen]
+            for key in removed:
+                del self._tables[key]
+                del self._vectors[key]
+            if changed or removed:
+                self._arrays = None
+            return {"updated": changed, "removed": len(removed)}
+
+    def sync_snapshot(self, snapshot) -> dict:
+        """
+        Sync the index with a catalog snapshot, unless it is the one synced last
+
+        Args:
+            snapshot: CatalogSnapshot of the catalog
+
+        Returns:
+            dict: Number of tables added or updated, and removed
+        """
+        if snapshot is self._synced:
+            return {"updated": 0, "removed": 0}
+        changes = self.sync(snapshot.tables)
+        self._synced = snapshot
+        return changes
+
+    def _build(self) -> tuple:
+        """Build the scoring arrays: keys, idf, and postings sorted by term"""
+        keys = list(self._vectors)
+        vectors = [self._vectors[key] for key in keys]
+        vocabulary_size = len(self._vocabulary)
+        if not vectors:
+            empty = np.zeros(0, dtype=np.int64)
+            return keys, np.zeros(vocabulary_size), np.zeros(vocabulary_size + 1, dtype=np.int64), empty, np.zeros(0)
+
+        lengths = np.fromiter((len(vector[0]) for vector in vectors), dtype=np.int64, count=len(vectors))
+        doc_ids = np.repeat(np.arange(len(vectors), dtype=np.int64), lengths)
+        term_ids = np.concatenate([vector[0] for vector in vectors])
+        document_frequency = np.bincount(term_ids, minlength=vocabulary_size)
+        idf, weights = self._weigh(vectors, doc_ids, term_ids, document_frequency)
+
+        # Postings: the documents and weights of each term, stored contiguously by term
+        order = np.argsort(term_ids, kind="stable")
+        offsets = np.zeros(vocabulary_size + 1, dtype=np.int64)
+        np.cumsum(document_frequency, out=offsets[1:])
+        return keys, idf, offsets, doc_ids[order], weights[order]
+
+    def search(self, queries: list, top_k: int = DEFAULT_TOP_K, min_score: float = 0.0) -> list:
+        """
+        Rank tables against several queries at once
+
+        Args:
+            queries: Natural-language queries
+            top_k: Results per query (at most MAX_TOP_K)
+            min_score: Smallest score to return (results must score above it)
+
+        Returns:
+            list: For each query, up to top_k results with database, table, description, score and
+            matching_columns, best first
+        """
+        top_k = max(1, min(int(top_k or DEFAULT_TOP_K), MAX_TOP_K))
+        with self._lock:
+            if self._arrays is None:
+                self._arrays = self._build()
+            keys, idf, offsets, posting_docs, posting_weights = self._arrays
+            tables = self._tables
+            vocabulary = self._vocabulary
+        document_count = len(keys)
+        if not document_count or not queries:
+            return [[] for _ in queries]
+
+        # Accumulate each query's postings into its row of one score matrix, then rank all rows at once
+        scores = np.zeros((len(queries), document_count))
+        for position, query in enumerate(queries):
+            term_ids, query_weights = self._query_vector(query, vocabulary, idf)
+            if not len(term_ids):
+                continue
+            docs = np.concatenate([posting_docs[offsets[term_id]:offsets[term_id + 1]] for term_id in term_ids])
+            weights = np.concatenate([
+                posting_weights[offsets[term_id]:offsets[term_id + 1]] * query_weight
+                for term_id, query_weight in zip(term_ids, query_weights)
+            ])
+            scores[position] = np.bincount(docs, weights=weights, minlength=document_count)
+
+        k = min(top_k, document_count)
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for position, query in enumerate(queries):
+            row = scores[position]
+            ranked = candidates[position][np.argsort(-row[candidates[position]], kind="stable")]
+            words = set(tokenize(query))
+            matches = []
+            for doc_id in ranked:
+                score = float(row[doc_id])
+                if score <= min_score:
+                    break
+                table = tables.get(keys[doc_id])
+                if table is None:
+                    continue
+                matches.append({
+                    "database": table.get("database"),
+                    "table": table.get("name"),
+                    "description": table.get("description", ""),
+                    "score": round(score, 4),
+                    "matching_columns": _matching_columns(table, words)
+                })
+            results.append(matches)
+        return results
+
+    def search_catalog(self, catalog_index, label: str, query: str, top_k: int = DEFAULT_TOP_K) -> list | dict:
+        """
+        Search a catalog's tables, syncing the index with the catalog's current snapshot first
+
+        Args:
+            catalog_index: CatalogIndex of the catalog
+            label: Catalog name for messages, e.g. 'Unity'
+            query: Natural-language query
+            top_k: Number of tables to return
+
+        Returns:
+            list: Ranked results as returned by search
+            dict: Error information if the query has no searchable words or the catalog is not indexed
+        """
+        if not tokenize(query):
+            return {
+                "error": "invalid_query",
+                "error_message": f"The query '{query}' has no searchable words",
+                "suggestion": "Describe the data with a few keywords, e.g. 'customer churn'"
+            }
+        snapshot = catalog_index.wait(INDEX_WAIT_SECONDS)
+        if snapshot is None:
+            return {
+                "error": f"{self.name}_catalog_index_unavailable",
+                "error_message": f"The {label} catalog has not been indexed yet"
+                + ("" if catalog_index.enabled else " (CATALOG_INDEX_ENABLED is off)"),
+                "suggestion": "Try again shortly, or use the name and column search tools"
+            }
+        self.sync_snapshot(snapshot)
+        return self.search([query], top_k)[0]
+
+
+class SemanticIndex(TableVectorIndex):
+    """
+    TF-IDF index of tables ranked by cosine similarity
+
+    Term weights are log(1 + tf) * idf over the field-weighted frequencies of
+    table_features, and table vectors are L2-normalized, so a result's score
+    is the cosine similarity between the query and the table.
+    """
+
+    def _vectorize(self, table: dict) -> tuple:
+        features = table_features(table)
+        return self._term_ids(features), np.fromiter(features.values(), dtype=np.float64, count=len(features))
+
+    def _weigh(self, vectors: list, doc_ids: np.ndarray, term_ids: np.ndarray, document_frequency: np.ndarray) -> tuple:
+        counts = np.concatenate([vector[1] for vector in vectors])
+        idf = np.log((1 + len(vectors)) / (1 + document_frequency)) + 1
+        weights = np.log1p(counts) * idf[term_ids]
+        norms = np.sqrt(np.bincount(doc_ids, weights=weights * weights, minlength=len(vectors)))
+        return idf, weights / norms[doc_ids]
+
+    def _query_vector(self, query: str, vocabulary: dict, idf: np.ndarray) -> tuple:
+        features = {
+            vocabulary[feature]: count
+            for feature, count in query_features(query).items()
+            if vocabulary.get(feature, len(idf)) < len(idf)
+        }
+        term_ids = np.fromiter(features, dtype=np.int64, count=len(features))
+        weights = np.log1p(np.fromiter(features.values(), dtype=np.float64, count=len(features))) * idf[term_ids]
+        if len(weights):
+            weights /= math.sqrt(float(np.dot(weights, weights)))
+        return term_ids, weights
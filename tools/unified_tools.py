@@ -0,0 +1,194 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Unified Catalog Tools
+
+This module provides tools that search the Unity catalog and the AWS Glue
+catalog in a single call. Both catalogs are queried concurrently and the
+results are returned in the unified agent's unity_results/glue_results shape,
+so a "search both catalogs" request takes one tool call instead of two
+sequential ones.
+"""
+
+import json
+import os
+from typing import Any, Callable
+
+from strands import tool
+from tools.concurrency import DeadlineExceeded, run_concurrently
+from tools.result_cache import split_stale
+from tools.glue_tools import (
+    search_tables_by_name as search_glue_tables_by_name,
+    search_tables_by_column as search_glue_tables_by_column,
+    ranked_search_glue_tables,
+    semantic_search_glue_tables
+)
+from tools.semantic_index import DEFAULT_TOP_K
+from tools.unity_tools import (
+    search_tables_by_name as search_unity_tables_by_name,
+    search_tables_by_column as search_unity_tables_by_column,
+    ranked_search_unity_tables,
+    semantic_search_unity_tables
+)
+
+# Seconds to wait for both catalogs before returning whatever has arrived
+UNIFIED_SEARCH_TIMEOUT = float(os.environ.get("UNIFIED_SEARCH_TIMEOUT", "60"))
+
+CATALOG_LABELS = {"unity": "Unity", "glue": "AWS Glue"}
+
+
+def _dedupe(results: list) -> list:
+    """
+    Drop repeated tables from a search result, merging their matching columns
+
+    Args:
+        results: Search results with database and table keys
+
+    Returns:
+        list: Results with one entry per table, in first-seen order
+    """
+    merged = {}
+    for result in results:
+        key = (result.get("database"), result.get("table"))
+        if key not in merged:
+            merged[key] = dict(result)
+        elif "matching_columns" in result:
+            columns = merged[key].setdefault("matching_columns", [])
+            columns.extend(col for col in result["matching_columns"] if col not in columns)
+    return list(merged.values())
+
+
+def _catalog_result(catalog: str, outcome, timeout: float) -> tuple:
+    """Turn one catalog's outcome into its results list or an error marker, and its staleness marker"""
+    label = CATALOG_LABELS[catalog]
+    if isinstance(outcome.error, DeadlineExceeded):
+        return {
+            "error": f"{catalog}_catalog_timeout",
+            "error_message": f"The {label} catalog did not respond within {timeout:g} seconds",
+            "suggestion": "Retry the search or raise UNIFIED_SEARCH_TIMEOUT"
+        }, None
+    if not outcome.ok:
+        return {
+            "error": f"{catalog}_catalog_error",
+            "error_message": f"Error searching the {label} catalog: {str(outcome.error)}",
+            "suggestion": f"Please check the {label} catalog configuration"
+        }, None
+    result = outcome.result
+    if isinstance(result, str):
+        # Remote tools return their result as JSON text
+        try:
+            result = json.loads(result)
+        except json.JSONDecodeError:
+            return {
+                "error": f"{catalog}_catalog_error",
+                "error_message": result,
+                "suggestion": f"Please check the {label} catalog configuration"
+            }, None
+    # Results served from the cache because the catalog could not answer carry a staleness marker
+    result, stale = split_stale(result)
+    if isinstance(result, list):
+        return _dedupe(result), stale
+    # Error dicts returned by the catalog tools are passed through as the marker
+    return result, stale
+
+
+def search_catalogs_concurrently(
+    unity_search: Callable[[], Any],
+    glue_search: Callable[[], Any],
+    timeout: float | None = None
+) -> dict:
+    """
+    Run a Unity and a Glue search concurrently and combine their results
+
+    Args:
+        unity_search: Function running the Unity search
+        glue_search: Function running the Glue search
+        timeout: Seconds to wait for both catalogs (defaults to UNIFIED_SEARCH_TIMEOUT)
+
+    Returns:
+        dict: unity_results and glue_results, each a deduplicated list of matches or an error marker,
+        plus unity_stale/glue_stale when a catalog's results are cached ones it could not refresh
+    """
+    timeout = timeout or UNIFIED_SEARCH_TIMEOUT
+    outcomes = run_concurrently({"unity": unity_search, "glue": glue_search}, timeout)
+    combined = {}
+    for catalog, outcome in outcomes.items():
+        results, stale = _catalog_result(catalog, outcome, timeout)
+        combined[f"{catalog}_results"] = results
+        if stale:
+            combined[f"{catalog}_stale"] = stale
+    return combined
+
+
+@tool
+def search_all_catalogs_by_name(name_pattern: str, limit: int | None = None, match: str = "substring") -> dict:
+    """
+    Search for tables by name pattern in the Unity and AWS Glue catalogs at the same time
+
+    Args:
+        name_pattern: Pattern to match table names
+        limit: Maximum number of tables to return per catalog (default: no limit)
+        match: How to match the pattern: 'substring' (default), 'prefix', 'glob' (e.g. 'sales_*') or 'regex'
+
+    Returns:
+        dict: unity_results and glue_results, each a list of matching tables or an error marker
+    """
+    return search_catalogs_concurrently(
+        lambda: search_unity_tables_by_name(name_pattern, limit=limit, match=match),
+        lambda: search_glue_tables_by_name(name_pattern, limit=limit, match=match)
+    )
+
+
+@tool
+def search_all_catalogs_by_column(column_pattern: str, limit: int | None = None, match: str = "substring") -> dict:
+    """
+    Search for tables with columns matching the pattern in the Unity and AWS Glue catalogs at the same time
+
+    Args:
+        column_pattern: Pattern to match column names
+        limit: Maximum number of tables to return per catalog (default: no limit)
+        match: How to match the pattern: 'substring' (default), 'prefix', 'glob' (e.g. '*_id') or 'regex'
+
+    Returns:
+        dict: unity_results and glue_results, each a list of tables with matching columns or an error marker
+    """
+    return search_catalogs_concurrently(
+        lambda: search_unity_tables_by_column(column_pattern, limit=limit, match=match),
+        lambda: search_glue_tables_by_column(column_pattern, limit=limit, match=match)
+    )
+
+
+@tool
+def semantic_search_all_catalogs(query: str, top_k: int = DEFAULT_TOP_K) -> dict:
+    """
+    Find the tables most related to a natural-language question in the Unity and AWS Glue catalogs at the same time
+
+    Args:
+        query: Question or keywords, e.g. 'where is customer churn data'
+        top_k: Number of tables to return per catalog (default 10, at most 100)
+
+    Returns:
+        dict: unity_results and glue_results, each a ranked list of tables with scores and matching columns or an error marker
+    """
+    return search_catalogs_concurrently(
+        lambda: semantic_search_unity_tables(query, top_k=top_k),
+        lambda: semantic_search_glue_tables(query, top_k=top_k)
+    )
+
+
+@tool
+def ranked_search_all_catalogs(query: str, top_k: int = DEFAULT_TOP_K) -> dict:
+    """
+    Search the Unity and AWS Glue catalogs by keywords at the same time, returning the best matches ranked by BM25 score
+
+    Args:
+        query: Keywords, e.g. 'customer orders'
+        top_k: Number of tables to return per catalog (default 10, at most 100)
+
+    Returns:
+        dict: unity_results and glue_results, each a ranked list of tables with scores and matching columns or an error marker
+    """
+    return search_catalogs_concurrently(
+        lambda: ranked_search_unity_tables(query, top_k=top_k),
+        lambda: ranked_search_glue_tables(query, top_k=top_k)
+    )
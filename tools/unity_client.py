@@ -0,0 +1,279 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+"""
+Unity Catalog HTTP Client
+
+This module provides a shared, pooled HTTP client for the Unity catalog REST API.
+All Unity catalog tools go through a single keep-alive session so that catalog,
+schema and table lookups reuse TCP (and TLS) connections instead of opening a
+new one per request.
+"""
+
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterator
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from tools.resilience import CircuitBreaker, CircuitOpenError, Hedger, RetryPolicy
+
+# Default base URL for the Unity catalog API, overridable with UNITY_CATALOG_URL
+DEFAULT_BASE_URL = "http://localhost:8080/api/2.1/unity-catalog"
+
+# Error statuses that mean "try again later" rather than a problem with the request
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to a default"""
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+class UnityUnavailableError(requests.exceptions.ConnectionError):
+    """Raised without contacting the Unity catalog while its circuit breaker is open"""
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """
+    Whether a request error means the Unity catalog is unhealthy
+
+    Error responses below 500 (such as 404 for a missing table) come from a
+    healthy server and are not counted against the circuit breaker.
+    """
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500
+    return True
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Whether a failed Unity catalog request is worth retrying
+
+    Throttling (429), gateway errors (502, 503, 504), connection errors and
+    timeouts are transient. Other error responses would fail the same way
+    again.
+    """
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """
+    Read the delay requested by a Retry-After header on an error response
+
+    Args:
+        error: A failed request's exception
+
+    Returns:
+        float | None: Seconds to wait, or None if the response has no usable Retry-After header
+    """
+    response = getattr(error, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def build_retry_policy() -> RetryPolicy:
+    """
+    Build the retry policy for Unity catalog requests from the environment
+
+    Returns:
+        RetryPolicy: Policy configured by UNITY_MAX_ATTEMPTS (default 4), UNITY_RETRY_BASE_DELAY (0.2),
+        UNITY_RETRY_MAX_DELAY (5) and UNITY_RETRY_BUDGET (10 seconds per request)
+    """
+    return RetryPolicy(
+        max_attempts=_env_int("UNITY_MAX_ATTEMPTS", 4),
+        base_delay=_env_float("UNITY_RETRY_BASE_DELAY", 0.2),
+        max_delay=_env_float("UNITY_RETRY_MAX_DELAY", 5),
+        budget_seconds=_env_float("UNITY_RETRY_BUDGET", 10),
+        is_retryable=is_retryable,
+        retry_after=retry_after_seconds
+    )
+
+
+class UnityClient:
+    """Thread-safe, connection-pooled client for the Unity catalog REST API"""
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float | None = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool = True,
+        verify_ssl: bool | None = None,
+        max_results: int | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedger: Hedger | None = None,
+        retry: RetryPolicy | None = None
+    ):
+        """
+        Create a Unity catalog client
+
+        Args:
+            base_url: Unity catalog API base URL (defaults to UNITY_CATALOG_URL)
+            timeout: Per-request timeout in seconds (defaults to UNITY_HTTP_TIMEOUT or 10)
+            pool_connections: Number of per-host connection pools to keep (defaults to UNITY_POOL_CONNECTIONS or 4)
+            pool_maxsize: Maximum keep-alive connections per host (defaults to UNITY_POOL_MAXSIZE or 32)
+            pool_block: Block when a host's pool is exhausted instead of opening extra connections
+            verify_ssl: Verify TLS certificates (disabled by DISABLE_SSL_VERIFY or the local SSM tunnel)
+            max_results: Page size requested from list endpoints (defaults to UNITY_MAX_RESULTS or 1000)
+            breaker: Circuit breaker for this server (defaults to one configured by the CIRCUIT_* variables)
+            hedger: Hedger for GET requests (defaults to one configured by the HEDGE_* variables; off unless HEDGE_ENABLED)
+            retry: Retry policy for failed requests (defaults to build_retry_policy())
+        """
+        self.base_url = (base_url or os.environ.get("UNITY_CATALOG_URL") or DEFAULT_BASE_URL).rstrip("/")
+        self.timeout = timeout if timeout is not None else _env_float("UNITY_HTTP_TIMEOUT", 10)
+        self.pool_connections = pool_connections or _env_int("UNITY_POOL_CONNECTIONS", 4)
+        self.pool_maxsize = pool_maxsize or _env_int("UNITY_POOL_MAXSIZE", 32)
+        self.pool_block = pool_block
+        self.max_results = max_results or _env_int("UNITY_MAX_RESULTS", 1000)
+
+        if verify_ssl is None:
+            # The SSM port-forwarding tunnel (localhost:8443) serves the ALB certificate
+            verify_ssl = not (
+                os.environ.get("DISABLE_SSL_VERIFY")
+                or self.base_url.startswith("https://localhost:8443")
+            )
+        self.verify_ssl = verify_ssl
+        if not verify_ssl:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        self.session = requests.Session()
+        self.session.verify = verify_ssl
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Connection": "keep-alive"
+        })
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.breaker = breaker or CircuitBreaker("unity", is_failure=is_upstream_failure)
+        self.hedger = hedger or Hedger("unity")
+        self.retry = retry or build_retry_policy()
+
+    def url(self, path: str) -> str:
+        """Build the absolute URL for an API path"""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def get(self, path: str, params: dict | None = None) -> dict:
+        """
+        Issue a GET request against the Unity catalog API
+
+        Args:
+            path: API path relative to the base URL, e.g. 'catalogs'
+            params: Optional query string parameters
+
+        Returns:
+            dict: The decoded JSON response body
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails or returns an error status after any retries
+            UnityUnavailableError: If the circuit breaker is open
+        """
+        def attempt():
+            response = self.session.get(self.url(path), params=params, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+
+        try:
+            # GETs are idempotent, so a slow one may be hedged with a second attempt and a failed
+            # one retried; the breaker sees one outcome per request, after its retries
+            return self.breaker.call(lambda: self.retry.call(lambda: self.hedger.call(attempt)))
+        except CircuitOpenError as e:
+            raise UnityUnavailableError(str(e)) from e
+
+    def paginate(self, path: str, key: str, params: dict | None = None,
+                 max_results: int | None = None) -> Iterator[dict]:
+        """
+        Iterate over every item of a paginated list endpoint
+
+        Pages are fetched lazily by following next_page_token, so callers that
+        stop iterating early never request the remaining pages.
+
+        Args:
+            path: API path of the list endpoint, e.g. 'schemas'
+            key: Name of the list in the response body, e.g. 'schemas'
+            params: Additional query string parameters
+            max_results: Page size (defaults to the client's max_results)
+
+        Yields:
+            dict: Each item of the listing, across all pages
+
+        Raises:
+            requests.exceptions.RequestException: If fetching any page fails
+        """
+        page_params = dict(params or {})
+        page_params["max_results"] = max_results or self.max_results
+        while True:
+            data = self.get(path, params=page_params)
+            yield from data.get(key) or []
+            page_token = data.get("next_page_token")
+            if not page_token:
+                return
+            page_params["page_token"] = page_token
+
+    def close(self):
+        """Close all pooled connections"""
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_unity_client() -> UnityClient:
+    """
+    Get the process-wide Unity catalog client, creating it on first use
+
+    Returns:
+        UnityClient: The shared client
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = UnityClient()
+    return _client
+
+
+def configure_unity_client(**kwargs) -> UnityClient:
+    """
+    Replace the process-wide Unity catalog client with a newly configured one
+
+    Args:
+        **kwargs: Keyword arguments accepted by UnityClient
+
+    Returns:
+        UnityClient: The new shared client
+    """
+    global _client
+    with _client_lock:
+        previous = _client
+        _client = UnityClient(**kwargs)
+    if previous is not None:
+        previous.close()
+    return _client
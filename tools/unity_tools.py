@@ -6,48 +6,486 @@ Unity Catalog Tools
 This module provides tools for interacting with the Unity catalog.
 """
 
+import copy
+import os
+import threading
+import time
 import requests
 import json
+from itertools import islice
+from typing import Iterator
 from strands import tool
+from tools.catalog_index import CatalogIndex, CatalogSnapshot
+from tools.concurrency import DeadlineExceeded, SingleFlight, bounded_ordered_map, coalesce, deadline_after
+from tools.ranked_search import BM25Index
+from tools.result_cache import ResultCache, cached
+from tools.search_index import MATCH_MODES, Matcher
+from tools.semantic_index import DEFAULT_TOP_K, SemanticIndex
+from tools.unity_client import UnityClient, get_unity_client
 
-# Base URL for the Unity catalog API
-BASE_URL = "http://localhost:8080/api/2.1/unity-catalog"
+# Concurrency limit and per-query deadline (seconds) for catalog-wide crawls
+SEARCH_MAX_WORKERS = int(os.environ.get("UNITY_SEARCH_CONCURRENCY", "16"))
+SEARCH_DEADLINE_SECONDS = float(os.environ.get("UNITY_SEARCH_DEADLINE", "120"))
+
+
+def iter_catalogs(client: UnityClient | None = None, max_results: int | None = None) -> Iterator[dict]:
+    """
+    Stream every catalog in the Unity metastore, following pagination
+    
+    Args:
+        client: Unity client to use (defaults to the shared client)
+        max_results: Page size (defaults to the client's max_results)
+    
+    Yields:
+        dict: Catalog objects as returned by the Unity API
+    """
+    client = client or get_unity_client()
+    yield from client.paginate("catalogs", "catalogs", max_results=max_results)
+
+
+def iter_schemas(catalog_name: str, client: UnityClient | None = None,
+                 max_results: int | None = None) -> Iterator[dict]:
+    """
+    Stream every schema in a Unity catalog, following pagination
+    
+    Args:
+        catalog_name: Name of the catalog
+        client: Unity client to use (defaults to the shared client)
+        max_results: Page size (defaults to the client's max_results)
+    
+    Yields:
+        dict: Schema objects as returned by the Unity API
+    """
+    client = client or get_unity_client()
+    yield from client.paginate(
+        "schemas", "schemas",
+        params={"catalog_name": catalog_name},
+        max_results=max_results
+    )
+
+
+def iter_tables(catalog_name: str, schema_name: str, client: UnityClient | None = None,
+                max_results: int | None = None) -> Iterator[dict]:
+    """
+    Stream every table in a Unity schema, following pagination
+    
+    Args:
+        catalog_name: Name of the catalog
+        schema_name: Name of the schema
+        client: Unity client to use (defaults to the shared client)
+        max_results: Page size (defaults to the client's max_results)
+    
+    Yields:
+        dict: Table objects as returned by the Unity API, including columns when the server provides them
+    """
+    client = client or get_unity_client()
+    yield from client.paginate(
+        "tables", "tables",
+        params={"catalog_name": catalog_name, "schema_name": schema_name},
+        max_results=max_results
+    )
+
+
+def format_table(data: dict, database_name: str) -> dict:
+    """
+    Format a Unity table object into the shape returned by get_table_details
+    
+    Args:
+        data: Table object as returned by the Unity API
+        database_name: Name of the schema (database) in format 'catalog_name.schema_name'
+    
+    Returns:
+        dict: Key information about the table
+    """
+    return {
+        "name": data.get("name", ""),
+        "database": database_name,
+        "description": data.get("comment", ""),
+        "columns": [
+            {
+                "name": col.get("name", ""),
+                "type": col.get("type_text", ""),
+                "comment": col.get("comment", "")
+            }
+            for col in data.get("columns") or []
+        ],
+        "location": data.get("storage_location", ""),
+        "format": data.get("data_source_format", "")
+    }
+
+
+def _crawl_tables(client: UnityClient, schema_keys: Iterator[tuple], deadline: float | None = None) -> Iterator[tuple]:
+    """
+    Concurrently list the tables of each schema and resolve their columns
+    
+    Columns come from the list-tables payload; a table's details are fetched only
+    when the server omits them. A failure listing a schema aborts the crawl, while
+    a failure fetching one table's details skips just that table.
+    
+    Args:
+        client: Unity client to use
+        schema_keys: (catalog_name, schema_name) pairs, consumed lazily
+        deadline: Absolute time.monotonic() deadline, or None
+    
+    Yields:
+        tuple: (catalog_name, schema_name, table object with columns), in crawl order
+    
+    Raises:
+        requests.exceptions.RequestException: If listing a schema's tables fails
+        DeadlineExceeded: If the deadline passes
+    """
+    def list_tables(schema_key):
+        catalog_name, schema_name = schema_key
+        return [(catalog_name, schema_name, table) for table in iter_tables(catalog_name, schema_name, client)]
+    
+    def resolve_columns(table_key):
+        catalog_name, schema_name, table = table_key
+        # The listing already carries columns; only fetch details when the server omits them
+        if "columns" in table:
+            return table
+        return client.get(f"tables/{catalog_name}.{schema_name}.{table.get('name')}")
+    
+    def flatten(outcomes):
+        for outcome in outcomes:
+            if not outcome.ok:
+                raise outcome.error
+            yield from outcome.result
+    
+    # Stream each stage into the next so that only the schemas in flight are held in memory
+    tables = flatten(bounded_ordered_map(list_tables, schema_keys, SEARCH_MAX_WORKERS, deadline))
+    for outcome in bounded_ordered_map(resolve_columns, tables, SEARCH_MAX_WORKERS, deadline):
+        if not outcome.ok:
+            if isinstance(outcome.error, requests.exceptions.RequestException):
+                # Skip tables that can't be accessed, but continue with others
+                continue
+            raise outcome.error
+        catalog_name, schema_name, _ = outcome.item
+        yield catalog_name, schema_name, outcome.result
+
+
+def load_unity_snapshot(client: UnityClient | None = None) -> CatalogSnapshot:
+    """
+    Crawl the whole Unity metastore into a CatalogSnapshot
+    
+    Args:
+        client: Unity client to use (defaults to the shared client)
+    
+    Returns:
+        CatalogSnapshot: Schemas and tables with their columns
+    
+    Raises:
+        requests.exceptions.RequestException: If the catalog, schema or table listings fail
+    """
+    client = client or get_unity_client()
+    loaded_at = time.time()
+    schema_keys = [
+        (catalog.get("name"), schema.get("name"))
+        for catalog in iter_catalogs(client)
+        for schema in iter_schemas(catalog.get("name"), client)
+    ]
+    tables = [
+        format_table(table, f"{catalog_name}.{schema_name}")
+        for catalog_name, schema_name, table in _crawl_tables(client, iter(schema_keys))
+    ]
+    return CatalogSnapshot([f"{c}.{s}" for c, s in schema_keys], tables, loaded_at)
+
+
+# Whether the Unity index is refreshed incrementally instead of re-crawled
+INCREMENTAL_SYNC_ENABLED = os.environ.get("UNITY_INCREMENTAL_SYNC", "true").lower() not in ("0", "false", "no")
+
+
+class UnitySchemaState:
+    """Tables of one schema as of the last sync, with the schema's updated_at watermark"""
+    
+    __slots__ = ("watermark", "tables")
+    
+    def __init__(self, watermark: int | None, tables: dict):
+        """
+        Record a schema's state
+        
+        Args:
+            watermark: Newest table updated_at in the schema's listing, or None to re-diff it next sync
+            tables: (updated_at, table in the get_table_details format) by table name, in listing order
+        """
+        self.watermark = watermark
+        self.tables = tables
+
+
+class UnityCatalogSync:
+    """
+    Copy of the Unity metastore's table metadata kept current by incremental syncs
+    
+    Every sync lists the catalogs, the schemas and each schema's tables, and
+    keeps a watermark per schema: the newest updated_at in its listing. A
+    schema whose listing has the same table names and watermark as last time
+    keeps its tables as they are. Otherwise its listing is diffed against the
+    previous one: tables that disappeared are dropped, and only tables that
+    are new or whose updated_at changed are re-read (their details are
+    fetched when the listing omits columns). Schemas that disappeared are
+    dropped with their tables.
+    
+    The listings themselves are not incremental: every sync makes one
+    request per catalog and schema (106 on the 50,000-table benchmark
+    metastore), as many as a full crawl when the listings include columns.
+    A sync only saves the per-table detail requests that a crawl makes when
+    the listings omit columns.
+    """
+    
+    def __init__(self, client: UnityClient | None = None):
+        """
+        Create an empty sync state
+        
+        Args:
+            client: Unity client to use (defaults to the shared client at each sync)
+        """
+        self.client = client
+        self.databases = []
+        self.schemas = {}
+        self.syncs = 0
+        self.last_sync = None
+        self._lock = threading.Lock()
+    
+    def sync(self) -> CatalogSnapshot:
+        """
+        Bring the copy up to date with the Unity metastore
+        
+        Returns:
+            CatalogSnapshot: Schemas and tables with their columns
+        
+        Raises:
+            requests.exceptions.RequestException: If the catalog, schema or table listings fail; the previous state is kept
+        """
+        with self._lock:
+            client = self.client or get_unity_client()
+            started = time.monotonic()
+            loaded_at = time.time()
+            schema_keys = [
+                (catalog.get("name"), schema.get("name"))
+                for catalog in iter_catalogs(client)
+                for schema in iter_schemas(catalog.get("name"), client)
+            ]
+            
+            changes = {"schemas_changed": 0, "tables_fetched": 0, "tables_updated": 0, "tables_deleted": 0}
+            schemas = {}
+            outcomes = bounded_ordered_map(lambda key: self._sync_schema(client, *key), schema_keys, SEARCH_MAX_WORKERS)
+            for outcome in outcomes:
+                if not outcome.ok:
+                    raise outcome.error
+                database_name, state, schema_changes = outcome.result
+                schemas[database_name] = state
+                for key, value in schema_changes.items():
+                    changes[key] += value
+            
+            removed = [name for name in self.schemas if name not in schemas]
+            changes["schemas_added"] = sum(1 for name in schemas if name not in self.schemas)
+            changes["schemas_removed"] = len(removed)
+            changes["tables_deleted"] += sum(len(self.schemas[name].tables) for name in removed)
+            
+            self.databases = list(schemas)
+            self.schemas = schemas
+            self.syncs += 1
+            self.last_sync = {
+                "mode": "full" if self.syncs == 1 else "incremental",
+                "schemas": len(schemas),
+                **changes,
+                "seconds": round(time.monotonic() - started, 3)
+            }
+            return self.snapshot(loaded_at)
+    
+    def snapshot(self, loaded_at: float | None = None) -> CatalogSnapshot:
+        """
+        Build a CatalogSnapshot of the current state
+        
+        Args:
+            loaded_at: time.time() of the sync that produced the state (defaults to now)
+        
+        Returns:
+            CatalogSnapshot: Schemas and tables in catalog order
+        """
+        tables = [
+            table
+            for database_name in self.databases
+            for _, table in self.schemas[database_name].tables.values()
+        ]
+        return CatalogSnapshot(self.databases, tables, loaded_at)
+    
+    def state(self) -> dict | None:
+        """
+        Watermarks of the current state, to be saved with its snapshot
+        
+        Returns:
+            dict | None: Sync count, and each schema's watermark and table updated_at values, or None before the first sync
+        """
+        with self._lock:
+            if not self.syncs:
+                return None
+            return {
+                "syncs": self.syncs,
+                "schemas": {
+                    database_name: [state.watermark, {name: updated_at for name, (updated_at, _) in state.tables.items()}]
+                    for database_name, state in self.schemas.items()
+                }
+            }
+    
+    def restore(self, snapshot: CatalogSnapshot, state: dict) -> bool:
+        """
+        Resume from a snapshot saved with state(), so that the next sync is incremental
+        
+        Args:
+            snapshot: Snapshot the state was saved with
+            state: Value returned by state()
+        
+        Returns:
+            bool: Whether the state matched the snapshot and was restored
+        """
+        try:
+            saved = state["schemas"]
+            schemas = {}
+            for database_name in snapshot.list_databases():
+                watermark, updated = saved[database_name]
+                schemas[database_name] = UnitySchemaState(watermark, {
+                    table["name"]: (updated.get(table["name"]), table)
+                    for table in snapshot.tables_by_database[database_name]
+                })
+            syncs = int(state["syncs"])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return False
+        with self._lock:
+            self.databases = snapshot.list_databases()
+            self.schemas = schemas
+            self.syncs = syncs
+            self.last_sync = {"mode": "restored", "schemas": len(schemas), "tables": len(snapshot.tables)}
+        return True
+    
+    def _sync_schema(self, client: UnityClient, catalog_name: str, schema_name: str) -> tuple:
+        """Diff one schema's listing against its previous state, returning (database name, state, change counts)"""
+        database_name = f"{catalog_name}.{schema_name}"
+        previous = self.schemas.get(database_name)
+        listing = list(iter_tables(catalog_name, schema_name, client))
+        names = [table.get("name") for table in listing]
+        watermark = max((table.get("updated_at") or 0 for table in listing), default=0)
+        if previous is not None and previous.watermark == watermark and list(previous.tables) == names:
+            return database_name, previous, {}
+        
+        old_tables = previous.tables if previous is not None else {}
+        tables = {}
+        listed = set(names)
+        changes = {
+            "schemas_changed": 1,
+            "tables_fetched": 0,
+            "tables_updated": 0,
+            "tables_deleted": sum(1 for name in old_tables if name not in listed)
+        }
+        complete = True
+        for table in listing:
+            name = table.get("name")
+            updated_at = table.get("updated_at")
+            old = old_tables.get(name)
+            if old is not None and updated_at is not None and old[0] == updated_at:
+                tables[name] = old
+                continue
+            # The listing usually carries columns; only fetch details when the server omits them
+            if "columns" not in table:
+                changes["tables_fetched"] += 1
+                try:
+                    table = client.get(f"tables/{catalog_name}.{schema_name}.{name}")
+                except requests.exceptions.RequestException:
+                    # Keep the previous version, if any, and read the table again next sync
+                    complete = False
+                    if old is not None:
+                        tables[name] = old
+                    continue
+            tables[name] = (updated_at, format_table(table, database_name))
+            changes["tables_updated"] += 1
+        return database_name, UnitySchemaState(watermark if complete else None, tables), changes
+
+
+# Unity metadata kept current by incremental syncs; see unity_sync.last_sync
+unity_sync = UnityCatalogSync()
+
+# Process-wide snapshot of the Unity metastore that the tools answer from
+unity_index = CatalogIndex("unity", unity_sync.sync if INCREMENTAL_SYNC_ENABLED else load_unity_snapshot)
+
+# Concurrent identical tool calls share one upstream request; see unity_flights.stats()
+unity_flights = SingleFlight()
+
+# Errors meaning the Unity catalog could not answer, and errors for objects that don't exist
+UPSTREAM_FAILURE_ERRORS = ("unity_catalog_unavailable", "unity_catalog_timeout", "unity_catalog_error")
+NOT_FOUND_ERRORS = ("database_not_found", "table_not_found")
+
+# Recent tool results, served stale when the Unity catalog is down or slow; see unity_cache.stats()
+unity_cache = ResultCache(
+    "unity",
+    ttls={
+        "list_unity_databases": 300,
+        "list_unity_tables": 120,
+        "get_table_details": 60,
+        "search_tables_by_name": 30,
+        "search_tables_by_column": 30
+    },
+    is_failure=lambda result: isinstance(result, dict) and result.get("error") in UPSTREAM_FAILURE_ERRORS,
+    is_not_found=lambda result: isinstance(result, dict) and result.get("error") in NOT_FOUND_ERRORS
+)
+
+
+def is_not_found(error: requests.exceptions.RequestException) -> bool:
+    """Whether a Unity API error is a 404 for a missing catalog object"""
+    return getattr(error, "response", None) is not None and error.response.status_code == 404
+
+
+def invalid_pattern_error(error: ValueError) -> dict:
+    """
+    Build the error returned by the search tools for an unusable pattern
+    
+    Args:
+        error: The ValueError raised while compiling the pattern
+    
+    Returns:
+        dict: Error information
+    """
+    return {
+        "error": "invalid_pattern",
+        "error_message": str(error),
+        "suggestion": f"Use one of the match modes {', '.join(MATCH_MODES)} with a valid pattern"
+    }
 
 
 @tool
-def list_unity_databases() -> list | dict:
+@cached(unity_cache)
+@coalesce(unity_flights)
+def list_unity_databases(fresh: bool = False) -> list | dict:
     """
     List all schemas (databases) in the Unity catalog
     
+    Args:
+        fresh: Bypass the cached catalog snapshot and read directly from the Unity catalog
+    
     Returns:
         list: A list of schema (database) names
         dict: Error information if the Unity catalog service is unavailable
     """
+    snapshot = None if fresh else unity_index.snapshot()
+    if snapshot is not None:
+        return snapshot.list_databases()
+    
+    client = get_unity_client()
     try:
         # First, get all catalogs
         try:
-            catalogs_response = requests.get(f"{BASE_URL}/catalogs", timeout=10)
-            catalogs_response.raise_for_status()
+            catalog_names = [catalog.get("name") for catalog in iter_catalogs(client)]
         except requests.exceptions.RequestException as e:
             return {
                 "error": "unity_catalog_unavailable",
                 "error_message": f"Failed to connect to Unity catalog service: {str(e)}",
-                "suggestion": "Please ensure the Unity catalog service is running at " + BASE_URL
+                "suggestion": "Please ensure the Unity catalog service is running at " + client.base_url
             }
-            
-        catalogs_data = catalogs_response.json()
         
         # Then, get schemas for each catalog
         all_schemas = []
-        for catalog in catalogs_data.get("catalogs", []):
-            catalog_name = catalog.get("name")
+        for catalog_name in catalog_names:
             try:
-                schemas_response = requests.get(f"{BASE_URL}/schemas?catalog_name={catalog_name}", timeout=10)
-                schemas_response.raise_for_status()
-                schemas_data = schemas_response.json()
-                
                 # Add schemas with their catalog prefix
-                for schema in schemas_data.get("schemas", []):
+                for schema in iter_schemas(catalog_name, client):
                     schema_name = schema.get("name")
                     all_schemas.append(f"{catalog_name}.{schema_name}")
             except requests.exceptions.RequestException as e:
@@ -67,17 +505,21 @@ def list_unity_databases() -> list | dict:
 
 
 @tool
-def list_unity_tables(database_name: str) -> list | dict:
+@cached(unity_cache)
+@coalesce(unity_flights)
+def list_unity_tables(database_name: str, fresh: bool = False) -> list | dict:
     """
     List all tables in a specific Unity schema (database)
     
     Args:
         database_name: Name of the schema (database) in format 'catalog_name.schema_name'
-        
+        fresh: Bypass the cached catalog snapshot and read directly from the Unity catalog
+    
     Returns:
         list: A list of table names
         dict: Error information if the Unity catalog service is unavailable or the database name is invalid
     """
+    client = get_unity_client()
     try:
         # Parse catalog and schema names
         parts = database_name.split(".")
@@ -90,24 +532,27 @@ def list_unity_tables(database_name: str) -> list | dict:
         
         catalog_name, schema_name = parts
         
-        # Get tables for the specified catalog and schema
+        snapshot = None if fresh else unity_index.snapshot()
+        if snapshot is not None:
+            tables = snapshot.list_tables(database_name)
+            if tables is not None:
+                return tables
+        
+        # Get tables for the specified catalog and schema, across all pages
         try:
-            response = requests.get(
-                f"{BASE_URL}/tables?catalog_name={catalog_name}&schema_name={schema_name}", 
-                timeout=10
-            )
-            response.raise_for_status()
+            return [table.get("name") for table in iter_tables(catalog_name, schema_name, client)]
         except requests.exceptions.RequestException as e:
+            if is_not_found(e):
+                return {
+                    "error": "database_not_found",
+                    "error_message": f"Database {database_name} was not found in the Unity catalog",
+                    "suggestion": "Use list_unity_databases to see the available databases"
+                }
             return {
                 "error": "unity_catalog_unavailable",
                 "error_message": f"Failed to connect to Unity catalog service: {str(e)}",
-                "suggestion": "Please ensure the Unity catalog service is running at " + BASE_URL
+                "suggestion": "Please ensure the Unity catalog service is running at " + client.base_url
             }
-            
-        data = response.json()
-        
-        # Extract table names
-        return [table.get("name") for table in data.get("tables", [])]
     except Exception as e:
         return {
             "error": "unity_catalog_error",
@@ -117,17 +562,21 @@ def list_unity_tables(database_name: str) -> list | dict:
 
 
 @tool
-def get_table_details(database_name: str, table_name: str) -> dict:
+@cached(unity_cache)
+@coalesce(unity_flights)
+def get_table_details(database_name: str, table_name: str, fresh: bool = False) -> dict:
     """
     Get detailed information about a specific table
     
     Args:
         database_name: Name of the schema (database) in format 'catalog_name.schema_name'
         table_name: Name of the table
-        
+        fresh: Bypass the cached catalog snapshot and read directly from the Unity catalog
+    
     Returns:
         dict: Detailed information about the table or error information
     """
+    client = get_unity_client()
     try:
         # Parse catalog and schema names
         parts = database_name.split(".")
@@ -140,38 +589,30 @@ def get_table_details(database_name: str, table_name: str) -> dict:
         
         catalog_name, schema_name = parts
         
+        snapshot = None if fresh else unity_index.snapshot()
+        if snapshot is not None:
+            table = snapshot.get_table(database_name, table_name)
+            if table is not None:
+                return copy.deepcopy(table)
+        
         # Get table details
         try:
-            response = requests.get(
-                f"{BASE_URL}/tables/{catalog_name}.{schema_name}.{table_name}", 
-                timeout=10
-            )
-            response.raise_for_status()
+            data = client.get(f"tables/{catalog_name}.{schema_name}.{table_name}")
         except requests.exceptions.RequestException as e:
+            if is_not_found(e):
+                return {
+                    "error": "table_not_found",
+                    "error_message": f"Table {table_name} was not found in {database_name}",
+                    "suggestion": f"Use list_unity_tables to see the tables in {database_name}"
+                }
             return {
                 "error": "unity_catalog_unavailable",
                 "error_message": f"Failed to connect to Unity catalog service: {str(e)}",
-                "suggestion": "Please ensure the Unity catalog service is running at " + BASE_URL
+                "suggestion": "Please ensure the Unity catalog service is running at " + client.base_url
             }
-            
-        data = response.json()
         
         # Format the response to include key information
-        return {
-            "name": data.get("name", ""),
-            "database": database_name,
-            "description": data.get("comment", ""),
-            "columns": [
-                {
-                    "name": col.get("name", ""),
-                    "type": col.get("type_text", ""),
-                    "comment": col.get("comment", "")
-                }
-                for col in data.get("columns", [])
-            ],
-            "location": data.get("storage_location", ""),
-            "format": data.get("data_source_format", "")
-        }
+        return format_table(data, database_name)
     except Exception as e:
         return {
             "error": "unity_catalog_error",
@@ -181,68 +622,68 @@ def get_table_details(database_name: str, table_name: str) -> dict:
 
 
 @tool
-def search_tables_by_name(name_pattern: str) -> list | dict:
+@cached(unity_cache)
+@coalesce(unity_flights)
+def search_tables_by_name(name_pattern: str, limit: int | None = None, fresh: bool = False,
+                          match: str = "substring", include_comments: bool = False) -> list | dict:
     """
     Search for tables by name pattern
     
     Args:
         name_pattern: Pattern to match table names
-        
+        limit: Maximum number of matches to return; the crawl stops once it is reached (default: no limit)
+        fresh: Bypass the cached catalog snapshot and crawl the Unity catalog directly
+        match: How to match the pattern: 'substring' (default), 'prefix', 'glob' (e.g. 'sales_*') or 'regex'
+        include_comments: Also match the pattern against table comments
+    
     Returns:
         list: A list of matching tables with their database names
-        dict: Error information if the Unity catalog service is unavailable
+        dict: Error information if the pattern is invalid or the Unity catalog service is unavailable
     """
+    try:
+        matcher = Matcher(name_pattern, match)
+    except ValueError as e:
+        return invalid_pattern_error(e)
+    
+    snapshot = None if fresh else unity_index.snapshot()
+    if snapshot is not None:
+        return snapshot.search_by_name(name_pattern, limit, match, include_comments)
+    
+    client = get_unity_client()
     try:
         # First, get all catalogs
-        all_tables = []
-        
         try:
-            catalogs_response = requests.get(f"{BASE_URL}/catalogs", timeout=10)
-            catalogs_response.raise_for_status()
+            catalog_names = [catalog.get("name") for catalog in iter_catalogs(client)]
         except requests.exceptions.RequestException as e:
             return {
                 "error": "unity_catalog_unavailable",
                 "error_message": f"Failed to connect to Unity catalog service: {str(e)}",
-                "suggestion": "Please ensure the Unity catalog service is running at " + BASE_URL
+                "suggestion": "Please ensure the Unity catalog service is running at " + client.base_url
             }
-            
-        catalogs_data = catalogs_response.json()
         
-        # For each catalog, get schemas
-        for catalog in catalogs_data.get("catalogs", []):
-            catalog_name = catalog.get("name")
-            try:
-                schemas_response = requests.get(f"{BASE_URL}/schemas?catalog_name={catalog_name}", timeout=10)
-                schemas_response.raise_for_status()
-                schemas_data = schemas_response.json()
-                
-                # For each schema, get tables
-                for schema in schemas_data.get("schemas", []):
-                    schema_name = schema.get("name")
-                    try:
-                        tables_response = requests.get(
-                            f"{BASE_URL}/tables?catalog_name={catalog_name}&schema_name={schema_name}", 
-                            timeout=10
-                        )
-                        tables_response.raise_for_status()
-                        tables_data = tables_response.json()
-                        
-                        # Filter tables by name pattern and add to results
-                        for table in tables_data.get("tables", []):
-                            table_name = table.get("name", "")
-                            if name_pattern.lower() in table_name.lower():
-                                all_tables.append({
-                                    "database": f"{catalog_name}.{schema_name}",
-                                    "table": table_name
-                                })
-                    except requests.exceptions.RequestException:
-                        # Skip schemas that can't be accessed, but continue with others
-                        continue
-            except requests.exceptions.RequestException:
-                # Skip catalogs that can't be accessed, but continue with others
-                continue
+        def matches():
+            # For each catalog, stream schemas
+            for catalog_name in catalog_names:
+                try:
+                    for schema in iter_schemas(catalog_name, client):
+                        schema_name = schema.get("name")
+                        try:
+                            # Filter tables by name pattern as their pages arrive
+                            for table in iter_tables(catalog_name, schema_name, client):
+                                table_name = table.get("name", "")
+                                if matcher(table_name) or (include_comments and matcher(table.get("comment"))):
+                                    yield {
+                                        "database": f"{catalog_name}.{schema_name}",
+                                        "table": table_name
+                                    }
+                        except requests.exceptions.RequestException:
+                            # Skip schemas that can't be accessed, but continue with others
+                            continue
+                except requests.exceptions.RequestException:
+                    # Skip catalogs that can't be accessed, but continue with others
+                    continue
         
-        return all_tables
+        return list(islice(matches(), limit or None))
     except Exception as e:
         return {
             "error": "unity_catalog_error",
@@ -252,103 +693,144 @@ def search_tables_by_name(name_pattern: str) -> list | dict:
 
 
 @tool
-def search_tables_by_column(column_pattern: str) -> list | dict:
+@cached(unity_cache)
+@coalesce(unity_flights)
+def search_tables_by_column(column_pattern: str, limit: int | None = None, fresh: bool = False,
+                            match: str = "substring", include_comments: bool = False) -> list | dict:
     """
     Search for tables containing columns matching the pattern
     
     Args:
         column_pattern: Pattern to match column names
-        
+        limit: Maximum number of matching tables to return; the crawl stops once it is reached (default: no limit)
+        fresh: Bypass the cached catalog snapshot and crawl the Unity catalog directly
+        match: How to match the pattern: 'substring' (default), 'prefix', 'glob' (e.g. '*_id') or 'regex'
+        include_comments: Also match the pattern against column comments
+    
     Returns:
         list: A list of tables with matching columns
-        dict: Error information if the Unity catalog service is unavailable
+        dict: Error information if the pattern is invalid or the Unity catalog service is unavailable
     """
     try:
-        # First, get all tables
-        all_tables = []
-        
+        matcher = Matcher(column_pattern, match)
+    except ValueError as e:
+        return invalid_pattern_error(e)
+    
+    snapshot = None if fresh else unity_index.snapshot()
+    if snapshot is not None:
+        return snapshot.search_by_column(column_pattern, limit, match, include_comments)
+    
+    client = get_unity_client()
+    results = []
+    try:
         # Get all catalogs
         try:
-            catalogs_response = requests.get(f"{BASE_URL}/catalogs", timeout=10)
-            catalogs_response.raise_for_status()
+            catalog_names = [catalog.get("name") for catalog in iter_catalogs(client)]
         except requests.exceptions.RequestException as e:
             return {
                 "error": "unity_catalog_unavailable",
                 "error_message": f"Failed to connect to Unity catalog service: {str(e)}",
-                "suggestion": "Please ensure the Unity catalog service is running at " + BASE_URL
+                "suggestion": "Please ensure the Unity catalog service is running at " + client.base_url
             }
-            
-        catalogs_data = catalogs_response.json()
         
-        # For each catalog, get schemas
-        for catalog in catalogs_data.get("catalogs", []):
-            catalog_name = catalog.get("name")
-            try:
-                schemas_response = requests.get(f"{BASE_URL}/schemas?catalog_name={catalog_name}", timeout=10)
-                schemas_response.raise_for_status()
-                schemas_data = schemas_response.json()
-                
-                # For each schema, get tables
-                for schema in schemas_data.get("schemas", []):
-                    schema_name = schema.get("name")
-                    tables_response = requests.get(
-                        f"{BASE_URL}/tables?catalog_name={catalog_name}&schema_name={schema_name}", 
-                        timeout=10
-                    )
-                    tables_response.raise_for_status()
-                    tables_data = tables_response.json()
-                    
-                    # Add tables to the list
-                    for table in tables_data.get("tables", []):
-                        table_name = table.get("name")
-                        all_tables.append({
-                            "catalog_name": catalog_name,
-                            "schema_name": schema_name,
-                            "table_name": table_name
-                        })
-            except requests.exceptions.RequestException as e:
-                return {
-                    "error": "unity_catalog_unavailable",
-                    "error_message": f"Failed to get schema or table data: {str(e)}",
-                    "suggestion": "Please ensure the Unity catalog service is running correctly"
-                }
+        deadline = deadline_after(SEARCH_DEADLINE_SECONDS)
         
-        # For each table, get details and check columns
-        results = []
-        for table_info in all_tables:
-            catalog_name = table_info["catalog_name"]
-            schema_name = table_info["schema_name"]
-            table_name = table_info["table_name"]
-            
-            # Get table details
-            try:
-                table_response = requests.get(
-                    f"{BASE_URL}/tables/{catalog_name}.{schema_name}.{table_name}", 
-                    timeout=10
-                )
-                table_response.raise_for_status()
-                table_data = table_response.json()
-                
-                # Check if any column matches the pattern
+        def list_schemas(catalog_name):
+            return [(catalog_name, schema.get("name")) for schema in iter_schemas(catalog_name, client)]
+        
+        def flatten(outcomes):
+            # Any schema or table listing failure aborts the crawl, as the sequential version did
+            for outcome in outcomes:
+                if not outcome.ok:
+                    raise outcome.error
+                yield from outcome.result
+        
+        # Crawl catalogs -> schemas -> tables, streaming each stage into the next
+        schemas = flatten(bounded_ordered_map(list_schemas, catalog_names, SEARCH_MAX_WORKERS, deadline))
+        
+        try:
+            # For each table, check its columns (fetching details only where the listing has none)
+            for catalog_name, schema_name, table in _crawl_tables(client, schemas, deadline):
                 matching_columns = [
-                    col.get("name", "") for col in table_data.get("columns", [])
-                    if column_pattern.lower() in col.get("name", "").lower()
+                    col.get("name", "") for col in table.get("columns") or []
+                    if matcher(col.get("name", "")) or (include_comments and matcher(col.get("comment")))
                 ]
                 
                 if matching_columns:
                     results.append({
                         "database": f"{catalog_name}.{schema_name}",
-                        "table": table_name,
+                        "table": table.get("name"),
                         "matching_columns": matching_columns
                     })
-            except requests.exceptions.RequestException:
-                # Skip tables that can't be accessed, but continue with others
-                continue
+                    if limit and len(results) >= limit:
+                        # Closing the streams cancels any outstanding crawl work
+                        break
+        except requests.exceptions.RequestException as e:
+            return {
+                "error": "unity_catalog_unavailable",
+                "error_message": f"Failed to get schema or table data: {str(e)}",
+                "suggestion": "Please ensure the Unity catalog service is running correctly"
+            }
         
         return results
+    except DeadlineExceeded:
+        return {
+            "error": "unity_catalog_timeout",
+            "error_message": f"Column search did not finish within {SEARCH_DEADLINE_SECONDS} seconds",
+            "suggestion": "Narrow the search or raise UNITY_SEARCH_DEADLINE",
+            "partial_results": results
+        }
     except Exception as e:
         return {
             "error": "unity_catalog_error",
             "error_message": f"Unexpected error when searching tables by column pattern {column_pattern}: {str(e)}",
             "suggestion": "Please check the Unity catalog service configuration"
         }
+
+
+# Ranked search over the table and column metadata in the Unity snapshot
+unity_semantic_index = SemanticIndex("unity")
+
+
+@tool
+def semantic_search_unity_tables(query: str, top_k: int = DEFAULT_TOP_K) -> list | dict:
+    """
+    Find the Unity tables most related to a natural-language question
+    
+    Tables are ranked by how well their names, descriptions, column names and
+    column comments match the words of the query, so one call replaces several
+    guesses with search_tables_by_name and search_tables_by_column.
+    
+    Args:
+        query: Question or keywords, e.g. 'where is customer churn data'
+        top_k: Number of tables to return (default 10, at most 100)
+    
+    Returns:
+        list: Tables with database, table, description, score and matching_columns, best match first
+        dict: Error information if the query is empty or the Unity catalog has not been indexed
+    """
+    return unity_semantic_index.search_catalog(unity_index, "Unity", query, top_k)
+
+
+# BM25 keyword ranking over the same metadata, with impacts precomputed per snapshot
+unity_ranked_index = BM25Index("unity")
+
+
+@tool
+def ranked_search_unity_tables(query: str, top_k: int = DEFAULT_TOP_K) -> list | dict:
+    """
+    Search Unity tables by keywords and return only the best matches, ranked by BM25 score
+    
+    Unlike search_tables_by_name, which returns every match in catalog order,
+    results are scored over table names, descriptions, column names, column
+    types and column comments, with matches in the table name weighted most.
+    
+    Args:
+        query: Keywords, e.g. 'customer orders'
+        top_k: Number of tables to return (default 10, at most 100)
+    
+    Returns:
+        list: Tables with database, table, description, score and matching_columns, best match first
+        dict: Error information if the query is empty or the Unity catalog has not been indexed
+    """
+    return unity_ranked_index.search_catalog(unity_index, "Unity", query, top_k)